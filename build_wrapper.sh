@@ -2,7 +2,19 @@
 
 # Configurações
 SEARCH_DIR="files_synthesis"
-OUTPUT_FILE="wrapper.v"
+OUTPUT_FILE="${OUTPUT_FILE:-wrapper.v}"
+
+# Cópias do netlist na mesma simulação. Com INSTANCES > 1 cada cópia fica em um módulo
+# "slot" (wrapper.slot0 ... slotN-1) com suas portas, seu gerador de clock e seu SDF.
+export INSTANCES="${INSTANCES:-1}"
+
+# Instâncias extras (separadas por espaço, relativas ao dut) que podem ser gravadas
+# com +dump_scope=list, ex.: DUMP_SCOPES="_205_ _198_".
+export DUMP_SCOPES="${DUMP_SCOPES:-}"
+
+# Porta de clock que recebe o gerador nativo do wrapper.
+# Vazio = detecção automática (primeira entrada clk*/clock*), "none" = desabilita.
+export CLOCK_PORT="${CLOCK_PORT:-}"
 
 # Verifica se a pasta existe
 if [ ! -d "$SEARCH_DIR" ]; then
@@ -30,6 +42,24 @@ else
     echo "Arquivo Verilog detectado: $INPUT_FILE"
 fi
 
+# Poda das células sky130: o wrapper inclui apenas as células usadas pelo netlist
+# (gravadas em cells_used.v). PRUNE_CELLS=0 mantém os includes completos do pdk-lib.
+export PRUNE_CELLS="${PRUNE_CELLS:-1}"
+CELLS_FILE="cells_used.v"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+export WRAPPER_INCLUDES=""
+PRUNE_MSG=""
+if [ "$PRUNE_CELLS" != "0" ]; then
+    if PRUNE_MSG=$(python3 "$SCRIPT_DIR/prune_cells.py" --netlist "$INPUT_FILE" --incdir pdk-lib --out "$CELLS_FILE"); then
+        export WRAPPER_INCLUDES="$CELLS_FILE"
+    else
+        echo "$PRUNE_MSG"
+        echo "Aviso: poda das células falhou, usando os includes completos do pdk-lib."
+        PRUNE_MSG=""
+    fi
+fi
+
 echo "Gerando $OUTPUT_FILE..."
 
 # Inicia o Python passando o caminho do arquivo encontrado
@@ -44,6 +74,16 @@ import os
 input_file_path = sys.argv[1]
 output_file_name = sys.argv[2]
 
+# Bibliotecas do pdk-lib incluídas quando a poda de células está desabilitada
+LIB_INCLUDES = [
+    "primitives_hd.v",
+    "primitives_hvl.v",
+    "sky130_fd_io.v",
+    "sky130_fd_sc_hd.v",
+    "sky130_fd_sc_hvl.v",
+    "sky130_ef_sc_hd__decap_12.v",
+]
+
 def parse_verilog(filename):
     try:
         with open(filename, 'r') as f:
@@ -88,8 +128,118 @@ def parse_verilog(filename):
 
     return module_name, ports
 
+def find_clock_port(ports):
+    # Permite forçar a porta (ou desabilitar o gerador) pela variável CLOCK_PORT
+    forced = os.environ.get('CLOCK_PORT', '').strip()
+    if forced.lower() == 'none':
+        return None
+    for p in ports:
+        if p['type'] != 'input' or p['width']:
+            continue
+        if forced and p['name'] == forced:
+            return p['name']
+        if not forced and re.match(r'(clk|clock)', p['name'], re.IGNORECASE):
+            return p['name']
+    if forced:
+        print(f"Aviso: porta de clock '{forced}' não encontrada, gerador nativo desabilitado.")
+    return None
+
+def clock_generator(clk):
+    # O meio período (em ps) é escrito pelo cocotb em tempo de execução,
+    # o valor 0 mantém o clock parado. Assim o clock roda dentro do simulador
+    # e o Python só é acordado quando o período muda.
+    return f"""
+    //Gerador de clock nativo ({clk}_half_ps = meio período em ps, 0 = parado):
+    integer {clk}_half_ps = 0;
+    reg {clk}_q = 1'b1;
+
+    always begin : {clk.capitalize()}_gen
+        if ({clk}_half_ps > 0) begin
+            #({clk}_half_ps / 1000.0);
+            if ({clk}_half_ps > 0) begin
+                {clk}_q = ~{clk}_q;
+                {clk} = {clk}_q;
+            end
+        end
+        else
+            @({clk}_half_ps);
+    end
+"""
+
+def dump_block(slots=None):
+    # Escopo, profundidade e janela do dump escolhidos por plusargs em tempo de
+    # execução; o cocotb liga/desliga a gravação escrevendo em dump_on.
+    # Com slots, "ports" e "dut" gravam o mesmo escopo em todas as cópias.
+    tops = [f"wrapper.{slot}" for slot in slots] if slots else ["wrapper"]
+    if slots:
+        ports_calls = "\n".join(f"                $dumpvars(1, {top});" for top in tops)
+        dut_calls = "\n".join(f"                $dumpvars(dump_depth, {top}.dut);" for top in tops)
+        select = f"""            if (dump_scope == "ports") begin
+{ports_calls}
+            end
+            else if (dump_scope == "dut") begin
+{dut_calls}
+            end
+"""
+    else:
+        select = """            if (dump_scope == "ports")
+                $dumpvars(1, wrapper);
+            else if (dump_scope == "dut")
+                $dumpvars(dump_depth, wrapper.dut);
+"""
+    scopes = os.environ.get('DUMP_SCOPES', '').split()
+    list_branch = ""
+    if scopes:
+        calls = "\n".join(f"                $dumpvars(dump_depth, {top}.dut.{inst});" for top in tops for inst in scopes)
+        list_branch = f"""            else if (dump_scope == "list") begin
+{calls}
+            end
+"""
+    return f"""
+    //Controle do dump (plusargs): +no_dump, +dump_scope=ports|dut|all{'|list' if scopes else ''},
+    //+dump_depth=N (0 = hierarquia inteira), +dump_start_ns=T e +dump_stop_ns=T.
+    //O cocotb liga/desliga a gravação escrevendo em dump_on (ver components/wave.py).
+    reg dump_on = 1'b1;
+    reg dump_enabled = 1'b0;
+    integer dump_depth = 0;
+    integer dump_start_ns = 0;
+    integer dump_stop_ns = 0;
+    reg [8*8-1:0] dump_scope = "all";
+
+    initial begin : Dump
+        if (!$test$plusargs("no_dump")) begin
+            if (!$value$plusargs("dump_scope=%s", dump_scope)) dump_scope = "all";
+            //No escopo "dut" o padrão é só o nível do netlist, sem o interior das células
+            if (!$value$plusargs("dump_depth=%d", dump_depth)) dump_depth = (dump_scope == "dut") ? 1 : 0;
+            if (!$value$plusargs("dump_start_ns=%d", dump_start_ns)) dump_start_ns = 0;
+            if (!$value$plusargs("dump_stop_ns=%d", dump_stop_ns)) dump_stop_ns = 0;
+            $dumpfile("dump.fst");
+{select}{list_branch}            else
+                $dumpvars(dump_depth, wrapper);
+            dump_enabled = 1'b1;
+            if (dump_start_ns > 0) begin
+                $dumpoff;
+                #(dump_start_ns) if (dump_on) $dumpon;
+            end
+            if (dump_stop_ns > dump_start_ns) begin
+                #(dump_stop_ns - dump_start_ns) $dumpoff;
+                dump_enabled = 1'b0;
+            end
+        end
+    end
+
+    always @(dump_on) begin : Dump_ctrl
+        if (dump_enabled) begin
+            if (dump_on) $dumpon;
+            else $dumpoff;
+        end
+    end
+"""
+
 def generate_wrapper(mod_name, ports, out_file):
     current_date = datetime.date.today().strftime('%Y-%m-%d')
+    includes = os.environ.get('WRAPPER_INCLUDES', '').split() or LIB_INCLUDES
+    include_lines = "\n".join(f'`include "{inc}"' for inc in includes)
     
     # Cabeçalho atualizado
     header = f"""// +FHDR------------------------------------------------------------------------
@@ -111,23 +261,19 @@ def generate_wrapper(mod_name, ports, out_file):
 // -FHDR------------------------------------------------------------------------
 
 `timescale 1ns / 1ps
-`include "primitives_hd.v"
-`include "primitives_hvl.v"
-`include "sky130_fd_io.v"
-`include "sky130_fd_sc_hd.v"
-`include "sky130_fd_sc_hvl.v"
-`include "sky130_ef_sc_hd__decap_12.v"
-
-module wrapper;
+{include_lines}
+
 """
     
     body = ""
     valid_ports = [p for p in ports if p['name'] not in ['VPWR', 'VGND']]
+    clk = find_clock_port(valid_ports)
     
-    # Declaração dos wires
+    # Declaração dos wires (a porta de clock vira reg, dirigida pelo gerador)
     for p in valid_ports:
         width_str = p['width'] + " " if p['width'] else ""
-        body += f"    wire {width_str}{p['name']};\n"
+        net = "reg " if p['name'] == clk else "wire"
+        body += f"    {net} {width_str}{p['name']};\n"
 
     body += "\n    //Conexão dos pinos de alimentação:\n"
     body += "    wire VPWR = 1;\n"
@@ -147,21 +293,28 @@ module wrapper;
     
     body += "    );\n"
 
-    footer = f"""
+    if clk:
+        body += clock_generator(clk)
+
+    sdf = f"""
     initial begin : Sdf_annotate
         $sdf_annotate("files_synthesis/{mod_name}.sdf", dut);
     end
-
-    initial begin : Dump
-        $dumpfile("dump.fst");
-        $dumpvars(0, wrapper);
-    end
-
-endmodule
 """
 
+    instances = int(os.environ.get('INSTANCES', '1'))
+    if instances <= 1:
+        text = f"{header}module wrapper;\n{body}{sdf}\n{dump_block()}\nendmodule\n"
+    else:
+        # Cada slot é uma cópia completa (portas, clock, dut e anotação SDF relativa ao slot)
+        slots = [f"slot{i}" for i in range(instances)]
+        insts = "".join(f"    ack_slot {slot} ();\n" for slot in slots)
+        text = (f"{header}module ack_slot;\n{body}{sdf}endmodule\n\n"
+                f"module wrapper;\n    //{instances} cópias do {mod_name}, cada uma com portas e clock próprios:\n"
+                f"{insts}\n{dump_block(slots)}\nendmodule\n")
+
     with open(out_file, 'w') as f:
-        f.write(header + body + footer)
+        f.write(text)
 
 if __name__ == "__main__":
     mod_name, ports = parse_verilog(input_file_path)
@@ -192,6 +345,7 @@ if [ $? -eq 0 ]; then
 ART_EOF
     # Confirmação do local
     echo "Localização: $(pwd)/$OUTPUT_FILE"
+    [ -n "$PRUNE_MSG" ] && echo "Células: $PRUNE_MSG"
 else
     # Falha (Python retornou erro)
     clear
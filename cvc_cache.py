@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Cache de compilação do cvc64 para o Makefile gerado pelo gen_cocotb_env.sh.
+
+A chave é um hash dos fontes Verilog, dos arquivos de `include resolvidos (células
+do pdk-lib), dos COMPILE_ARGS/defines e da versão do cvc64. Com a mesma chave, o
+sim_build/sim.vvp guardado é restaurado com data atual, e o make não chama o cvc64
+de novo; runs que só mudam o código Python dos testes começam direto na simulação.
+
+Uso (o Makefile já faz isso no alvo run_and_log):
+    python3 cvc_cache.py --args "$(COMPILE_ARGS)" restore $(VERILOG_SOURCES)
+    python3 cvc_cache.py --args "$(COMPILE_ARGS)" store $(VERILOG_SOURCES)
+    python3 cvc_cache.py report
+
+Observação: só o modo compilado do cvc64 (CVC_ITERP=0) gera um sim.vvp reaproveitável.
+No modo interpretado (+interp, padrão do cocotb) o cvc64 traduz os fontes a cada
+execução, então o cache apenas informa o tempo de tradução que está sendo gasto.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+
+CACHE_DIR = os.environ.get("CVC_CACHE_DIR", ".cvc_cache")
+CVC_BIN = os.environ.get("CVC_BIN", "cvc64")
+
+_INCLUDE = re.compile(rb'^\s*`include\s+"([^"]+)"', re.M)
+_TIMES = re.compile(r"Times \(in sec\.\):\s*Translate\s+([\d.]+),\s*load/optimize\s+([\d.]+)")
+
+#----------------------------------------------------------------------------
+#Hash dos arquivos (com índice por tamanho/mtime para não reler o pdk-lib a cada run):
+#----------------------------------------------------------------------------
+class FileHasher:
+    def __init__(self, cache_dir):
+        self.index_path = os.path.join(cache_dir, "files.json")
+        try:
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+        self.dirty = False
+
+    def digest(self, path):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        entry = self.index.get(path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        self.index[path] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        self.dirty = True
+        return h.hexdigest()
+
+    def save(self):
+        if self.dirty:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            with open(self.index_path, "w") as f:
+                json.dump(self.index, f)
+
+#----------------------------------------------------------------------------
+#Argumentos de compilação:
+#----------------------------------------------------------------------------
+def parse_args(compile_args):
+    """Separa dos COMPILE_ARGS o que entra na chave: incdirs, defines, -v/-f e as demais opções."""
+    tokens = shlex.split(compile_args)
+    incdirs, defines, files, opts = [], [], [], []
+    it = iter(tokens)
+    for tok in it:
+        if tok == "-l":
+            next(it, None)                  #Nome do log não muda o resultado
+        elif tok in ("-v", "-f"):
+            files.append(next(it, ""))
+        elif tok.startswith("+incdir+"):
+            incdirs += [d for d in tok[len("+incdir+"):].split("+") if d]
+        elif tok.startswith("+define+"):
+            defines += [d for d in tok[len("+define+"):].split("+") if d]
+        else:
+            opts.append(tok)
+    return incdirs, sorted(defines), files, opts
+
+def resolve_includes(sources, incdirs):
+    """Fontes + todos os `include alcançáveis (procurados no diretório do arquivo, nos +incdir+ e no cwd)."""
+    seen, order = set(), []
+    stack = list(reversed(sources))
+    while stack:
+        path = stack.pop()
+        real = os.path.abspath(path)
+        if real in seen:
+            continue
+        seen.add(real)
+        order.append(real)
+        with open(real, "rb") as f:
+            text = f.read()
+        for name in _INCLUDE.findall(text):
+            name = name.decode()
+            for base in [os.path.dirname(real)] + incdirs + ["."]:
+                cand = os.path.join(base, name)
+                if os.path.isfile(cand):
+                    stack.append(cand)
+                    break
+            else:
+                print(f"[cvc_cache] aviso: include '{name}' não encontrado (ignorado na chave)")
+    return order
+
+def cvc_version():
+    """Primeira linha do banner do cvc64 (ex.: OSS_CVC_7.00b-x86_64-rhel6x of 07/07/14)."""
+    exe = shutil.which(CVC_BIN)
+    if exe is None:
+        return "cvc64-not-found"
+    try:
+        out = subprocess.run([exe], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=10).stdout
+        banner = out.decode(errors="replace").splitlines()[0]
+    except (OSError, subprocess.SubprocessError, IndexError):
+        st = os.stat(exe)
+        banner = f"{exe}:{st.st_size}:{st.st_mtime_ns}"
+    return banner
+
+def compute_key(sources, compile_args, extra, hasher):
+    incdirs, defines, files, opts = parse_args(compile_args)
+    h = hashlib.sha256()
+    paths = resolve_includes(list(sources) + files, incdirs)
+    for path in paths:
+        h.update(path.encode() + b"\0" + hasher.digest(path).encode() + b"\0")
+    h.update(("defines:" + " ".join(defines)).encode() + b"\0")
+    h.update(("args:" + " ".join(opts)).encode() + b"\0")
+    h.update(("cvc:" + cvc_version()).encode() + b"\0")
+    for e in extra:
+        h.update(("extra:" + e).encode() + b"\0")
+    return h.hexdigest(), len(paths)
+
+def compile_times(log):
+    """(translate, load/optimize) em segundos, da linha "Times (in sec.)" do log do cvc64."""
+    try:
+        with open(log, errors="replace") as f:
+            m = _TIMES.search(f.read())
+    except OSError:
+        return None
+    return (float(m.group(1)), float(m.group(2))) if m else None
+
+#----------------------------------------------------------------------------
+#Comandos:
+#----------------------------------------------------------------------------
+def _load_meta(entry):
+    try:
+        with open(os.path.join(entry, "meta.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_meta(entry, meta):
+    with open(os.path.join(entry, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+
+def cmd_interp(opt):
+    """Modo interpretado: nada a guardar, só o tempo de tradução gasto neste run (lido no store, antes do make mover o log)."""
+    times = compile_times(opt.log)
+    spent = f" (este run: translate {times[0]} s, load/optimize {times[1]} s)" if times else ""
+    print(f"[cvc_cache] modo interpretado (CVC_ITERP=1): o cvc64 traduz os fontes a cada run{spent}; "
+          f"use CVC_ITERP=0 para reaproveitar a compilação")
+    return 0
+
+def cmd_restore(opt, key, nfiles):
+    target = os.path.join(opt.sim_build, "sim.vvp")
+    entry = os.path.join(CACHE_DIR, key)
+    meta = _load_meta(entry)
+    if meta is None or not os.path.isfile(os.path.join(entry, "sim.vvp")):
+        # Um sim.vvp antigo com outra chave seria reaproveitado pelo make (ex.: só COMPILE_ARGS mudou)
+        if os.path.exists(target):
+            os.remove(target)
+        print(f"[cvc_cache] MISS {key[:12]} ({nfiles} arquivos na chave): o cvc64 vai compilar")
+        return 0
+    os.makedirs(opt.sim_build, exist_ok=True)
+    shutil.copy2(os.path.join(entry, "sim.vvp"), target)
+    now = time.time()
+    os.utime(target, (now, now))            #Mais novo que os fontes: o make pula a compilação
+    meta["hits"] = meta.get("hits", 0) + 1
+    _save_meta(entry, meta)
+    saved = meta.get("translate", 0.0) + meta.get("load", 0.0)
+    print(f"[cvc_cache] HIT {key[:12]}: sim.vvp reaproveitado, economia de ~{saved:.1f} s "
+          f"(translate {meta.get('translate', 0.0)} s, load/optimize {meta.get('load', 0.0)} s)")
+    return 0
+
+def cmd_store(opt, key, nfiles):
+    src = os.path.join(opt.sim_build, "sim.vvp")
+    entry = os.path.join(CACHE_DIR, key)
+    if _load_meta(entry) is not None:
+        return 0                            #Já está no cache (foi um HIT)
+    if not os.path.isfile(src):
+        print("[cvc_cache] nada a guardar: sim.vvp não foi gerado (compilação falhou?)")
+        return 0
+    os.makedirs(entry, exist_ok=True)
+    shutil.copy2(src, os.path.join(entry, "sim.vvp"))
+    times = compile_times(opt.log) or (0.0, 0.0)
+    _save_meta(entry, {
+        "key": key,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "files": nfiles,
+        "translate": times[0],
+        "load": times[1],
+        "hits": 0,
+    })
+    print(f"[cvc_cache] guardado {key[:12]} (translate {times[0]} s, load/optimize {times[1]} s)")
+    return 0
+
+def cmd_report(opt):
+    if not os.path.isdir(CACHE_DIR):
+        print(f"[cvc_cache] cache vazio ({CACHE_DIR})")
+        return 0
+    total_hits, total_saved, total_size = 0, 0.0, 0
+    print(f"{'chave':<14}{'criado':<21}{'hits':>6}{'compile (s)':>13}{'tamanho':>12}")
+    for name in sorted(os.listdir(CACHE_DIR)):
+        entry = os.path.join(CACHE_DIR, name)
+        meta = _load_meta(entry) if os.path.isdir(entry) else None
+        if meta is None:
+            continue
+        cost = meta.get("translate", 0.0) + meta.get("load", 0.0)
+        size = os.path.getsize(os.path.join(entry, "sim.vvp"))
+        total_hits += meta.get("hits", 0)
+        total_saved += cost * meta.get("hits", 0)
+        total_size += size
+        print(f"{name[:12]:<14}{meta.get('created', '?'):<21}{meta.get('hits', 0):>6}{cost:>13.1f}{size / 1e6:>10.1f}MB")
+    print(f"Total: {total_hits} hits, ~{total_saved:.1f} s de compilação economizados, {total_size / 1e6:.1f} MB em disco")
+    return 0
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Cache de compilação do cvc64 (sim_build/sim.vvp).")
+    ap.add_argument("--args", default="", help="COMPILE_ARGS do Makefile")
+    ap.add_argument("--extra", action="append", default=[], help="Texto adicional para a chave (ex.: versão do cocotb)")
+    ap.add_argument("--sim-build", default="sim_build")
+    ap.add_argument("--log", default="cvc_compile.log", help="Log do cvc64 (-l) ainda no lugar, lido pelo store")
+    ap.add_argument("--interp", type=int, default=1, help="Valor de CVC_ITERP")
+    ap.add_argument("command", choices=["restore", "store", "report"])
+    ap.add_argument("sources", nargs="*")
+    opt = ap.parse_args(argv)
+
+    if opt.command == "report":
+        return cmd_report(opt)
+    if opt.interp:
+        return cmd_interp(opt) if opt.command == "store" else 0
+
+    hasher = FileHasher(CACHE_DIR)
+    key, nfiles = compute_key(opt.sources, opt.args, opt.extra, hasher)
+    hasher.save()
+    if opt.command == "restore":
+        return cmd_restore(opt, key, nfiles)
+    return cmd_store(opt, key, nfiles)
+
+if __name__ == "__main__":
+    sys.exit(main())
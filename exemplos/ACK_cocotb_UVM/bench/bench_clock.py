@@ -0,0 +1,92 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: bench_clock.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Bench clock: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+import os
+import time
+import cocotb
+from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
+
+from components.clock import SimClock
+
+'''
+Benchmark do gerador de clock: mede o tempo de parede gasto por milissegundo simulado
+com o loop antigo em Python (uma escrita VPI por borda) e com o gerador nativo do wrapper.
+
+Uso (na pasta do projeto):
+    make MODULE=bench.bench_clock
+    BENCH_SIM_MS=20 BENCH_PERIOD=1562 make MODULE=bench.bench_clock
+'''
+
+SIM_MS = float(os.environ.get("BENCH_SIM_MS", "5"))
+PERIOD = float(os.environ.get("BENCH_PERIOD", "1562"))  #640KHz, o corner com mais bordas
+
+async def legacy_clock(dut, period):
+    """Cópia do antigo Bfm.clock_ack, usado como referência."""
+    clk = 1
+    while True:
+        await Timer(period / 2, units="ns")
+        clk = not clk
+        dut.clk_i.value = clk
+
+async def measure(dut, name):
+    t0_sim = get_sim_time(units="ms")
+    t0_wall = time.perf_counter()
+    await Timer(SIM_MS, units="ms")
+    wall = time.perf_counter() - t0_wall
+    sim = get_sim_time(units="ms") - t0_sim
+    dut._log.info(f"[bench_clock] {name:<8} | periodo: {PERIOD:g} ns | simulado: {sim:.3f} ms | "
+                  f"parede: {wall:.3f} s | {wall / sim * 1000:.2f} ms de parede por ms simulado")
+    return wall / sim
+
+@cocotb.test()
+async def bench_python_clock(dut):
+    """Clock antigo: Timer + escrita VPI a cada meio período."""
+    task = cocotb.start_soon(legacy_clock(dut, PERIOD))
+    await measure(dut, "python")
+    task.kill()
+
+@cocotb.test()
+async def bench_native_clock(dut):
+    """Clock gerado pelo bloco Clk_i_gen do wrapper (sem acordar o Python)."""
+    clock = SimClock(dut, "clk_i")
+    if not clock.native:
+        dut._log.warning("Wrapper sem gerador nativo, regere com o build_wrapper.sh")
+    clock.start(PERIOD)
+    await measure(dut, "nativo")
+    clock.stop()
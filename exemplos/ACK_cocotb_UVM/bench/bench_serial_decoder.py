@@ -0,0 +1,106 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: bench_serial_decoder.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Bench serial decoder: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+import os
+import random
+import time
+import cocotb
+
+from components.serial_decoder import assemble_bits
+
+'''
+Microbenchmark do decodificador serial: bits decodificados por segundo de parede.
+Compara o deslocamento bit a bit do antigo Bfm.monitor_outputs com a montagem por
+transições usada pelo SerialDecoder, sobre quadros sintéticos no corner de 640KHz.
+O custo em Python puro é parecido; a diferença real está nas acordadas do simulador
+(uma por bit no monitor antigo, uma por transição da linha no decodificador), que
+também são reportadas por quadro.
+
+Uso (na pasta do projeto):
+    make MODULE=bench.bench_serial_decoder
+ou, sem simulador:
+    python3 -m bench.bench_serial_decoder
+'''
+
+FRAMES = int(os.environ.get("BENCH_FRAMES", "2000"))
+PERIOD_PS = 1562000
+
+def synth_frame(rng, nbits):
+    """Gera um quadro aleatório e suas transições (atraso clock->q de 300 ps)."""
+    bits = [rng.getrandbits(1) for _ in range(nbits)]
+    times, levels = [], bytearray()
+    for k in range(1, nbits):
+        if bits[k] != bits[k - 1]:
+            times.append((k - 1) * PERIOD_PS + 300)
+            levels.append(bits[k])
+    return bits, times, levels
+
+def legacy(bits):
+    data = 0
+    for bit in bits:
+        data = ((data << 1) | bit) & ((1 << 127) - 1)
+    return data
+
+def run(log=print):
+    rng = random.Random(1)
+    for nbits in (48, 128, 1024):
+        frames = [synth_frame(rng, nbits) for _ in range(FRAMES)]
+        buf = bytearray(nbits)
+
+        t0 = time.perf_counter()
+        for bits, _, _ in frames:
+            legacy(bits)
+        t_legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for bits, times, levels in frames:
+            assemble_bits(buf, bits[0], times, levels, 0, PERIOD_PS, nbits)
+        t_events = time.perf_counter() - t0
+
+        total = nbits * FRAMES
+        wakeups = sum(len(times) for _, times, _ in frames) / FRAMES + 3
+        log(f"[bench_serial_decoder] {nbits:>5} bits/quadro | bit a bit: {total / t_legacy:>12,.0f} bits/s, "
+            f"{nbits} acordadas | por transições: {total / t_events:>12,.0f} bits/s, {wakeups:.0f} acordadas")
+
+@cocotb.test()
+async def bench_serial_decoder(dut):
+    """Mede a vazão do decodificador sem depender da atividade do DUT."""
+    run(dut._log.info)
+
+if __name__ == "__main__":
+    run()
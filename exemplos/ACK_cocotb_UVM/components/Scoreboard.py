@@ -36,64 +36,219 @@
 #----------------------------------------------------------------------------------------------------------------------------
 
 #Instâncias de bibliotecas:
+import json
 import cocotb
-from .utils import NVM
+from cocotb.triggers import Event
+from cocotb.utils import get_sim_time
+from .bounded_fifo import BoundedFifo
+from .txn_trace import TraceWriter, KIND_CMD, KIND_RESULT
 from pyuvm import *
 
+class TraceTap(uvm_analysis_export):
+    """Analysis export that hands every write to a function (trace mode of the Scoreboard)."""
+    def __init__(self, name, parent, write_fn):
+        super().__init__(name, parent)
+        self.write_fn = write_fn
+
+    def write(self, tt):
+        self.write_fn(tt)
+
 class Scoreboard(uvm_component):
     """
     Este é o responsável por efetuar a varredura de nossos casos de testes
     e os resultados obtidos e assim confirmar se nosso DUT condiz com o 
     que se tinha como planejamento.
+
+    O valor esperado vem do Predictor (calculado quando o driver envia o item) com o
+    ID da transação, e o monitor marca cada resposta com o mesmo ID: a comparação é
+    feita por ID, sem depender da ordem de chegada nem do estado atual da NVM.
+
+    Modo limitado (ConfigDB SCOREBOARD_BOUNDED), para soak tests: as filas passam a ser
+    BoundedFifo com SCOREBOARD_DEPTH itens e política SCOREBOARD_POLICY (block, com
+    contrapressão sobre o driver, ou drop_oldest/drop_newest). Com block as predições não
+    são descartadas: a cmd_fifo só é lida enquanto houver menos de SCOREBOARD_DEPTH
+    esperando resposta, então ela enche e segura o driver. Os PASS são agregados a
+    cada SCOREBOARD_PASS_WINDOW transações e só as SCOREBOARD_MAX_FAILURES primeiras
+    falhas são guardadas, então memória e log não crescem com a duração do run.
+
+    Modo trace (ConfigDB SCOREBOARD_TRACE com o nome do arquivo): nada é verificado na
+    simulação. Comandos do driver e respostas do monitor são gravados em um trace binário
+    (txn_trace.py, em blocos de SCOREBOARD_TRACE_BATCH registros) e verificados pelo
+    modelo de referência em outro processo: python3 components/txn_trace.py check <trace>.
+    Nesse modo o driver é ligado direto ao cmd_export, sem o Predictor: o txn_trace.py
+    faz a predição com o mesmo modelo (expected_response sobre as nvm_words do item).
     """
     def build_phase(self):
-        self.cmd_fifo = uvm_tlm_analysis_fifo("cmd_fifo", self)
-        self.result_fifo = uvm_tlm_analysis_fifo("result_fifo", self)
-        self.cmd_get_port = uvm_get_port("cmd_get_port", self)
-        self.result_get_port = uvm_get_port("result_get_port", self)
-        self.cmd_export = self.cmd_fifo.analysis_export
-        self.result_export = self.result_fifo.analysis_export
+        self.bounded = self.config("SCOREBOARD_BOUNDED", False)
+        self.trace = None
+        trace_path = self.config("SCOREBOARD_TRACE", None)
+        if trace_path:
+            self.trace = TraceWriter(trace_path, self.config("SCOREBOARD_TRACE_BATCH", 4096),
+                                     {"seed": cocotb.RANDOM_SEED})
+            self.cmd_export = TraceTap("cmd_export", self, self.trace.cmd)
+            self.result_export = TraceTap("result_export", self, self.record_result)
+        elif self.bounded:
+            depth = self.config("SCOREBOARD_DEPTH", 64)
+            policy = self.config("SCOREBOARD_POLICY", "block")
+            self.cmd_fifo = BoundedFifo("cmd_fifo", self, depth, policy)
+            # O monitor acompanha o DUT em tempo real e não pode esperar: resultados só podem ser descartados
+            self.result_fifo = BoundedFifo("result_fifo", self, depth, "drop_oldest" if policy == "block" else policy)
+        else:
+            self.cmd_fifo = uvm_tlm_analysis_fifo("cmd_fifo", self)
+            self.result_fifo = uvm_tlm_analysis_fifo("result_fifo", self)
+            self.cmd_get_port = uvm_get_port("cmd_get_port", self)
+            self.result_get_port = uvm_get_port("result_get_port", self)
+        if not self.trace:
+            self.cmd_export = self.cmd_fifo.analysis_export
+            self.result_export = self.result_fifo.analysis_export
+        #Filas que seguram o driver desta cópia do DUT (o Env as entrega a ele como BACKPRESSURE)
+        self.backpressure = [self.cmd_fifo] if self.bounded and not self.trace and self.cmd_fifo.policy == "block" else []
+        self.pass_window = self.config("SCOREBOARD_PASS_WINDOW", 1000 if self.bounded else 1)
+        self.max_failures = self.config("SCOREBOARD_MAX_FAILURES", 100 if self.bounded else None)
+        self.max_pending = self.config("SCOREBOARD_DEPTH", 64) if self.bounded else None
+        #Política block: as predições nunca são descartadas; o scoreboard para de ler a cmd_fifo
+        #enquanto houver max_pending esperando resposta, a fila enche e o driver é segurado
+        self.block = bool(self.backpressure)
+        self.pending_space = Event()
         self.fail_count = 0
+        self.checked = 0
+        self.unmatched = 0
+        self.failures = []
+        self.window_passes = 0
+        self.window_start_ns = 0
+        self.expected = {}          #ID -> (transação, valor esperado) aguardando a resposta
+        self.actual = {}            #ID -> resposta do monitor aguardando a predição
+
+    def config(self, key, default):
+        try:
+            return ConfigDB().get(self, "", key)
+        except UVMConfigItemNotFound:
+            return default
+
+    def record_result(self, result):
+        txn_id, actual_data_ack = result
+        self.trace.result(txn_id, actual_data_ack)
 
     def connect_phase(self):
-        self.cmd_get_port.connect(self.cmd_fifo.get_export)
-        self.result_get_port.connect(self.result_fifo.get_export)
+        if self.trace:
+            return
+        if not self.bounded:
+            self.cmd_get_port.connect(self.cmd_fifo.get_export)
+            self.result_get_port.connect(self.result_fifo.get_export)
 
     async def run_phase(self):
+        if self.trace:
+            return
+        cocotb.start_soon(self.collect_results())
         while True:
-            item = await self.cmd_get_port.get()
-            actual_data_ack = await self.result_get_port.get()
-
-            # Converte cada valor em hexadecimal (sem o prefixo '0x', sempre com 4 dígitos)
-            hex_130 = format(NVM[130], '04X')
-            hex_131 = format(NVM[131], '04X')
-            hex_132 = format(NVM[132], '04X')
-
-            # Concatena os hexadecimais
-            concat_hex = hex_130 + hex_131 + hex_132
-            valor_inteiro = int(concat_hex, 16)
-
-            if (item.g_ack == 0 or item.f_saia == 0):
-                valor_inteiro = 0
-
+            if self.bounded:
+                await self.wait_pending_space()
+                _, (txn_id, item, expected) = await self.cmd_fifo.get()
+            else:
+                txn_id, item, expected = await self.cmd_get_port.get()
+            self.expected[txn_id] = (item, expected)
+            self.match(txn_id, self.expected)
 
-            if (actual_data_ack == valor_inteiro):
-                self.logger.info(f"✅ PASSED: {item}")
+    async def collect_results(self):
+        while True:
+            if self.bounded:
+                _, (txn_id, actual_data_ack) = await self.result_fifo.get()
             else:
-                self.logger.error(f"❌ FAILED: {item}")
-                self.logger.error(
-                    f"    └─ Expected: {valor_inteiro}\n"
-                    f"                                      Got:      {actual_data_ack}"
-                )
-                self.fail_count += 1
+                txn_id, actual_data_ack = await self.result_get_port.get()
+            self.actual[txn_id] = actual_data_ack
+            self.match(txn_id, self.actual)
+
+    async def wait_pending_space(self):
+        """Block policy: waits while max_pending predictions are still waiting for their response."""
+        while self.block and len(self.expected) >= self.max_pending:
+            self.pending_space.clear()
+            await self.pending_space.wait()
+
+    def match(self, txn_id, pending):
+        """Checks the transaction once both sides arrived; in bounded mode the oldest unmatched entries are dropped
+        (never the predictions under the block policy, which holds the driver instead)."""
+        if txn_id in self.expected and txn_id in self.actual:
+            item, expected = self.expected.pop(txn_id)
+            self.check(item, expected, self.actual.pop(txn_id))
+            if self.block:
+                self.pending_space.set()
+        elif self.max_pending is not None and len(pending) > self.max_pending and not (self.block and pending is self.expected):
+            del pending[next(iter(pending))]
+            self.unmatched += 1
+
+    def check(self, item, valor_inteiro, actual_data_ack):
+        self.checked += 1
+        if (actual_data_ack == valor_inteiro):
+            self.log_pass(item)
+        else:
+            self.logger.error(f"❌ FAILED: {item}")
+            self.logger.error(
+                f"    └─ Expected: {valor_inteiro}\n"
+                f"                                      Got:      {actual_data_ack}"
+            )
+            self.fail_count += 1
+            if self.max_failures is None or len(self.failures) < self.max_failures:
+                self.failures.append({
+                    "scoreboard": self.get_name(),
+                    "txn_id": item.txn_id,
+                    "start_ns": item.start_ns,
+                    "item": str(item),
+                    "expected": valor_inteiro,
+                    "got": actual_data_ack,
+                })
+
+    def log_pass(self, item):
+        """Logs a PASS line per item, or one line per SCOREBOARD_PASS_WINDOW passes."""
+        if self.pass_window <= 1:
+            self.logger.info(f"✅ PASSED: {item}")
+            return
+        self.window_passes += 1
+        if self.window_passes >= self.pass_window:
+            self.flush_passes()
+
+    def flush_passes(self):
+        if self.window_passes:
+            now = get_sim_time(units="ns")
+            self.logger.info(f"✅ PASSED: {self.window_passes} transactions from {self.window_start_ns:.0f} "
+                             f"to {now:.0f} ns ({self.checked} checked)")
+            self.window_passes = 0
+            self.window_start_ns = now
                 
                 
+    _failure_files = set()          #Arquivos já gravados nesta simulação (um scoreboard por cópia do DUT)
+
+    def write_failures(self, path="failure.json"):
+        """Records the failing transactions (seed and start time) so the run can be replayed with waves."""
+        failures = list(self.failures)
+        if path in Scoreboard._failure_files:
+            with open(path) as f:
+                failures = json.load(f)["failures"] + failures
+        Scoreboard._failure_files.add(path)
+        with open(path, "w") as f:
+            json.dump({"seed": cocotb.RANDOM_SEED, "failures": failures}, f, indent=2)
+
     def report_phase(self):
         """Prints a final summary of the test results."""
+        if self.trace:
+            self.trace.close()
+            cocotb.log.info(f"{self.trace.written[KIND_CMD]} transactions and {self.trace.written[KIND_RESULT]} responses recorded "
+                            f"to {self.trace.path} (check: python3 components/txn_trace.py check {self.trace.path})")
+            return
+        self.flush_passes()
         cocotb.log.info(f"\n+--------------------+")
         cocotb.log.info(f"| Final Fail Count: {self.fail_count:d} |")
+        cocotb.log.info(f"| Transactions checked: {self.checked:d} |")
         cocotb.log.info(f"+--------------------+")
+        if self.bounded:
+            for fifo in (self.cmd_fifo, self.result_fifo):
+                s = fifo.stats()
+                cocotb.log.info(f"{fifo.get_name()}: depth {s['depth']} ({s['policy']}), high water {s['high_water']}, "
+                                f"{s['written']} written, {s['dropped']} dropped, blocked {s['blocked_ns']:.0f} ns")
+        if self.unmatched or self.expected or self.actual:
+            cocotb.log.warning(f"Transactions not checked: {self.unmatched} dropped, {len(self.expected)} without "
+                               f"response, {len(self.actual)} responses without prediction")
         if self.fail_count > 0:
+            self.write_failures()
             assert False, f"{self.fail_count} failures detected in scoreboard"
 
 
@@ -0,0 +1,119 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: ack_model.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Ack_model: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+
+'''
+Modelo comportamental (nível de transação/ciclo) do ack_pav2, em Python puro, para rodar o
+mesmo ambiente UVM sem o netlist, o SDF e as bibliotecas de células (ACK_BACKEND=tlm).
+
+O AckCore reproduz, ciclo a ciclo, o que o netlist faz em cada borda de subida (levantado
+do dump.fst da simulação gate-level):
+    - g_ack_i e f_saia_i amostrados em 1: r_ack_o sobe na borda seguinte;
+    - com r_ack_o em 1, a primeira borda com dt_proc_ctrl_i em 0 inicia a leitura (S);
+    - em S, S+16 e S+32 o strobe nvm_ack_rd_stb_o fica 1 ciclo em 1 com o endereço 130,
+      131 e 132; em S+48 o endereço volta a 0;
+    - dt_ack_o sai MSB primeiro, um bit por ciclo: de S a S+15 o preâmbulo fixo, e em S+16,
+      S+32 e S+48 é carregada a palavra lida no strobe anterior (nvm_rd_dt_i);
+    - dt_ack_done_o sobe junto com o último bit (S+63), e a linha mantém esse bit até o fim;
+    - g_ack_i ou f_saia_i em 0 zera tudo de forma assíncrona.
+
+O AckCore não depende do cocotb (pode ser exercitado por um laço em Python, ver
+tests/test_ack_core.py); o AckTlm (ack_tlm.py) o liga às portas do wrapper_tlm.v.
+'''
+PREAMBLE = 0x1800                   #Bits deslocados enquanto a palavra 130 é lida (observados no netlist)
+READ_ADDRS = {0: 130, 16: 131, 32: 132, 48: 0}
+FRAME_CYCLES = 64
+OUTPUTS = ("r_ack_o", "nvm_ack_rd_stb_o", "nvm_ack_addr_o", "dt_ack_o", "dt_ack_done_o")
+
+IDLE, WAIT_PROC, READ, DONE = range(4)
+
+class AckCore:
+    """Máquina de estados do ACK avaliada a cada borda de subida do clock."""
+    def __init__(self):
+        self.reset()
+        self.frames = 0
+
+    def reset(self):
+        """Zeramento assíncrono (g_ack_i ou f_saia_i em 0)."""
+        self.state = IDLE
+        self.cycle = 0
+        self.word = 0
+        self.r_ack_o = 0
+        self.nvm_ack_rd_stb_o = 0
+        self.nvm_ack_addr_o = 0
+        self.dt_ack_o = 0
+        self.dt_ack_done_o = 0
+
+    def clock(self, g_ack, dt_proc_ctrl, f_saia, nvm_rd_dt):
+        """Uma borda de subida, com as entradas amostradas antes dela."""
+        if not (g_ack and f_saia):
+            self.reset()
+        elif self.state == IDLE:
+            self.r_ack_o = 1
+            self.state = WAIT_PROC
+        elif self.state == WAIT_PROC:
+            if not dt_proc_ctrl:
+                self.state = READ
+                self.cycle = 0
+                self.word = PREAMBLE
+                self._shift()
+        elif self.state == READ:
+            self.cycle += 1
+            if self.cycle == FRAME_CYCLES:
+                self.state = DONE
+                self.frames += 1
+            else:
+                if self.cycle % 16 == 0:
+                    self.word = nvm_rd_dt
+                self._shift()
+                self.dt_ack_done_o = int(self.cycle == FRAME_CYCLES - 1)
+
+    def _shift(self):
+        slot = self.cycle % 16
+        self.nvm_ack_rd_stb_o = int(slot == 0 and self.cycle in READ_ADDRS and READ_ADDRS[self.cycle] != 0)
+        if slot == 0:
+            self.nvm_ack_addr_o = READ_ADDRS[self.cycle]
+        self.dt_ack_o = (self.word >> (15 - slot)) & 1
+
+    @property
+    def active(self):
+        """True enquanto a saída muda a cada borda (esperando o dt_proc_ctrl_i ou lendo)."""
+        return self.state in (WAIT_PROC, READ)
+
+    def outputs(self):
+        return tuple(getattr(self, name) for name in OUTPUTS)
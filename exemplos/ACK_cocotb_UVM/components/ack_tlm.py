@@ -0,0 +1,108 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: ack_tlm.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Ack_tlm: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+import cocotb                                                               # type: ignore
+from cocotb.triggers import RisingEdge, FallingEdge, First                  # type: ignore
+from .ack_model import AckCore, OUTPUTS, IDLE, WAIT_PROC, DONE
+from .dut_if import DutIf
+
+'''
+Backend TLM do ACK (ACK_BACKEND=tlm): o AckCore (ack_model.py) dirigindo as portas do
+wrapper_tlm.v, acordado a cada borda só durante a leitura.
+'''
+
+class AckTlm:
+    """
+    Liga o AckCore às portas do topo sem netlist (wrapper_tlm.v): lê as entradas em cada
+    borda de subida durante a leitura (uma amostra em bloco pelo DutIf), escreve só as
+    saídas que mudaram e fica parado (esperando g_ack_i/f_saia_i) fora das transações.
+    """
+    INPUTS = ("g_ack_i", "dt_proc_ctrl_i", "f_saia_i", "nvm_rd_dt_i")
+
+    def __init__(self, dut):
+        self.io = DutIf.wrap(dut)
+        self.vpi = self.io.site("ack_tlm")
+        self.core = AckCore()
+        self.edges = 0                      #Bordas em que o Python foi acordado
+        self._tasks = []
+
+    def start(self):
+        """Começa a responder às transações (equivale a ligar o DUT)."""
+        if not self._tasks:
+            self._drive()
+            self._tasks = [cocotb.start_soon(self._run()), cocotb.start_soon(self._async_reset())]
+
+    def stop(self):
+        for task in self._tasks:
+            task.kill()
+        self._tasks = []
+
+    def _requested(self):
+        g_ack, f_saia = self.io.sample(("g_ack_i", "f_saia_i"), self.vpi)
+        return g_ack and f_saia
+
+    def _drive(self):
+        for name, value in zip(OUTPUTS, self.core.outputs()):
+            self.io.set(name, value)
+        self.io.flush(self.vpi)             #O DutIf só escreve as saídas que mudaram
+
+    def _edge(self, kind, *ports):
+        return First(*(self.io.trigger(kind, port, self.vpi) for port in ports))
+
+    async def _run(self):
+        io, vpi, core = self.io, self.vpi, self.core
+        while True:
+            if core.state in (IDLE, DONE) and not self._requested():
+                await self._edge(RisingEdge, "g_ack_i", "f_saia_i")
+                continue
+            if core.state == DONE:
+                await self._edge(FallingEdge, "g_ack_i", "f_saia_i")
+                continue
+            if core.state == WAIT_PROC and io.read("dt_proc_ctrl_i", vpi):
+                await self._edge(FallingEdge, "dt_proc_ctrl_i", "g_ack_i", "f_saia_i")
+                continue
+            await io.trigger(RisingEdge, "clk_i", vpi)
+            self.edges += 1
+            core.clock(*io.sample(self.INPUTS, vpi))
+            self._drive()
+
+    async def _async_reset(self):
+        while True:
+            await self._edge(FallingEdge, "g_ack_i", "f_saia_i")
+            self.core.reset()
+            self._drive()
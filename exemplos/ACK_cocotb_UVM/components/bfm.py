@@ -38,40 +38,112 @@
 #Instâncias de bibliotecas:
 import cocotb                                                               # type: ignore
 import random                                                               # type: ignore
-from cocotb.triggers import Timer, RisingEdge                               # type: ignore
+from cocotb.triggers import RisingEdge                                      # type: ignore
+from cocotb.utils import get_sim_time                                       # type: ignore
 from cocotb.clock import Clock                                              # type: ignore
 from pyuvm import *                                                         # type: ignore
 from enum import Enum                                                       # type: ignore
-from .utils import NVM
+from .utils import NvmModel, NvmCtrl, NVM_INIT
+from .clock import SimClock
+from .serial_decoder import SerialDecoder
+from .wave import WaveControl
+from .ack_tlm import AckTlm
+from .dut_if import DutIf
 
 class Bfm:
     """
     Modelo Funcional de Barramento (BFM) para o ambiente de verificacao.
     Esta classe lida com todas as interacoes diretas com os sinais do DUT.
     Ela e' implementada para garantir um unico ponto de contato com o DUT.
+    Com várias cópias do DUT na simulação (wrapper.slot0 ... slotN-1, ver INSTANCES no
+    build_wrapper.sh) existe um BFM por cópia, escolhido pelo índice: Bfm(1) é o da slot1.
+    As portas são acessadas pelo DutIf (self.io, também em self.dut): handles resolvidos uma
+    vez, escritas em lote e travessias pela VPI contadas por trecho (send_seq, monitor_outputs
+    nvm_ctrl e, no backend tlm, ack_tlm), ver vpi_report().
     """
-    _instance = None                                                        # type: ignore
+    _instances = {}                                                         # type: ignore
 
 #----------------------------------------------------------------------------
-# Ativa o modo Singleton
+# Ativa o modo Singleton (um por instância do DUT)
 #----------------------------------------------------------------------------
-    def __new__(cls):                                                       # type: ignore
-        if cls._instance is None:                                           # type: ignore
-            cls._instance = super().__new__(cls)                            # type: ignore
-        return cls._instance                                                # type: ignore
+    def __new__(cls, index=0):                                              # type: ignore
+        if index not in cls._instances:                                     # type: ignore
+            cls._instances[index] = super().__new__(cls)                    # type: ignore
+        return cls._instances[index]                                        # type: ignore
+
+    @classmethod
+    def of(cls, component):
+        """BFM of the DUT copy a UVM component works on (ConfigDB "BFM_INDEX", 0 by default)."""
+        try:
+            index = ConfigDB().get(component, "", "BFM_INDEX")
+        except UVMConfigItemNotFound:
+            index = 0
+        return cls(index)
 
 #----------------------------------------------------------------------------
 #Parametros de inicializacao:
 #----------------------------------------------------------------------------
-    def __init__(self):
+    def __init__(self, index=0):
         if not hasattr(self, 'initialized'):
             self.initialized = True
-            self.dut = cocotb.top
-            self.dut.g_ack_i.value = 0                                      # type: ignore
-            self.dut.dt_proc_ctrl_i.value = 0                               # type: ignore         
-            self.dut.f_saia_i.value = 0                                     # type: ignore
-            self.dut.dft_tm_i.value = 0                                     # type: ignore
-            self.dut.nvm_rd_dt_i.value = 0                                  # type: ignore
+            self.index = index
+            self.dut = self.io = DutIf(self.slot(index))                    #Handles das portas resolvidos uma vez
+            self.vpi_send = self.io.site("send_seq")
+            self.vpi_monitor = self.io.site("monitor_outputs")
+            self.io.drive({"g_ack_i": 0, "dt_proc_ctrl_i": 0, "f_saia_i": 0, "dft_tm_i": 0, "nvm_rd_dt_i": 0},
+                          self.vpi_send)
+            self.clock = SimClock(self.dut, "clk_i")
+            self.wave = WaveControl(cocotb.top)                             #dump_on fica no topo
+            self.nvm = self.load_nvm()
+            self.decoder = SerialDecoder(
+                self.io,
+                clk="clk_i",
+                data="dt_ack_o",
+                done="dt_ack_done_o",
+                addr="nvm_ack_addr_o",
+                start_addr=131,                     #O quadro começa quando o endereço 083 é lido
+                clock=self.clock,
+                vpi=self.vpi_monitor
+            )
+            self.nvm_ctrl = NvmCtrl(self.dut, self.nvm, latency=self.nvm_latency())
+            self.txn_id = 0                         #ID da transação em curso (monitor marca as respostas com ele)
+            self.model = AckTlm(self.dut) if self.backend() == "tlm" else None   #ACK em Python, sem netlist
+
+    def backend(self):
+        """DUT backend from ConfigDB "ACK_BACKEND": "gate" (netlist) or "tlm" (Python model, see ack_tlm.py)."""
+        try:
+            return ConfigDB().get(None, "", "ACK_BACKEND")
+        except UVMConfigItemNotFound:
+            return "gate"
+
+    @staticmethod
+    def slot(index):
+        """Handle of DUT copy `index`: wrapper.slot<index>, or the top itself in single-instance wrappers."""
+        try:
+            return getattr(cocotb.top, f"slot{index}")
+        except AttributeError:
+            if index:
+                raise
+            return cocotb.top
+
+    def load_nvm(self):
+        """Creates this BFM's NVM, from the test image (ConfigDB "NVM_IMAGE") or the default contents."""
+        try:
+            image = ConfigDB().get(None, "", "NVM_IMAGE")
+        except UVMConfigItemNotFound:
+            image = None
+        if image is None:
+            return NvmModel(init=NVM_INIT)
+        nvm = NvmModel()
+        nvm.load(image)
+        return nvm
+
+    def nvm_latency(self):
+        """NVM latency model from ConfigDB "NVM_LATENCY" (None keeps the controller default)."""
+        try:
+            return ConfigDB().get(None, "", "NVM_LATENCY")
+        except UVMConfigItemNotFound:
+            return None
 
 #----------------------------------------------------------------------------
 #Campo de inicio das funcoes (tasks):
@@ -81,13 +153,13 @@ class Bfm:
     #Geracao do clock:
     #----------------------------------------------------------------------------
 
-    async def clock_ack(self, period):
-        """Generates the main clock signal for the DUT."""
-        self.clk = 1
-        while True:
-            await cocotb.triggers.Timer(period / 2, units="ns")
-            self.clk = not self.clk
-            self.dut.clk_i.value = self.clk
+    def start_clock(self, period):
+        """Starts the DUT clock (generated inside the simulator when the wrapper allows it)."""
+        self.clock.start(period)
+
+    def set_clock_period(self, period):
+        """Changes the clock period at runtime, without restarting the clock."""
+        self.clock.set_period(period)
 
     #----------------------------------------------------------------------------
     #Geracao da aleatoriedade dos valores de entrada vindos da memória:
@@ -95,73 +167,57 @@ class Bfm:
 
     #Todos os sinais após a transação devem ir para 0 (nível baixo) [g_ack, dt_proc, f_saia]
     async def send_seq(self, item):
-        """Executes a complete transaction sequence."""
-
-        NVM[130] = random.randint(0, 65535) & 0xFFF7
-        NVM[131] = random.randint(0, 65535)
-        NVM[132] = random.randint(0, 65535)
-
-        await cocotb.triggers.RisingEdge(self.dut.clk_i)
-        await cocotb.triggers.RisingEdge(self.dut.clk_i)
-
-        self.dut.g_ack_i.value = item.g_ack            
-
-        await cocotb.triggers.Timer(10, units="ns")
-        for _ in range (15): #Repete 15x o aguarde pela borda de clock
-            await cocotb.triggers.RisingEdge(self.dut.clk_i)
-
-        self.dut.dt_proc_ctrl_i.value = item.dt_proc_ctrl             
-
-        await cocotb.triggers.Timer(10, units="ns")
-        for _ in range (5): #Repete 5x o aguarde pela borda de clock
-            await cocotb.triggers.RisingEdge(self.dut.clk_i)
-
-        self.dut.f_saia_i.value = item.f_saia            
-
-        await cocotb.triggers.Timer(10, units="ns")
-
-        for _ in range (30): #Repete 30x o aguarde pela borda de clock
-            await cocotb.triggers.RisingEdge(self.dut.clk_i)
-
-        self.dut.dt_proc_ctrl_i.value = 0     
-
-        for _ in range (100): #Repete 100x o aguarde pela borda de clock
-            await cocotb.triggers.RisingEdge(self.dut.clk_i)
-        self.dut.g_ack_i.value = 0    
-        self.dut.f_saia_i.value = 0    
-        self.dut.dt_proc_ctrl_i.value = 0     
-        await cocotb.triggers.Timer(10, units="ns")
-        for _ in range (10): #Repete 10x o aguarde pela borda de clock
-            await cocotb.triggers.RisingEdge(self.dut.clk_i)
+        """Executes a complete transaction following the item's timing schedule."""
+        item.start_ns = get_sim_time(units="ns")
+        self.txn_id += 1
+        item.txn_id = self.txn_id
+
+        self.nvm[130] = random.randint(0, 65535) & 0xFFF7
+        self.nvm[131] = random.randint(0, 65535)
+        self.nvm[132] = random.randint(0, 65535)
+        item.nvm_words = (self.nvm[130], self.nvm[131], self.nvm[132])   #Estado da NVM usado pelo Predictor
+
+        period = self.clock.period or item.clk
+
+        io = self.io
+        for cycles, signals in item.schedule:
+            await self.wait_cycles(cycles, period)
+            for port, value in signals.items():
+                if isinstance(value, str):          #Valor vindo de um campo do item
+                    value = getattr(item, value)
+                io.set(port, value)
+            io.flush(self.vpi_send)                 #Uma escrita por porta alterada no passo
+
+    async def wait_cycles(self, cycles, period):
+        """Waits for the N-th next rising edge using at most three triggers, whatever N is."""
+        if cycles <= 0:
+            return
+        await self.io.trigger(RisingEdge, "clk_i", self.vpi_send)   #Alinha na próxima borda
+        if cycles > 1:
+            #Dorme até o meio do ciclo anterior à borda desejada e sincroniza nela
+            await self.io.timer((cycles - 1.5) * period, self.vpi_send)
+            await self.io.trigger(RisingEdge, "clk_i", self.vpi_send)
+
+    def vpi_report(self, log):
+        """Logs the Python<->simulator crossings per transaction of each hot path of this DUT copy."""
+        self.io.report(log, self.txn_id, label=f"slot{self.index} ")
 
     #Monitoramento:
-    async def monitor_outputs(self, ap): #Monitor quase certo, falta apenas acertar o valor dividido por
+    async def monitor_outputs(self, ap):
         """Collects the decoded data that will be used by Scoreboard."""
-        self.checker_data = 0
-        self.output_valid = 0
-
+        io, vpi = self.io, self.vpi_monitor
         while True:
-            await cocotb.triggers.Edge(self.dut.clk_i) #Aguarda alguma mudança no clock
-            await cocotb.triggers.First(cocotb.triggers.RisingEdge(self.dut.g_ack_i), cocotb.triggers.RisingEdge(self.dut.dt_proc_ctrl_i), cocotb.triggers.RisingEdge(self.dut.f_saia_i))
-
-            for _ in range (75):  # executa 75 ciclos ou acha o endereço 083
-                if self.dut.nvm_ack_addr_o.value == 131:
-                    self.output_valid = 1
-                    break
-                await cocotb.triggers.RisingEdge(self.dut.clk_i)
-
-            if self.output_valid:
-                while self.dut.dt_ack_done_o.value == 0:
-                    dt_bit = int(self.dut.dt_ack_o.value)
-                    self.checker_data = ((self.checker_data << 1) | dt_bit) & ((1 << 127) - 1)
-                    await cocotb.triggers.RisingEdge(self.dut.clk_i)
-           
-            dt_bit = int(self.dut.dt_ack_o.value)
-            self.checker_data = ((self.checker_data << 1) | dt_bit) & ((1 << 127) - 1)
-
-            ap.write(self.checker_data)
-            self.checker_data = 0
-            self.output_valid = 0
+            await io.trigger(cocotb.triggers.Edge, "clk_i", vpi) #Aguarda alguma mudança no clock
+            await cocotb.triggers.First(io.trigger(RisingEdge, "g_ack_i", vpi), io.trigger(RisingEdge, "dt_proc_ctrl_i", vpi), io.trigger(RisingEdge, "f_saia_i", vpi))
+            txn_id = self.txn_id #A resposta pertence à transação que gerou a borda
+
+            # Aguarda até 75 ciclos pelo endereço 083 e decodifica o quadro completo (qualquer tamanho)
+            frame = await self.decoder.capture(window=75)
+
+            if frame is None:
+                ap.write((txn_id, io.read("dt_ack_o", vpi))) #Sem resposta: apenas o nível atual da linha
+            else:
+                ap.write((txn_id, frame.data))
 
 
 
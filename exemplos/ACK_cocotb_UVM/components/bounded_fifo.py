@@ -0,0 +1,120 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: bounded_fifo.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Bounded_fifo: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+from collections import deque
+from cocotb.triggers import Event                                           # type: ignore
+from cocotb.utils import get_sim_time                                       # type: ignore
+from pyuvm import *                                                         # type: ignore
+
+POLICIES = ("block", "drop_oldest", "drop_newest")
+
+class BoundedFifo(uvm_subscriber):
+    """
+    Fila de análise com capacidade limitada, para o scoreboard em runs longos.
+    Cada item recebe um número de sequência (ordem de chegada), devolvido junto no get(),
+    para que o scoreboard mantenha o pareamento comando/resultado mesmo com descartes.
+
+    Políticas quando a fila está cheia:
+        block        aceita o item, mas quem produz deve aguardar wait_space() antes do
+                     próximo (o driver faz isso: é a contrapressão sobre o estímulo);
+        drop_oldest  descarta o item mais antigo;
+        drop_newest  descarta o item que chegou.
+
+    Métricas: high_water (maior ocupação), dropped, written e blocked_ns (tempo que os
+    produtores passaram esperando espaço).
+    """
+    def __init__(self, name, parent, maxsize=64, policy="block"):
+        super().__init__(name, parent)
+        if policy not in POLICIES:
+            raise ValueError(f"Política '{policy}' inválida, use uma de {POLICIES}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.items = deque()
+        self.written = 0
+        self.dropped = 0
+        self.high_water = 0
+        self.blocked_ns = 0
+        self._not_empty = Event()
+        self._not_full = Event()
+
+    def write(self, item):
+        """Stores an analysis item, applying the overflow policy (never blocks)."""
+        seq = self.written
+        self.written += 1
+        if self.maxsize and len(self.items) >= self.maxsize:
+            if self.policy == "drop_newest":
+                self.dropped += 1
+                return
+            if self.policy == "drop_oldest":
+                self.items.popleft()
+                self.dropped += 1
+        self.items.append((seq, item))
+        self.high_water = max(self.high_water, len(self.items))
+        self._not_empty.set()
+
+    def full(self):
+        return bool(self.maxsize) and len(self.items) >= self.maxsize
+
+    async def wait_space(self):
+        """Back-pressure: waits until the fifo has room for another item."""
+        if not self.full():
+            return
+        start = get_sim_time(units="ns")
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.blocked_ns += get_sim_time(units="ns") - start
+
+    async def get(self):
+        """Returns (sequence number, item), waiting while the fifo is empty."""
+        while not self.items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        entry = self.items.popleft()
+        self._not_full.set()
+        return entry
+
+    def stats(self):
+        return {
+            "depth": self.maxsize,
+            "policy": self.policy,
+            "written": self.written,
+            "dropped": self.dropped,
+            "high_water": self.high_water,
+            "blocked_ns": self.blocked_ns,
+        }
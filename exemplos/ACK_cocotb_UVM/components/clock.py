@@ -0,0 +1,91 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: clock.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Clock: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+import cocotb                                                               # type: ignore
+from cocotb.triggers import Timer                                           # type: ignore
+
+class SimClock:
+    """
+    Gerador de clock do DUT executado dentro do simulador.
+    O wrapper gerado pelo build_wrapper.sh possui o bloco "<porta>_gen", que alterna
+    a porta de clock sozinho a partir do meio período escrito em "<porta>_half_ps".
+    Dessa forma o Python não é acordado a cada borda, apenas quando o período muda.
+    Caso o wrapper não possua o gerador, cai para o loop de Timer em Python.
+    """
+    def __init__(self, dut, port="clk_i"):
+        self.clk = getattr(dut, port)
+        try:
+            self.half_ps = getattr(dut, f"{port}_half_ps")
+        except AttributeError:
+            self.half_ps = None
+        self.period = None
+        self._task = None
+
+    @property
+    def native(self):
+        """True quando o clock é gerado pelo próprio simulador."""
+        return self.half_ps is not None
+
+    def start(self, period):
+        """Inicia o clock com o período informado (em ns)."""
+        self.set_period(period)
+
+    def set_period(self, period):
+        """Altera o período (em ns) sem reiniciar o clock, vale a partir do próximo meio ciclo."""
+        self.period = period
+        if self.native:
+            self.half_ps.value = int(round(period * 500))
+        elif self._task is None:
+            self._task = cocotb.start_soon(self._toggle())
+
+    def stop(self):
+        """Para o clock mantendo o último nível na porta."""
+        if self.native:
+            self.half_ps.value = 0
+        elif self._task is not None:
+            self._task.kill()
+            self._task = None
+        self.period = None
+
+    async def _toggle(self):
+        """Loop em Python (uma escrita por borda) usado apenas sem o gerador nativo."""
+        clk = 1
+        while True:
+            await Timer(self.period / 2, units="ns", round_mode="round")
+            clk = not clk
+            self.clk.value = clk
@@ -36,9 +36,14 @@
 #----------------------------------------------------------------------------------------------------------------------------
 #Instâncias de bibliotecas:
 
+import os
+import cocotb
+from cocotb.handle import HierarchyObject
+from cocotb.triggers import Edge
 from pyuvm import *
-from .seq_item import SeqItem
+from .seq_item import SeqItem, AckTxn
 from .defs import g_ack, dt_proc_ctrl, f_saia
+from .coverage_db import CoverDB, ToggleDB, SUPPLY_NETS, net_name, parse_netlist
 
 CoverageBins = [
     (g_ack.VALIDO, dt_proc_ctrl.VALIDO, f_saia.VALIDO       ), 
@@ -61,28 +66,43 @@ class Coverage(uvm_subscriber):
     """
     O bloco Covarage é onde fazemos a varredura dos sinais que estamos aplicando 
     afim de obter resultados x ou y em nosso sistema.
+    Os hits de cada bin ficam em um CoverDB (coverage_db.py), gravado ao fim do run em
+    COVERAGE_DB (ConfigDB, padrão coverage.cdb) para ser combinado com outras seeds/jobs.
     """
     def end_of_elaboration_phase(self):
-        self.cvg = set()
+        self.db = CoverDB()
+        self.db.runs = 1
+        self.db.coverpoint("g_ack", list(g_ack))
+        self.db.coverpoint("dt_proc_ctrl", list(dt_proc_ctrl))
+        self.db.coverpoint("f_saia", list(f_saia))
+        self.db.cross("modes", ("g_ack", "dt_proc_ctrl", "f_saia"), bins=CoverageBins)
 
     def write(self, item):
-        if isinstance(item, SeqItem):
-            coverage_bin = (
-                item.g_ack,
-                item.dt_proc_ctrl,
-                item.f_saia
-            )
-            self.cvg.add(coverage_bin)
+        if isinstance(item, (SeqItem, AckTxn)):
+            self.db.sample_all({
+                "g_ack": item.g_ack,
+                "dt_proc_ctrl": item.dt_proc_ctrl,
+                "f_saia": item.f_saia,
+            })
 
     def report_phase(self):
+        try:
+            db_path = ConfigDB().get(self, "", "COVERAGE_DB")
+        except UVMConfigItemNotFound:
+            db_path = "coverage.cdb"
+        self.db.save(db_path)
+        for line in self.db.report():
+            self.logger.info(line)
+
         try:
             disable_errors = ConfigDB().get(self, "", "DISABLE_COVERAGE_ERRORS")
         except UVMConfigItemNotFound:
             disable_errors = False
 
         if not disable_errors:
-            coverage_bins_set = set(CoverageBins)
-            missed_bins = coverage_bins_set - self.cvg
+            #O CoverDB guarda os bins como inteiros: volta para os enums para o log
+            missed_bins = [tuple(point(v) for point, v in zip((g_ack, dt_proc_ctrl, f_saia), b))
+                           for b in self.db.holes("modes")]
             if len(missed_bins) > 0:
                 self.logger.error("Functional coverage error!")
                 self.logger.error(f"  -> Bins not covered: {missed_bins}")
@@ -92,3 +112,72 @@ class Coverage(uvm_subscriber):
                 self.logger.info("✅ Functional coverage reached all bins.")
                 assert True
 
+class ToggleCoverage(uvm_component):
+    """
+    Cobertura estrutural do netlist sintetizado: para cada net (e saída de flop) do
+    ack_pav2, se ela subiu (0->1) e desceu (1->0) durante a simulação.
+
+    Cada net tem uma corrotina esperando Edge no sinal; quando todos os bits da net
+    fizeram as duas transições a corrotina termina e o callback do simulador deixa de
+    existir, então o custo cai para perto de zero conforme a cobertura avança.
+    O resultado vai para um ToggleDB (coverage_db.py) gravado em TOGGLE_DB, que pode
+    ser combinado com o de outras execuções.
+
+    ConfigDB: TOGGLE_NETLIST (padrão files_synthesis/ack_pav2.v) e TOGGLE_DB
+    (padrão toggle_cov.json).
+    """
+    def build_phase(self):
+        self.netlist = self.config("TOGGLE_NETLIST", os.path.join("files_synthesis", "ack_pav2.v"))
+        self.db_path = self.config("TOGGLE_DB", "toggle_cov.json")
+        self.db = ToggleDB()
+        self.db.runs = 1
+        self.watching = 0
+
+    def config(self, key, default):
+        try:
+            return ConfigDB().get(self, "", key)
+        except UVMConfigItemNotFound:
+            return default
+
+    def discover(self, root, prefix="dut"):
+        """Nets do DUT vistas pelo simulador, filtradas pelas do netlist quando ele existe."""
+        kinds = parse_netlist(self.netlist) if os.path.isfile(self.netlist) else None
+        nets = []
+        for handle in root:
+            if isinstance(handle, HierarchyObject):        #Instâncias das células
+                continue
+            name = net_name(handle._name)
+            if name in SUPPLY_NETS or (kinds is not None and name not in kinds):
+                continue
+            width, kind = kinds[name] if kinds else (len(handle), "wire")
+            nets.append((f"{prefix}.{name}", handle, width, kind))
+        return nets
+
+    async def run_phase(self):
+        for name, handle, width, kind in self.discover(cocotb.top.dut):
+            self.db.add_net(name, width, kind)
+            self.watching += 1
+            cocotb.start_soon(self.watch(name, handle))
+
+    @staticmethod
+    def sample(handle):
+        value = handle.value
+        return value.integer if value.is_resolvable else None
+
+    async def watch(self, name, handle):
+        """Accumulates the net's rise/fall bits and returns once it is fully covered."""
+        edge = Edge(handle)
+        prev = self.sample(handle)
+        while True:
+            await edge
+            cur = self.sample(handle)
+            if prev is not None and cur is not None and self.db.hit(name, ~prev & cur, prev & ~cur):
+                self.watching -= 1
+                return
+            prev = cur
+
+    def report_phase(self):
+        self.db.save(self.db_path)
+        for line in self.db.report():
+            self.logger.info(line)
+        self.logger.info(f"Toggle coverage: {self.watching} net(s) ainda monitoradas no fim, banco em {self.db_path}")
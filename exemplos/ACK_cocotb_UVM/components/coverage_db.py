@@ -0,0 +1,432 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: coverage_db.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Coverage_db: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+import argparse
+import glob
+import itertools
+import json
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+
+'''
+Banco da cobertura estrutural (toggle) do netlist, sem dependência do cocotb: é usado
+pelo ToggleCoverage durante a simulação e pode ser lido/combinado fora dela.
+
+Para cada net guarda duas máscaras de bits: quais bits já subiram (0->1) e quais já
+desceram (1->0). Uma net está coberta quando todos os bits fizeram as duas transições.
+Combinar execuções (seeds, corners, jobs da regressão) é um OU das máscaras.
+
+O CoverDB guarda a cobertura funcional (coverpoints e crosses) com o número de hits
+de cada bin, em um arquivo binário compacto (coverage.cdb) gravado ao fim de cada run.
+Para combinar a regressão: python3 components/coverage_db.py merge -o total.cdb regression/*/final_results/coverage.cdb
+'''
+
+DB_VERSION = 1
+
+#Nets de alimentação: nunca chaveiam e ficam fora da cobertura
+SUPPLY_NETS = {"VPWR", "VGND", "VPB", "VNB"}
+
+_PORT = re.compile(r"^\s*(input|output|inout)\s+(?:wire\s+)?(?:\[(\d+):(\d+)\]\s*)?(\\\S+|\w+)\s*;", re.M)
+_WIRE = re.compile(r"^\s*wire\s+(?:\[(\d+):(\d+)\]\s*)?(\\\S+|\w+)\s*;", re.M)
+_FLOP = re.compile(r"\b(sky130_fd_sc_\w+__(?:df|edf|sdf|dl)\w*)\s+(\\\S+|\w+)\s*\((.*?)\);", re.S)
+_Q_PIN = re.compile(r"\.Q(?:_N)?\s*\(\s*(\\\S+\s|\w+)\s*\)")
+
+def net_name(name):
+    """Nome da net sem o escape do Verilog (\\buffer_ff[0] -> buffer_ff[0])."""
+    name = name.strip()
+    return name[1:] if name.startswith("\\") else name
+
+def parse_netlist(path):
+    """{net: (largura, tipo)} do netlist, com tipo 'port', 'wire' ou 'flop' (saída Q/Q_N de um flop/latch)."""
+    with open(path, errors="replace") as f:
+        text = f.read()
+    nets = {}
+    for _, msb, lsb, name in _PORT.findall(text):
+        width = abs(int(msb) - int(lsb)) + 1 if msb else 1
+        nets[net_name(name)] = (width, "port")
+    for msb, lsb, name in _WIRE.findall(text):
+        width = abs(int(msb) - int(lsb)) + 1 if msb else 1
+        nets.setdefault(net_name(name), (width, "wire"))
+    for _, _, pins in _FLOP.findall(text):
+        for q in _Q_PIN.findall(pins):
+            name = net_name(q)
+            if nets.get(name, (1, ""))[1] == "wire":
+                nets[name] = (nets[name][0], "flop")
+    for name in SUPPLY_NETS:
+        nets.pop(name, None)
+    return nets
+
+def group_of(name):
+    """Grupo do relatório: escopo + nome sem índice e com números genéricos (dut.buffer_ff, dut._N_, dut.netN)."""
+    scope, _, net = name.rpartition(".")
+    base = re.sub(r"\[\d+\]$", "", net)
+    base = re.sub(r"\d+", "N", base)
+    return f"{scope}.{base}" if scope else base
+
+class ToggleDB:
+    """
+    Máscaras de subida/descida por net. As nets são identificadas pelo caminho a partir
+    do wrapper (ex.: dut.buffer_ff[3], dut.nvm_ack_addr_o).
+    """
+    def __init__(self):
+        self.nets = {}              #nome -> [largura, tipo, máscara de subidas, máscara de descidas]
+        self.runs = 0               #Execuções combinadas neste banco
+
+    def add_net(self, name, width=1, kind="wire"):
+        """Registers a net (keeps the masks if it already exists)."""
+        if name not in self.nets:
+            self.nets[name] = [width, kind, 0, 0]
+
+    def hit(self, name, rise, fall):
+        """Accumulates rise/fall bit masks; returns True once every bit has toggled both ways."""
+        n = self.nets[name]
+        n[2] |= rise
+        n[3] |= fall
+        full = (1 << n[0]) - 1
+        return n[2] == full and n[3] == full
+
+    def covered(self, name):
+        width, _, rise, fall = self.nets[name]
+        full = (1 << width) - 1
+        return rise == full and fall == full
+
+    def merge(self, other):
+        """ORs another database into this one (new nets are added)."""
+        for name, (width, kind, rise, fall) in other.nets.items():
+            n = self.nets.setdefault(name, [width, kind, 0, 0])
+            n[2] |= rise
+            n[3] |= fall
+        self.runs += other.runs
+        return self
+
+    #----------------------------------------------------------------------------
+    #Resultados:
+    #----------------------------------------------------------------------------
+    def summary(self):
+        """Bits cobertos / total, geral e por tipo de net."""
+        totals = {}
+        for width, kind, rise, fall in self.nets.values():
+            both = bin(rise & fall).count("1")
+            for key in ("total", kind):
+                t = totals.setdefault(key, [0, 0])
+                t[0] += both
+                t[1] += width
+        return {k: {"covered": c, "bits": b, "percent": round(100.0 * c / b, 2) if b else 100.0}
+                for k, (c, b) in totals.items()}
+
+    def uncovered(self):
+        """{grupo: [(net, bits sem subida, bits sem descida)]} das nets não cobertas."""
+        groups = {}
+        for name in sorted(self.nets):
+            width, _, rise, fall = self.nets[name]
+            full = (1 << width) - 1
+            if rise == full and fall == full:
+                continue
+            groups.setdefault(group_of(name), []).append((name, full & ~rise, full & ~fall))
+        return groups
+
+    def report(self, limit=10):
+        """Linhas de texto: resumo e nets não cobertas agrupadas pela hierarquia."""
+        s = self.summary()
+        kinds = ", ".join(f"{k} {v['percent']}%" for k, v in sorted(s.items()) if k != "total")
+        lines = [f"Toggle coverage: {s.get('total', {}).get('percent', 100.0)}% dos bits ({kinds})"]
+        for group, nets in sorted(self.uncovered().items()):
+            names = ", ".join(n.rpartition(".")[2] for n, _, _ in nets[:limit])
+            more = f" (+{len(nets) - limit})" if len(nets) > limit else ""
+            lines.append(f"  {group}: {len(nets)} net(s) sem cobertura: {names}{more}")
+        return lines
+
+    #----------------------------------------------------------------------------
+    #Arquivo:
+    #----------------------------------------------------------------------------
+    def to_json(self):
+        return {
+            "version": DB_VERSION,
+            "runs": self.runs,
+            "nets": {name: {"width": w, "kind": k, "rise": r, "fall": f}
+                     for name, (w, k, r, f) in sorted(self.nets.items())},
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        db = cls()
+        db.runs = data.get("runs", 1)
+        for name, n in data["nets"].items():
+            db.nets[name] = [n["width"], n["kind"], n["rise"], n["fall"]]
+        return db
+
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.to_json(), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_json(json.load(f))
+
+#----------------------------------------------------------------------------
+#Cobertura funcional com contagem de hits:
+#----------------------------------------------------------------------------
+CDB_MAGIC = b"ACKCDB1\n"
+_LEN = struct.Struct("<IQ")         #Tamanho do cabeçalho JSON, número de runs
+
+def _label(value):
+    """Rótulo de bin gravável em JSON (enums viram o valor inteiro, tuplas viram listas)."""
+    if isinstance(value, (tuple, list)):
+        return [_label(v) for v in value]
+    return int(value) if isinstance(value, int) else value
+
+def _key(label):
+    return tuple(_key(v) for v in label) if isinstance(label, list) else label
+
+class CoverDB:
+    """
+    Coverpoints e crosses com contagem de hits por bin. A ordem dos bins é fixada na
+    declaração, então os contadores de cada coverpoint são um array('Q') e runs com a
+    mesma declaração são combinadas somando os arrays.
+    """
+    def __init__(self):
+        self.points = {}            #nome -> {"bins": [rótulos], "cross": [coverpoints] ou None}
+        self.counts = {}            #nome -> array('Q') com os hits de cada bin
+        self._index = {}            #nome -> {rótulo: posição}
+        self.runs = 0
+
+    def coverpoint(self, name, bins):
+        """Declares a coverpoint with a fixed list of bins."""
+        self._declare(name, [_label(b) for b in bins], None)
+
+    def cross(self, name, points, bins=None):
+        """Declares a cross of coverpoints; bins defaults to every combination of their bins."""
+        if bins is None:
+            bins = itertools.product(*(self.points[p]["bins"] for p in points))
+        self._declare(name, [_label(b) for b in bins], list(points))
+
+    def _declare(self, name, bins, cross):
+        self.points[name] = {"bins": bins, "cross": cross}
+        self.counts[name] = array("Q", bytes(8 * len(bins)))
+        self._index[name] = {_key(b): i for i, b in enumerate(bins)}
+
+    def sample(self, name, value):
+        """Counts one hit of value in a coverpoint/cross; values outside the bins are ignored."""
+        i = self._index[name].get(_key(_label(value)))
+        if i is not None:
+            self.counts[name][i] += 1
+        return i is not None
+
+    def sample_all(self, values):
+        """Samples every coverpoint from {name: value} and the crosses built from them."""
+        for name, point in self.points.items():
+            if point["cross"] is None:
+                if name in values:
+                    self.sample(name, values[name])
+            elif all(p in values for p in point["cross"]):
+                self.sample(name, tuple(values[p] for p in point["cross"]))
+
+    def hits(self, name, since=None):
+        """[(bin, hits)] of a coverpoint, counting only hits after a snapshot() when since is given."""
+        counts = self.counts[name]
+        if since is not None:
+            counts = [n - b for n, b in zip(counts, since[name])]
+        return list(zip(map(_key, self.points[name]["bins"]), counts))
+
+    def holes(self, name, min_hits=1, since=None):
+        """Bins with fewer than min_hits hits."""
+        return [b for b, n in self.hits(name, since) if n < min_hits]
+
+    def percent(self, name, min_hits=1, since=None):
+        hits = self.hits(name, since)
+        return round(100.0 * sum(1 for _, n in hits if n >= min_hits) / len(hits), 2) if hits else 100.0
+
+    def closure(self, min_hits=1, since=None, names=None):
+        """Percentage of bins with at least min_hits hits over the given coverpoints/crosses (default all)."""
+        hits = [n for name in (names or self.points) for _, n in self.hits(name, since)]
+        return 100.0 * sum(1 for n in hits if n >= min_hits) / len(hits) if hits else 100.0
+
+    def snapshot(self):
+        """Copy of the counters, to measure closure from this point on (since=...)."""
+        return {name: array("Q", counts) for name, counts in self.counts.items()}
+
+    def merge(self, other):
+        """Adds another database's hits (coverpoints missing here are copied)."""
+        for name, point in other.points.items():
+            if name not in self.points:
+                self._declare(name, point["bins"], point["cross"])
+            if self.points[name]["bins"] == point["bins"]:
+                counts = self.counts[name]
+                for i, n in enumerate(other.counts[name]):
+                    counts[i] += n
+            else:                   #Bins declarados de outra forma: soma rótulo a rótulo
+                for b, n in other.hits(name):
+                    i = self._index[name].get(b)
+                    if i is not None:
+                        self.counts[name][i] += n
+        self.runs += other.runs
+        return self
+
+    def report(self):
+        lines = []
+        for name, point in self.points.items():
+            kind = f"cross {' x '.join(point['cross'])}" if point["cross"] else "coverpoint"
+            lines.append(f"{name} ({kind}): {self.percent(name)}% dos bins em {self.runs} run(s)")
+            for b, n in self.hits(name):
+                lines.append(f"    {str(b):<24}{n:>10}{'' if n else '   <-- sem hits'}")
+        return lines
+
+    #----------------------------------------------------------------------------
+    #Arquivo binário: magic, tamanhos, cabeçalho JSON (declarações) e os contadores
+    #----------------------------------------------------------------------------
+    def _header(self):
+        return json.dumps([[name, p["bins"], p["cross"]] for name, p in self.points.items()],
+                          separators=(",", ":")).encode()
+
+    def save(self, path):
+        header = self._header()
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(CDB_MAGIC)
+            f.write(_LEN.pack(len(header), self.runs))
+            f.write(header)
+            for name in self.points:
+                self.counts[name].tofile(f)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _read(path):
+        """(cabeçalho em bytes, runs, contadores em bytes) de um arquivo .cdb."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(CDB_MAGIC):
+            raise ValueError(f"{path}: não é um banco de cobertura (.cdb)")
+        size, runs = _LEN.unpack_from(data, len(CDB_MAGIC))
+        start = len(CDB_MAGIC) + _LEN.size
+        return data[start:start + size], runs, data[start + size:]
+
+    @classmethod
+    def _build(cls, header, runs, counts):
+        db = cls()
+        for name, bins, cross in json.loads(header):
+            db._declare(name, bins, cross)
+        db.runs = runs
+        flat = array("Q")
+        flat.frombytes(counts)
+        offset = 0
+        for name in db.points:
+            n = len(db.points[name]["bins"])
+            db.counts[name] = flat[offset:offset + n]
+            offset += n
+        return db
+
+    @classmethod
+    def load(cls, path):
+        return cls._build(*cls._read(path))
+
+    @classmethod
+    def merge_files(cls, paths):
+        """Combina vários .cdb. Arquivos com o mesmo cabeçalho (caso da regressão) são somados
+        direto nos contadores, sem decodificar o JSON de novo."""
+        base_header, total, runs = None, None, 0
+        others = []
+        for path in paths:
+            header, n, counts = cls._read(path)
+            if base_header is None:
+                base_header, total = header, array("Q")
+                total.frombytes(counts)
+            elif header == base_header and len(counts) == 8 * len(total):
+                part = array("Q")
+                part.frombytes(counts)
+                for i, v in enumerate(part):
+                    total[i] += v
+            else:
+                others.append(cls._build(header, n, counts))
+                continue
+            runs += n
+        if base_header is None:
+            return cls()
+        db = cls._build(base_header, runs, total.tobytes())
+        for other in others:
+            db.merge(other)
+        return db
+
+#----------------------------------------------------------------------------
+#Linha de comando: combina os bancos de várias execuções e gera o relatório
+#----------------------------------------------------------------------------
+def expand_paths(patterns):
+    paths = []
+    for pattern in patterns:
+        paths.extend(sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern])
+    return paths
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Combina bancos de cobertura (.cdb funcional, .json de toggle).")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    m = sub.add_parser("merge", help="Combina vários bancos em um")
+    m.add_argument("-o", "--out", required=True, help="Banco de saída (.cdb ou .json)")
+    m.add_argument("inputs", nargs="+", help="Arquivos ou padrões glob")
+    r = sub.add_parser("report", help="Relatório de um banco")
+    r.add_argument("db")
+    opt = ap.parse_args(argv)
+
+    if opt.cmd == "report":
+        db = CoverDB.load(opt.db) if opt.db.endswith(".cdb") else ToggleDB.load(opt.db)
+        print("\n".join(db.report()))
+        return 0
+
+    paths = expand_paths(opt.inputs)
+    if not paths:
+        print("Nenhum banco de cobertura encontrado")
+        return 1
+    start = time.perf_counter()
+    if opt.out.endswith(".cdb"):
+        db = CoverDB.merge_files(paths)
+    else:
+        db = ToggleDB()
+        for path in paths:
+            db.merge(ToggleDB.load(path))
+    db.save(opt.out)
+    print("\n".join(db.report()))
+    print(f"{len(paths)} banco(s) combinados em {opt.out} ({time.perf_counter() - start:.2f} s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
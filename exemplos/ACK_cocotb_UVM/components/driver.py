@@ -38,6 +38,7 @@
 #Instâncias de bibliotecas:
 from pyuvm import *                                                   
 from .bfm import Bfm
+from .seq_item import AckTxn
 
 class Driver(uvm_driver):                                              
     """
@@ -49,14 +50,24 @@ class Driver(uvm_driver):
         # cria uma analysis port, chamada "ap", que será usada para enviar os dados para outros componentes do scoreboard.
 
     def start_of_simulation_phase(self):
-        self.bfm = Bfm()
+        self.bfm = Bfm.of(self)
     # Inicia a fase de simulação e aloca o bfm ao monitor.
 
+        try:
+            self.backpressure = ConfigDB().get(self, "", "BACKPRESSURE")
+        except UVMConfigItemNotFound:
+            self.backpressure = []
+    # Filas limitadas (scoreboard em modo limitado) que podem segurar o envio do próximo item.
+
     async def run_phase(self):
     #Ciclo de operação principal do driver
     #Habitualmente é usado em loop, agardando os itens vindos do sequenciador que serão enviados ao dut via BFM
 
         while True:
+            for fifo in self.backpressure:
+                await fifo.wait_space()
+            # Contrapressão: só busca o próximo item quando o scoreboard tem espaço.
+
             # Aguarda de forma assíncrona o próximo item da lista do sequenciador,
             # Além disso, o sequenciador irá controlar a ordem dos itens.
             item = await self.seq_item_port.get_next_item()
@@ -64,8 +75,9 @@ class Driver(uvm_driver):
             await self.bfm.send_seq(item)
             # Ele irá enviar o item para o BFM que irá converter os dados em sinais de estimulos no dut.
 
-            self.ap.write(item)
+            self.ap.write(AckTxn.from_item(item))
             # Os dados serão escrito no scoreboard para que seja possível observa-lo.
+            # Publica-se uma cópia compacta: o item pode ser reaproveitado pela sequência.
 
             self.seq_item_port.item_done()
             #Notifica o sequenciador que o processamento do item foi concluído.
@@ -0,0 +1,177 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: dut_if.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Dut_if: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+from cocotb.triggers import Timer                                           # type: ignore
+
+'''
+Camada de acesso às portas do DUT usada pelo BFM, pelo NvmCtrl e pelo SerialDecoder.
+
+Cada leitura ou escrita de um sinal e cada trigger (RisingEdge, Edge, ...) é uma travessia
+Python <-> simulador pela VPI. O DutIf reduz e mede essas travessias:
+    - os handles das portas são resolvidos uma única vez (dut.<porta> vira um atributo comum);
+    - as escritas de um passo de tempo são acumuladas (set) e aplicadas juntas (flush), e uma
+      porta que já tem o valor pedido não é escrita de novo;
+    - sample() lê um conjunto de portas em uma chamada (ainda um vpi_get_value por porta,
+      mas sem busca de handle nem conversão repetida no chamador);
+    - cada trecho quente (send_seq, monitor_outputs, nvm_ctrl, ack_tlm) tem seu VpiCounter,
+      e report() mostra as travessias por transação de cada um. Os contadores só são
+      incrementados aqui dentro (read, sample, flush, trigger, timer): quem usa o DutIf
+      não conta nada à mão, então os números são as chamadas realmente feitas.
+Os demais atributos (clk_i_half_ps, ...) continuam acessíveis pelo DutIf, também com cache.
+'''
+
+#Portas do ack_pav2 resolvidas na criação do DutIf
+ACK_PORTS = ("clk_i", "g_ack_i", "dt_proc_ctrl_i", "f_saia_i", "dft_tm_i", "nvm_rd_dt_i",
+             "r_ack_o", "nvm_ack_rd_stb_o", "nvm_ack_addr_o", "dt_ack_o", "dt_ack_done_o")
+
+class VpiCounter:
+    """Travessias Python <-> simulador de um trecho do testbench."""
+    __slots__ = ("name", "callbacks", "reads", "writes", "skipped")
+
+    def __init__(self, name):
+        self.name = name
+        self.callbacks = 0          #Triggers registrados (bordas e Timer)
+        self.reads = 0              #vpi_get_value
+        self.writes = 0             #vpi_put_value
+        self.skipped = 0            #Escritas evitadas (porta já com o valor pedido)
+
+    @property
+    def total(self):
+        return self.callbacks + self.reads + self.writes
+
+class DutIf:
+    """
+    Handles das portas do DUT resolvidos uma vez, escritas em lote e leituras em bloco,
+    com contagem das travessias pela VPI por trecho (site).
+    """
+    def __init__(self, dut, ports=ACK_PORTS):
+        self._dut = dut
+        self._shadow = {}           #Último valor escrito em cada porta
+        self._pending = {}          #Escritas do passo de tempo atual, aplicadas em flush()
+        self.sites = {}
+        for port in ports:
+            setattr(self, port, getattr(dut, port))
+
+    def __getattr__(self, name):
+        #Só chamado quando o atributo ainda não existe: resolve no DUT e guarda
+        if name.startswith("_"):
+            raise AttributeError(name)
+        handle = getattr(self._dut, name)
+        setattr(self, name, handle)
+        return handle
+
+    @classmethod
+    def wrap(cls, dut):
+        """O próprio DutIf, ou um novo sobre o handle do DUT."""
+        return dut if isinstance(dut, cls) else cls(dut)
+
+    def site(self, name):
+        """Contador de um trecho do testbench (criado no primeiro uso)."""
+        counter = self.sites.get(name)
+        if counter is None:
+            counter = self.sites[name] = VpiCounter(name)
+        return counter
+
+    #----------------------------------------------------------------------------
+    #Leituras:
+    #----------------------------------------------------------------------------
+    def read(self, port, counter):
+        """Valor inteiro de uma porta (0 se tiver x/z)."""
+        counter.reads += 1
+        value = getattr(self, port).value
+        return int(value) if value.is_resolvable else 0
+
+    def sample(self, ports, counter):
+        """Valores inteiros de várias portas no mesmo instante, na ordem pedida (0 se x/z)."""
+        counter.reads += len(ports)
+        values = []
+        for port in ports:
+            value = getattr(self, port).value
+            values.append(int(value) if value.is_resolvable else 0)
+        return values
+
+    #----------------------------------------------------------------------------
+    #Escritas:
+    #----------------------------------------------------------------------------
+    def set(self, port, value):
+        """Agenda a escrita da porta para o próximo flush() (a última do passo vale)."""
+        self._pending[port] = value
+
+    def flush(self, counter):
+        """Aplica as escritas pendentes, pulando as portas que já têm o valor pedido."""
+        shadow = self._shadow
+        for port, value in self._pending.items():
+            if shadow.get(port) == value:
+                counter.skipped += 1
+                continue
+            getattr(self, port).value = value
+            shadow[port] = value
+            counter.writes += 1
+        self._pending.clear()
+
+    def drive(self, signals, counter):
+        """Escreve um conjunto de portas ({porta: valor}) em um único flush."""
+        self._pending.update(signals)
+        self.flush(counter)
+
+    #----------------------------------------------------------------------------
+    #Triggers:
+    #----------------------------------------------------------------------------
+    def trigger(self, kind, port, counter):
+        """Trigger `kind` (RisingEdge, Edge, ...) sobre a porta, contado como um callback."""
+        counter.callbacks += 1
+        return kind(getattr(self, port))
+
+    def timer(self, delay, counter, units="ns"):
+        """Timer (arredondado para a precisão do simulador), contado como um callback."""
+        counter.callbacks += 1
+        return Timer(delay, units=units, round_mode="round")
+
+    #----------------------------------------------------------------------------
+    #Relatório:
+    #----------------------------------------------------------------------------
+    def total(self):
+        """Travessias de todos os trechos desde o início."""
+        return sum(counter.total for counter in self.sites.values())
+
+    def report(self, log, transactions, label=""):
+        """Travessias por transação de cada trecho (label identifica a cópia do DUT)."""
+        n = max(transactions, 1)
+        for c in self.sites.values():
+            log.info(f"VPI {label}{c.name}: {c.callbacks / n:.1f} callbacks, {c.reads / n:.1f} leituras, "
+                     f"{c.writes / n:.1f} escritas ({c.skipped / n:.1f} evitadas) por transação")
@@ -35,10 +35,12 @@
 # Arquivo Env: 
 #----------------------------------------------------------------------------------------------------------------------------
 #Instâncias de bibliotecas:
+import os
 from pyuvm import *
 from .agent import Agent
 from .Scoreboard import Scoreboard
-from .coverage import Coverage
+from .coverage import Coverage, ToggleCoverage
+from .predictor import Predictor
 
 class Env(uvm_env): # type: ignore
 # Classe de ambiente de mais alto nível (top-level) do testbench UVM.
@@ -46,26 +48,78 @@ class Env(uvm_env): # type: ignore
     def build_phase(self):
     # build_phase(): criar (instanciar) os subcomponentes do ambiente.
 
-        self.agent = Agent.create("agent", self)
-        # Instancia o Agent que irá conter seqr, driver e o monitor.
+        try:
+            self.instances = ConfigDB().get(self, "", "ACK_INSTANCES")
+        except UVMConfigItemNotFound:
+            self.instances = 1
+        # Cópias do DUT na simulação (wrapper.slot0 ... slotN-1): um Agent, Predictor e
+        # Scoreboard por cópia, com o BFM escolhido pelo índice (BFM_INDEX). Com uma só
+        # cópia os nomes continuam agent/predictor/scoreboard.
+
+        try:
+            trace_path = ConfigDB().get(self, "", "SCOREBOARD_TRACE")
+        except UVMConfigItemNotFound:
+            trace_path = None
+        self.offline = bool(trace_path)
+
+        self.agents, self.predictors, self.scoreboards = [], [], []
+        for i in range(self.instances):
+            suffix = str(i) if self.instances > 1 else ""
+            ConfigDB().set(self, f"agent{suffix}.*", "BFM_INDEX", i)
+
+            self.agents.append(Agent.create(f"agent{suffix}", self))
+            # Instancia o Agent que irá conter seqr, driver e o monitor.
+
+            if not self.offline:
+                self.predictors.append(Predictor.create(f"predictor{suffix}", self))
+                # Instancia o Predictor (valor esperado de cada transação, no envio).
+                # No modo trace a predição é feita fora da simulação (txn_trace.py).
+            elif suffix:
+                root, ext = os.path.splitext(trace_path)
+                ConfigDB().set(self, f"scoreboard{suffix}", "SCOREBOARD_TRACE", f"{root}{suffix}{ext}")
+                # Um trace por cópia (ack_trace0.bin, ack_trace1.bin, ...).
+
+            self.scoreboards.append(Scoreboard.create(f"scoreboard{suffix}", self))
+            # Instancia o Scoreboard.
+
+        self.agent = self.agents[0]
+        self.scoreboard = self.scoreboards[0]
 
         self.coverage = Coverage.create("coverage", self)
-        # Instancia o coletor da cobertura funcional (Coverage)
+        # Instancia o coletor da cobertura funcional (Coverage), comum a todas as cópias.
 
-        self.scoreboard = Scoreboard.create("scoreboard", self)
-        # Instancia o Scoreboard.
+        try:
+            toggle = ConfigDB().get(self, "", "TOGGLE_COVERAGE")
+        except UVMConfigItemNotFound:
+            toggle = False
+        if toggle:
+            self.toggle = ToggleCoverage.create("toggle", self)
+            # Cobertura de toggle das nets do netlist (opcional, TOGGLE_COV=1 no make)
 
     def connect_phase(self):
     # Fase de conexão.
 
         ConfigDB().set(None, "*", "SEQR", self.agent.seqr) # type: ignore
-        # Definimos o SEQR como sequenciador do Agent.
+        ConfigDB().set(None, "*", "SEQRS", [agent.seqr for agent in self.agents]) # type: ignore
+        # Definimos o SEQR como sequenciador do Agent (SEQRS: um por cópia do DUT).
+
+        ConfigDB().set(None, "*", "COVERAGE", self.coverage) # type: ignore
+        # Modelo de cobertura consultado pela sequência adaptativa (ACKAdaptiveSeq).
+
+        for i, (agent, scoreboard) in enumerate(zip(self.agents, self.scoreboards)):
+            if self.offline:
+                agent.driver_ap.connect(scoreboard.cmd_export)
+            else:
+                agent.driver_ap.connect(self.predictors[i].analysis_export)
+                self.predictors[i].ap.connect(scoreboard.cmd_export)
+            # Interliga o driver ao Scoreboard (Comandos), passando pelo Predictor
+            # (ou direto ao trace, no modo SCOREBOARD_TRACE).
 
-        self.agent.driver_ap.connect(self.scoreboard.cmd_export)
-        # Interliga o driver ao Scoreboard (Comandos).
+            agent.driver_ap.connect(self.coverage.analysis_export)
+            # Interliga o driver ao Coverage (Comandos).
 
-        self.agent.driver_ap.connect(self.coverage.analysis_export)
-        # Interliga o driver ao Coverage (Comandos).
+            agent.monitor_ap.connect(scoreboard.result_export)
+            # Interliga o monitor ao scoreboard (Resultados).
 
-        self.agent.monitor_ap.connect(self.scoreboard.result_export)
-        # Interliga o monitor ao scoreboard (Resultados).
+            ConfigDB().set(agent, "*", "BACKPRESSURE", scoreboard.backpressure)
+            # Filas do scoreboard desta cópia que podem segurar o driver (modo limitado).
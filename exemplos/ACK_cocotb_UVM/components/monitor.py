@@ -48,7 +48,7 @@ class Monitor(uvm_component):
 
     def build_phase(self):
         self.ap = uvm_analysis_port("ap", self)                                         # type: ignore
-        self.bfm = Bfm()
+        self.bfm = Bfm.of(self)
 
     async def run_phase(self):
         #Inicializa a função de monitoramento no BFM.
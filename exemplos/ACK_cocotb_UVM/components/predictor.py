@@ -0,0 +1,57 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: predictor.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Predictor: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+from pyuvm import *                                                         # type: ignore
+from .ref_model import expected_response
+
+class Predictor(uvm_subscriber):
+    """
+    Calcula a resposta esperada de cada transação no momento em que o driver a envia,
+    a partir do estado da NVM guardado no item (nvm_words), e publica em "ap" a tupla
+    (ID da transação, transação, valor esperado) para o scoreboard.
+    Como a predição não depende da NVM no momento da comparação, o driver pode seguir
+    adiante do monitor sem gerar falhas falsas.
+    """
+    def build_phase(self):
+        self.ap = uvm_analysis_port("ap", self)                             # type: ignore
+        self.predicted = 0
+
+    def write(self, txn):
+        expected = expected_response(txn.nvm_words, txn.g_ack, txn.f_saia)
+        self.predicted += 1
+        self.ap.write((txn.txn_id, txn, expected))
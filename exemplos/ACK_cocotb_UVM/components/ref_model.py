@@ -0,0 +1,67 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: ref_model.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Ref_model: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+
+'''
+Modelo de referência do ACK, sem dependência do cocotb/pyuvm (usado pelo Predictor e
+por ferramentas fora da simulação).
+
+Com g_ack e f_saia ativos o ACK responde com o quadro formado pelas palavras 130, 131
+e 132 da NVM (48 bits, a palavra 130 nos bits mais significativos); caso contrário a
+linha fica em 0.
+'''
+ACK_WORDS = (130, 131, 132)
+
+def ack_frame(words):
+    """Quadro de 48 bits a partir das palavras (w130, w131, w132)."""
+    w130, w131, w132 = words
+    return ((w130 & 0xFFFF) << 32) | ((w131 & 0xFFFF) << 16) | (w132 & 0xFFFF)
+
+def expected_response(words, g_ack, f_saia):
+    """Resposta esperada do ACK para uma transação."""
+    if not g_ack or not f_saia:
+        return 0
+    return ack_frame(words)
+
+def expected_responses(w130, w131, w132, g_ack, f_saia):
+    """Versão vetorizada de expected_response (arrays NumPy uint64 ou inteiros), para o checker offline."""
+    return ack_frame((w130, w131, w132)) * ((g_ack != 0) & (f_saia != 0))
+
+def nvm_words(nvm):
+    """Palavras do quadro lidas de uma NVM (NvmModel ou dicionário endereço -> valor)."""
+    return tuple(nvm[addr] for addr in ACK_WORDS)
@@ -0,0 +1,67 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: schedule.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Schedule: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+from collections import namedtuple
+
+'''
+A temporização do protocolo é descrita como dados: cada passo diz "após N bordas de subida
+do clock, aplique estes valores nas portas". O BFM dorme todo o intervalo de um passo com
+um único Timer, então o custo em Python por transação não depende do tamanho dos intervalos.
+
+Os valores podem ser constantes ou o nome de um campo do SeqItem (ex.: "g_ack").
+'''
+Step = namedtuple("Step", ["cycles", "signals"])
+
+ACK_SCHEDULE = (
+    Step(2,   {"g_ack_i": "g_ack"}),
+    Step(15,  {"dt_proc_ctrl_i": "dt_proc_ctrl"}),
+    Step(5,   {"f_saia_i": "f_saia"}),
+    Step(30,  {"dt_proc_ctrl_i": 0}),
+    Step(100, {"g_ack_i": 0, "f_saia_i": 0, "dt_proc_ctrl_i": 0}),
+    Step(10,  {}),
+)
+
+def with_gaps(gaps, schedule=ACK_SCHEDULE):
+    """Retorna uma cópia do schedule trocando a quantidade de ciclos de cada passo."""
+    if len(gaps) != len(schedule):
+        raise ValueError(f"Esperados {len(schedule)} intervalos, recebidos {len(gaps)}")
+    return tuple(Step(int(cycles), step.signals) for cycles, step in zip(gaps, schedule))
+
+def total_cycles(schedule):
+    """Duração total da transação em ciclos de clock."""
+    return sum(step.cycles for step in schedule)
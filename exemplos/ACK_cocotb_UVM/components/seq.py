@@ -36,18 +36,20 @@
 #----------------------------------------------------------------------------------------------------------------------------
 
 #Instâncias de bibliotecas:
+import random
 from pyuvm import *
 from pyuvm import uvm_sequence
-from .seq_item import SeqItem
+from .seq_item import SeqItem, SeqItemPool
 from .coverage import CoverageBins
+from .defs import g_ack, dt_proc_ctrl, f_saia
 
 class ACKCoverageSeq(uvm_sequence):
     """
     Este é responsável por gerenciar e enviar os dados sequenciados.
     """
     async def body(self):
+        clk = ConfigDB().get(None, "", "CLK_PERIOD")
         for g_ack, dt_proc_ctrl, f_saia in CoverageBins:
-            clk = ConfigDB().get(None, "", "CLK_PERIOD")
             item = SeqItem(
                 name="ack_cov",
                 clk=clk, 
@@ -59,5 +61,107 @@ class ACKCoverageSeq(uvm_sequence):
             await self.start_item(item)
             await self.finish_item(item)
 
+class ACKAdaptiveSeq(uvm_sequence):
+    """
+    Sequência dirigida pela cobertura: antes de cada transação consulta o CoverDB do
+    Coverage (ConfigDB "COVERAGE") e gera o próximo SeqItem para um bin ainda abaixo
+    da meta, olhando primeiro os crosses e depois os coverpoints; os campos que o bin
+    não fixa são sorteados. Entre os bins pendentes, o menos atingido é o escolhido.
+
+    Só contam os hits desde o início da sequência, então cada corner fecha a sua própria
+    cobertura. Termina quando COVERAGE_GOAL (% dos bins, padrão 100) tiver pelo menos
+    COVERAGE_MIN_HITS hits (padrão 1), ou após COVERAGE_MAX_ITEMS transações (padrão 1000).
+    """
+    FIELDS = {"g_ack": g_ack, "dt_proc_ctrl": dt_proc_ctrl, "f_saia": f_saia}
+
+    @staticmethod
+    def config(key, default):
+        try:
+            return ConfigDB().get(None, "", key)
+        except UVMConfigItemNotFound:
+            return default
+
+    async def body(self):
+        db = ConfigDB().get(None, "", "COVERAGE").db
+        goal = self.config("COVERAGE_GOAL", 100.0)
+        min_hits = self.config("COVERAGE_MIN_HITS", 1)
+        max_items = self.config("COVERAGE_MAX_ITEMS", 1000)
+        clk = ConfigDB().get(None, "", "CLK_PERIOD")
+        since = db.snapshot()
+        self.items_sent = 0
 
+        while self.items_sent < max_items and db.closure(min_hits, since) < goal:
+            item = SeqItem(name="ack_adaptive", clk=clk, **self.next_values(db, min_hits, since))
 
+            await self.start_item(item)
+            await self.finish_item(item)
+            self.items_sent += 1
+
+    def next_values(self, db, min_hits, since):
+        """Campos do próximo item: o bin pendente menos atingido, com o restante sorteado."""
+        values = {}
+        for name, point in sorted(db.points.items(), key=lambda kv: kv[1]["cross"] is None):
+            fields = point["cross"] or [name]
+            if not all(f in self.FIELDS for f in fields):
+                continue
+            pending = [(n, b) for b, n in db.hits(name, since) if n < min_hits]
+            if pending:
+                fewest = min(n for n, _ in pending)
+                target = random.choice([b for n, b in pending if n == fewest])
+                values = dict(zip(fields, target if point["cross"] else (target,)))
+                break
+        for field, enum in self.FIELDS.items():
+            values[field] = enum(values[field]) if field in values else random.choice(list(enum))
+        return values
+
+def stream_fields(rng, count, modes=CoverageBins, weights=None):
+    """
+    Gera lazily `count` tuplas (g_ack, dt_proc_ctrl, f_saia) sorteadas entre os modos
+    permitidos (restrição), com pesos opcionais. Nada é guardado além do gerador.
+    """
+    modes = [tuple(m) for m in modes]
+    cum = None
+    if weights is not None:
+        cum, total = [], 0
+        for w in weights:
+            total += w
+            cum.append(total)
+    for _ in range(count):
+        if cum is None:
+            yield modes[rng.randrange(len(modes))]
+        else:
+            yield rng.choices(modes, cum_weights=cum)[0]
+
+class ACKStreamSeq(uvm_sequence):
+    """
+    Sequência para soak tests de 10^5 a 10^6 transações. Os itens saem de um gerador
+    (stream_fields) com semente própria e são reaproveitados por um SeqItemPool, e a
+    configuração é lida uma única vez por sequência, então o custo de geração e a
+    memória não crescem com o número de transações.
+
+    ConfigDB: STREAM_COUNT (padrão 1000), STREAM_SEED (padrão: derivada da seed do
+    cocotb), STREAM_MODES (padrão CoverageBins) e STREAM_WEIGHTS (um peso por modo).
+    """
+    @staticmethod
+    def config(key, default):
+        try:
+            return ConfigDB().get(None, "", key)
+        except UVMConfigItemNotFound:
+            return default
+
+    async def body(self):
+        clk = ConfigDB().get(None, "", "CLK_PERIOD")
+        count = self.config("STREAM_COUNT", 1000)
+        seed = self.config("STREAM_SEED", None)
+        rng = random.Random(random.getrandbits(32) if seed is None else seed)
+        modes = self.config("STREAM_MODES", CoverageBins)
+        weights = self.config("STREAM_WEIGHTS", None)
+        pool = SeqItemPool("ack_stream")
+        self.items_sent = 0
+
+        for g_ack, dt_proc_ctrl, f_saia in stream_fields(rng, count, modes, weights):
+            item = pool.acquire(clk, g_ack, dt_proc_ctrl, f_saia)
+            await self.start_item(item)
+            await self.finish_item(item)
+            pool.release(item)
+            self.items_sent += 1
@@ -37,17 +37,34 @@
 #Instâncias de bibliotecas:
 
 from pyuvm import uvm_sequence_item
+from .schedule import ACK_SCHEDULE
 
 class SeqItem(uvm_sequence_item):
     """
     Este quem encapsula o envio de dados de modo unitário para o DUT.
     """
-    def __init__(self, name, clk, g_ack, dt_proc_ctrl, f_saia):
+    def __init__(self, name, clk, g_ack, dt_proc_ctrl, f_saia, schedule=ACK_SCHEDULE):
         super().__init__(name)
         self.clk = clk
         self.g_ack = g_ack
         self.dt_proc_ctrl = dt_proc_ctrl
         self.f_saia = f_saia
+        self.schedule = schedule    # Temporização da transação (ver schedule.py)
+        self.start_ns = None        # Instante em que o driver começou a transação
+        self.txn_id = None          # ID atribuído pelo BFM no envio
+        self.nvm_words = None       # NVM[130..132] no envio, usados pelo Predictor
+
+    def reuse(self, clk, g_ack, dt_proc_ctrl, f_saia, schedule=ACK_SCHEDULE):
+        """Refills a finished item so it can be sent again (see SeqItemPool)."""
+        self.clk = clk
+        self.g_ack = g_ack
+        self.dt_proc_ctrl = dt_proc_ctrl
+        self.f_saia = f_saia
+        self.schedule = schedule
+        self.start_ns = None
+        self.txn_id = None
+        self.nvm_words = None
+        return self
 
     def __str__(self):
         s = (f"clk:          {self.clk:<6} | "
@@ -55,5 +72,49 @@ class SeqItem(uvm_sequence_item):
              f"dt_proc_ctrl: {self.dt_proc_ctrl:<6} | "
              f"f_saia:       {self.f_saia:<6} | ")
         return s
+
+class AckTxn:
+    """
+    Registro compacto de uma transação já executada, publicado pelo driver no lugar do
+    SeqItem: só os campos usados pelo scoreboard e pela cobertura, com __slots__.
+    Assim o SeqItem (que carrega os eventos do pyuvm) pode voltar para o pool logo após
+    o item_done, mesmo que o scoreboard ainda não tenha consumido a transação.
+    """
+    __slots__ = ("clk", "g_ack", "dt_proc_ctrl", "f_saia", "start_ns", "txn_id", "nvm_words")
+
+    def __init__(self, clk, g_ack, dt_proc_ctrl, f_saia, start_ns=None, txn_id=None, nvm_words=None):
+        self.clk = clk
+        self.g_ack = g_ack
+        self.dt_proc_ctrl = dt_proc_ctrl
+        self.f_saia = f_saia
+        self.start_ns = start_ns
+        self.txn_id = txn_id
+        self.nvm_words = nvm_words
+
+    @classmethod
+    def from_item(cls, item):
+        return cls(item.clk, item.g_ack, item.dt_proc_ctrl, item.f_saia, item.start_ns, item.txn_id, item.nvm_words)
+
+    __str__ = SeqItem.__str__
+
+class SeqItemPool:
+    """
+    Pool de SeqItem para sequências longas: cada item devolvido é reaproveitado, então
+    o número de objetos (e de eventos do pyuvm) não cresce com o número de transações.
+    Um item só pode ser devolvido depois do finish_item.
+    """
+    def __init__(self, name="ack_item"):
+        self.name = name
+        self.free = []
+        self.created = 0
+
+    def acquire(self, clk, g_ack, dt_proc_ctrl, f_saia, schedule=ACK_SCHEDULE):
+        if self.free:
+            return self.free.pop().reuse(clk, g_ack, dt_proc_ctrl, f_saia, schedule)
+        self.created += 1
+        return SeqItem(self.name, clk, g_ack, dt_proc_ctrl, f_saia, schedule)
+
+    def release(self, item):
+        self.free.append(item)
     
 
@@ -0,0 +1,154 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: serial_decoder.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Serial decoder: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+from array import array
+from collections import namedtuple
+import cocotb                                                               # type: ignore
+from cocotb.triggers import Edge, RisingEdge, First                         # type: ignore
+from cocotb.utils import get_sim_time                                       # type: ignore
+
+'''
+Decodificador de saídas seriais (bit a bit, MSB primeiro) orientado a eventos.
+Em vez de amostrar o dado a cada borda de clock, o decodificador só acorda nas mudanças
+de valor do endereço, do strobe de fim de quadro e da própria linha de dados. Como cada
+bit vale o nível da linha logo antes da borda de subida, os bits são reconstruídos pelos
+instantes das transições e pelo período do clock, preenchendo um buffer pré-alocado.
+'''
+Frame = namedtuple("Frame", ["data", "nbits", "t_start", "t_end"])   # tempos em ns
+
+_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+
+def assemble_bits(buf, level, times, levels, t_start, period, nbits):
+    """
+    Monta os nbits do quadro em buf (bytearray de 0/1) e retorna o inteiro correspondente.
+    level é o valor da linha na primeira borda (t_start); times/levels são as transições
+    posteriores (mesma unidade de t_start e period). Uma transição em t vale a partir da
+    primeira borda estritamente posterior a t.
+    """
+    pos = 0
+    for t, new_level in zip(times, levels):
+        k = (t - t_start) // period + 1
+        if k >= nbits:
+            break
+        if k > pos:
+            buf[pos:k] = (b"\x01" if level else b"\x00") * (k - pos)
+            pos = k
+        level = new_level
+    buf[pos:nbits] = (b"\x01" if level else b"\x00") * (nbits - pos)
+    return int(buf[:nbits].translate(_ASCII), 2)
+
+class SerialDecoder:
+    """
+    Captura quadros seriais de tamanho qualquer: o quadro começa na primeira borda após o
+    endereço atingir start_addr e termina na primeira borda após o strobe de fim (done).
+    Os quadros completos são entregues aos assinantes (subscribe) com seus tempos de início e fim.
+    As portas (clk, data, done, addr são nomes) são lidas e esperadas pelo DutIf `io`, que
+    conta as travessias pela VPI em `vpi` (VpiCounter do trecho que usa o decodificador).
+    """
+    def __init__(self, io, clk, data, done, addr, start_addr, clock, vpi, capacity=256):
+        self.io = io
+        self.clk = clk
+        self.data = data
+        self.done = done
+        self.addr = addr
+        self.start_addr = start_addr
+        self.clock = clock                  # SimClock, fornece o período atual
+        self.vpi = vpi
+        self._buf = bytearray(capacity)
+        self._times = array("q")
+        self._levels = bytearray()
+        self._subscribers = []
+        self.frames = 0
+        self.bits_decoded = 0
+
+    def subscribe(self, callback):
+        """Registra uma função chamada com cada Frame publicado."""
+        self._subscribers.append(callback)
+
+    def _at_start(self):
+        return self.io.read(self.addr, self.vpi) == self.start_addr
+
+    async def _wait_start(self):
+        while not self._at_start():
+            await self.io.trigger(Edge, self.addr, self.vpi)
+
+    async def _collect(self):
+        io, data, vpi = self.io, self.data, self.vpi
+        while True:
+            await io.trigger(Edge, data, vpi)
+            self._times.append(int(get_sim_time(units="ps")))
+            self._levels.append(io.read(data, vpi))
+
+    async def capture(self, window):
+        """
+        Aguarda o início de um quadro por até 'window' ciclos e o decodifica por completo.
+        Retorna o Frame ou None se o endereço de início não apareceu dentro da janela.
+        """
+        io, vpi = self.io, self.vpi
+        period = int(round(self.clock.period * 1000))       # ps
+        if not self._at_start():
+            search = cocotb.start_soon(self._wait_start())
+            await First(search.join(), io.timer(window * period, vpi, units="ps"))
+            if not search.done():
+                search.kill()
+                return None
+
+        await io.trigger(RisingEdge, self.clk, vpi)
+        t_start = int(get_sim_time(units="ps"))
+        level, done = io.sample((self.data, self.done), vpi)
+        del self._times[:]
+        del self._levels[:]
+        collector = cocotb.start_soon(self._collect())
+
+        if not done:
+            await io.trigger(RisingEdge, self.done, vpi)
+            await io.trigger(RisingEdge, self.clk, vpi)
+        t_end = int(get_sim_time(units="ps"))
+        collector.kill()
+
+        nbits = (t_end - t_start + period // 2) // period + 1
+        if nbits > len(self._buf):
+            self._buf = bytearray(1 << (nbits - 1).bit_length())
+        data = assemble_bits(self._buf, level, self._times, self._levels, t_start, period, nbits)
+
+        frame = Frame(data, nbits, t_start / 1000, t_end / 1000)
+        self.frames += 1
+        self.bits_decoded += nbits
+        for callback in self._subscribers:
+            callback(frame)
+        return frame
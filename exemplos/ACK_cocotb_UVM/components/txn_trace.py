@@ -0,0 +1,337 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: txn_trace.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Txn_trace: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+try:
+    import numpy as np
+except ImportError:                 #Sem NumPy a verificação é feita registro a registro
+    np = None
+
+try:
+    from .ref_model import expected_response, expected_responses
+except ImportError:                 #Executado como script (python3 components/txn_trace.py)
+    from ref_model import expected_response, expected_responses
+
+'''
+Trace binário das transações do ACK, para verificação fora do simulador (modo
+SCOREBOARD_TRACE do Scoreboard, sem dependência do cocotb).
+
+Durante a simulação só se grava: cada comando do driver (ID, início, modos e as palavras
+130..132 da NVM) e cada resposta do monitor (ID e quadro) viram um registro de tamanho
+fixo, acumulado em memória e escrito em blocos de `batch` registros. Depois (ou ao mesmo
+tempo, com --follow) este script passa o trace pelo modelo de referência, bloco a bloco
+e de forma vetorizada com NumPy, e um trace com falha pode ser re-verificado quantas
+vezes for preciso sem simular de novo.
+
+Formato: TRACE_MAGIC, tamanho (uint32) e cabeçalho JSON (seed, batch), seguidos de blocos
+(tipo uint8, número de registros uint32, registros). O bloco do tipo END fecha o trace.
+
+    python3 components/txn_trace.py check final_results/ack_trace.bin
+    python3 components/txn_trace.py check ack_trace.bin --follow      #junto com a simulação
+'''
+TRACE_MAGIC = b"ACKTRC1\n"
+HEADER = struct.Struct("<I")
+CHUNK = struct.Struct("<BI")
+KIND_END, KIND_CMD, KIND_RESULT = 0, 1, 2
+CMD = struct.Struct("<QddBBBHHH")       #txn_id, start_ns, clk, g_ack, dt_proc_ctrl, f_saia, w130, w131, w132
+RESULT = struct.Struct("<QQ")           #txn_id, quadro recebido
+RECORDS = {KIND_CMD: CMD, KIND_RESULT: RESULT}
+DATA_MAX = (1 << 64) - 1                #Respostas maiores são saturadas (nunca iguais ao quadro de 48 bits)
+
+if np is not None:
+    CMD_DTYPE = np.dtype([("txn_id", "<u8"), ("start_ns", "<f8"), ("clk", "<f8"), ("g_ack", "u1"),
+                          ("dt_proc_ctrl", "u1"), ("f_saia", "u1"), ("w130", "<u2"), ("w131", "<u2"), ("w132", "<u2")])
+    RESULT_DTYPE = np.dtype([("txn_id", "<u8"), ("data", "<u8")])
+
+class TraceWriter:
+    """Grava comandos e respostas em blocos; cada bloco completo vai para o disco com flush."""
+    def __init__(self, path, batch=4096, meta=None):
+        self.path = path
+        self.batch = batch
+        self.buffers = {KIND_CMD: bytearray(), KIND_RESULT: bytearray()}
+        self.counts = {KIND_CMD: 0, KIND_RESULT: 0}
+        self.written = {KIND_CMD: 0, KIND_RESULT: 0}
+        self.f = open(path, "wb")
+        header = json.dumps(dict(meta or {}, batch=batch)).encode()
+        self.f.write(TRACE_MAGIC + HEADER.pack(len(header)) + header)
+        self.f.flush()
+
+    def cmd(self, txn):
+        w130, w131, w132 = txn.nvm_words
+        self.buffers[KIND_CMD] += CMD.pack(txn.txn_id, txn.start_ns or 0.0, txn.clk, txn.g_ack, txn.dt_proc_ctrl,
+                                           txn.f_saia, w130, w131, w132)
+        self._count(KIND_CMD)
+
+    def result(self, txn_id, data):
+        self.buffers[KIND_RESULT] += RESULT.pack(txn_id, min(data, DATA_MAX))
+        self._count(KIND_RESULT)
+
+    def _count(self, kind):
+        self.counts[kind] += 1
+        if self.counts[kind] >= self.batch:
+            self._write_chunk(kind)
+            self.f.flush()
+
+    def _write_chunk(self, kind):
+        if self.counts[kind]:
+            self.f.write(CHUNK.pack(kind, self.counts[kind]))
+            self.f.write(self.buffers[kind])
+            self.written[kind] += self.counts[kind]
+            self.buffers[kind].clear()
+            self.counts[kind] = 0
+
+    def flush(self):
+        for kind in self.buffers:
+            self._write_chunk(kind)
+        self.f.flush()
+
+    def close(self):
+        if not self.f.closed:
+            self.flush()
+            self.f.write(CHUNK.pack(KIND_END, 0))
+            self.f.close()
+
+#----------------------------------------------------------------------------
+#Leitura:
+#----------------------------------------------------------------------------
+def read_header(f):
+    if f.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+        raise ValueError(f"{f.name}: não é um trace do ACK")
+    size, = HEADER.unpack(f.read(HEADER.size))
+    return json.loads(f.read(size))
+
+def read_chunks(f, follow=False, poll=0.2, idle_timeout=None):
+    """Gera (tipo, bytes dos registros) até o bloco END. Com follow, espera os blocos ainda não gravados."""
+    idle = 0.0
+    while True:
+        pos = f.tell()
+        head = f.read(CHUNK.size)
+        if len(head) == CHUNK.size:
+            kind, n = CHUNK.unpack(head)
+            if kind == KIND_END:
+                return
+            size = n * RECORDS[kind].size
+            body = f.read(size)
+            if len(body) == size:
+                idle = 0.0
+                yield kind, body
+                continue
+        #Bloco incompleto: fim de um trace interrompido, ou a simulação ainda está gravando
+        f.seek(pos)
+        if not follow or (idle_timeout is not None and idle >= idle_timeout):
+            return
+        yield None, None                #Avisa o chamador que não há mais nada por enquanto
+        time.sleep(poll)
+        idle += poll
+
+#----------------------------------------------------------------------------
+#Verificação pelo modelo de referência:
+#----------------------------------------------------------------------------
+class OfflineChecker:
+    """Casa comandos e respostas pelo ID e compara com o modelo de referência, em lotes."""
+    def __init__(self, max_failures=100):
+        self.max_failures = max_failures
+        self.checked = 0
+        self.fail_count = 0
+        self.failures = []
+        self.cmd_chunks = []
+        self.result_chunks = []
+        if np is not None:
+            self.pending_cmds = np.empty(0, CMD_DTYPE)
+            self.pending_results = np.empty(0, RESULT_DTYPE)
+        else:
+            self.pending_cmds = {}
+            self.pending_results = {}
+
+    def add(self, kind, body):
+        (self.cmd_chunks if kind == KIND_CMD else self.result_chunks).append(body)
+
+    def run(self):
+        """Verifica tudo o que foi lido desde a última chamada; o que ficou sem par espera a próxima."""
+        cmds, results = b"".join(self.cmd_chunks), b"".join(self.result_chunks)
+        self.cmd_chunks, self.result_chunks = [], []
+        if np is not None:
+            self._run_numpy(cmds, results)
+        else:
+            self._run_python(cmds, results)
+
+    def _run_numpy(self, cmds, results):
+        cmds = self._unique(np.concatenate((self.pending_cmds, np.frombuffer(cmds, CMD_DTYPE))), "comando")
+        results = self._unique(np.concatenate((self.pending_results, np.frombuffer(results, RESULT_DTYPE))), "resposta")
+        _, ci, ri = np.intersect1d(cmds["txn_id"], results["txn_id"], assume_unique=True, return_indices=True)
+        c, r = cmds[ci], results[ri]
+        expected = expected_responses(c["w130"].astype(np.int64), c["w131"].astype(np.int64),
+                                      c["w132"].astype(np.int64), c["g_ack"], c["f_saia"])
+        got = r["data"].astype(np.int64)        #Saturadas viram -1: continuam diferentes do esperado
+        bad = np.flatnonzero(expected != got)
+        self.checked += len(c)
+        self.fail_count += len(bad)
+        for k in bad[:max(0, self.max_failures - len(self.failures))]:
+            self._failure(c[k].item(), int(expected[k]), int(r["data"][k]))
+        keep_c = np.ones(len(cmds), bool)
+        keep_c[ci] = False
+        keep_r = np.ones(len(results), bool)
+        keep_r[ri] = False
+        self.pending_cmds, self.pending_results = cmds[keep_c], results[keep_r]
+
+    def _unique(self, recs, what):
+        """Mantém o primeiro registro de cada ID; os repetidos são falhas (intersect1d exige IDs únicos)."""
+        _, first = np.unique(recs["txn_id"], return_index=True)
+        if len(first) == len(recs):
+            return recs
+        repeated = np.ones(len(recs), bool)
+        repeated[first] = False
+        for txn_id in recs["txn_id"][repeated]:
+            self._duplicate(what, int(txn_id))
+        return recs[np.sort(first)]
+
+    def _run_python(self, cmds, results):
+        for rec in CMD.iter_unpack(cmds):
+            if rec[0] in self.pending_cmds:
+                self._duplicate("comando", rec[0])
+            else:
+                self.pending_cmds[rec[0]] = rec
+        for txn_id, data in RESULT.iter_unpack(results):
+            if txn_id in self.pending_results:
+                self._duplicate("resposta", txn_id)
+            else:
+                self.pending_results[txn_id] = data
+        for txn_id in [t for t in self.pending_results if t in self.pending_cmds]:
+            rec = self.pending_cmds.pop(txn_id)
+            data = self.pending_results.pop(txn_id)
+            expected = expected_response(rec[6:9], rec[3], rec[5])
+            self.checked += 1
+            if data != expected:
+                self.fail_count += 1
+                if len(self.failures) < self.max_failures:
+                    self._failure(rec, expected, data)
+
+    def _duplicate(self, what, txn_id):
+        """ID repetido no trace (resposta repetida, traces concatenados de dois runs): falha sem comparação."""
+        self.fail_count += 1
+        if len(self.failures) < self.max_failures:
+            self.failures.append({
+                "txn_id": txn_id,
+                "start_ns": 0.0,
+                "item": f"{what} com ID repetido",
+                "expected": None,
+                "got": None,
+            })
+
+    def _failure(self, rec, expected, got):
+        txn_id, start_ns, clk, g_ack, dt_proc_ctrl, f_saia = rec[:6]
+        self.failures.append({
+            "txn_id": int(txn_id),
+            "start_ns": float(start_ns),
+            "item": f"clk: {clk:g} | g_ack: {g_ack} | dt_proc_ctrl: {dt_proc_ctrl} | f_saia: {f_saia}",
+            "expected": expected,
+            "got": got,
+        })
+
+    def unmatched(self):
+        return len(self.pending_cmds), len(self.pending_results)
+
+def check_trace(path, follow=False, idle_timeout=None, max_failures=100, log=print):
+    """Verifica um trace inteiro (ou acompanha um em gravação); devolve (cabeçalho, OfflineChecker)."""
+    checker = OfflineChecker(max_failures)
+    with open(path, "rb") as f:
+        meta = read_header(f)
+        for kind, body in read_chunks(f, follow, idle_timeout=idle_timeout):
+            if kind is None:            #Em --follow: verifica o que chegou enquanto espera mais blocos
+                fails = checker.fail_count
+                checker.run()
+                if checker.fail_count > fails:
+                    log(f"{checker.fail_count} falha(s) em {checker.checked} transações verificadas")
+                continue
+            checker.add(kind, body)
+            if len(checker.cmd_chunks) + len(checker.result_chunks) >= 64:
+                checker.run()
+        checker.run()
+    return meta, checker
+
+def mark_results(path, message):
+    """Marca os testcases do results.xml do cocotb como falhos (a simulação em si não verifica nada)."""
+    tree = ET.parse(path)
+    for tc in tree.getroot().iter("testcase"):
+        if tc.find("failure") is None and tc.find("error") is None:
+            ET.SubElement(tc, "failure", message=message)
+    tree.write(path)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Verifica um trace do ACK (SCOREBOARD_TRACE) pelo modelo de referência.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    c = sub.add_parser("check", help="Compara respostas e modelo de referência")
+    c.add_argument("trace", nargs="+", help="Um ou mais traces (um por cópia do DUT com ACK_INSTANCES > 1)")
+    c.add_argument("--follow", action="store_true", help="Acompanha um trace ainda em gravação até o fim")
+    c.add_argument("--idle-timeout", type=float, default=None, help="Com --follow, desiste após N s sem dados")
+    c.add_argument("--failures", default=None, help="Grava as falhas neste arquivo (formato do failure.json)")
+    c.add_argument("--results", default=None, help="results.xml a marcar como falho se houver falhas")
+    c.add_argument("--show", type=int, default=10, help="Falhas mostradas no terminal")
+    opt = ap.parse_args(argv)
+
+    start = time.perf_counter()
+    failures, fail_count, seed = [], 0, None
+    for path in opt.trace:
+        meta, checker = check_trace(path, opt.follow, opt.idle_timeout)
+        seed = meta.get("seed", seed)
+        for fl in checker.failures[:opt.show]:
+            print(f"FAILED txn {fl['txn_id']} @ {fl['start_ns']:.0f} ns ({fl['item']}): "
+                  f"expected {fl['expected']}, got {fl['got']}")
+        cmds, results = checker.unmatched()
+        print(f"{path}: {checker.checked} transações verificadas, {checker.fail_count} falha(s), {cmds} sem resposta, "
+              f"{results} respostas sem comando ({time.perf_counter() - start:.2f} s)")
+        failures += [dict(fl, trace=path) for fl in checker.failures] if len(opt.trace) > 1 else checker.failures
+        fail_count += checker.fail_count
+    if fail_count:
+        if opt.failures:
+            with open(opt.failures, "w") as f:
+                json.dump({"seed": seed, "failures": failures}, f, indent=2)
+        if opt.results and os.path.exists(opt.results):
+            mark_results(opt.results, f"{fail_count} failures detected by the offline check of {', '.join(opt.trace)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,13 +36,23 @@
 #----------------------------------------------------------------------------------------------------------------------------
 
 #Instâncias de bibliotecas:
+import re
+import sys
+import random
+from array import array
 import cocotb
+from cocotb.triggers import RisingEdge
+from cocotb.utils import get_sim_time
+from .dut_if import DutIf
 
 '''
 No Utils é possível alocar gemeos virtuais que irão emular comportamentos de blocos auxiliares,
 na verificação do ACK este foi utilizado para virtualizar a memória NVM.
+
+NVM_INIT guarda o conteúdo padrão da memória, usado quando o teste não informa
+uma imagem própria (ConfigDB "NVM_IMAGE").
 '''
-NVM = {
+NVM_INIT = {
     # RESERVERD
     0x000 :  0,#(AK >> 112) & 0xFFFF, 
     0x001 :  1,#(AK >> 96) & 0xFFFF,
@@ -82,40 +92,295 @@ NVM = {
     0x187 : 187 #DATA64 & 0xFFFF   # seleciona os 16 LSB
 }
 
-async def mem_ctrl(self):
-    while True:
-        await cocotb.triggers.Timer(1, units="ns")
-        await cocotb.triggers.RisingEdge(self.dut.nvm_ack_rd_stb_o)
-        await cocotb.triggers.Timer(10, units="ns")
-
-        rst_mem_ctrl = 1 #modificar para os sinais que seu bloco usar
-        nvm_wr_en_mem_ctrl = 0
-        nvm_rd_en_mem_ctrl = self.dut.nvm_ack_rd_stb_o.value
-        nvm_addr_mem_ctrl = self.dut.nvm_ack_addr_o.value
-        nvm_wr_dt_mem_ctrl = 0
-
-        if rst_mem_ctrl:
-            if (nvm_rd_en_mem_ctrl and not nvm_wr_en_mem_ctrl):  # leitura
-                self.nvm_busy_mem_ctrl = 1
-                #self.dut.nvm_busy_i.value = self.nvm_busy_mem_ctrl
-                self.nvm_rd_dt_mem_ctrl = NVM[int(nvm_addr_mem_ctrl)]
-                self.dut.nvm_rd_dt_i.value = self.nvm_rd_dt_mem_ctrl  
-                await cocotb.triggers.Timer(2000, units="ns")
-                self.nvm_busy_mem_ctrl = 0
-                #self.dut.nvm_busy_i.value = self.nvm_busy_mem_ctrl
-            elif (not nvm_rd_en_mem_ctrl and nvm_wr_en_mem_ctrl):  # escrita
-                self.nvm_busy_mem_ctrl = 1
-                #self.dut.nvm_busy_i.value = self.nvm_busy_mem_ctrl
-                NVM[int(nvm_addr_mem_ctrl)] = int(nvm_wr_dt_mem_ctrl)
-                await cocotb.triggers.Timer(4000, units="ns")
-                self.nvm_busy_mem_ctrl = 0
-                #self.dut.nvm_busy_i.value = self.nvm_busy_mem_ctrl
-            else:   # nenhuma operação ou operações concorrentes
-                self.nvm_busy_mem_ctrl = 0
-                #self.dut.nvm_busy_i.value = self.nvm_busy_mem_ctrl
-                self.nvm_rd_dt_mem_ctrl = 0
+_COMMENTS = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+
+class NvmModel:
+    """
+    Modelo da memória NVM em um array compacto (uma palavra por endereço).
+    O tamanho padrão cobre os 9 bits de nvm_ack_addr_o e pode ser aumentado por addr_bits,
+    endereços nunca escritos leem 0. Carrega/grava imagens no formato do $readmemh/$readmemb
+    e imagens binárias cruas, e permite salvar/restaurar o conteúdo entre transações.
+    """
+    def __init__(self, addr_bits=9, width=16, init=None):
+        self.addr_bits = addr_bits
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.typecode = "H" if width <= 16 else ("I" if width <= 32 else "Q")
+        self.mem = array(self.typecode, [0]) * (1 << addr_bits)
+        if init:
+            for addr, value in init.items():
+                self[addr] = value
+
+    def __len__(self):
+        return len(self.mem)
+
+    def __getitem__(self, addr):
+        return self.mem[addr]
+
+    def __setitem__(self, addr, value):
+        self.mem[addr] = int(value) & self.mask
+
+    #----------------------------------------------------------------------------
+    #Salvar/restaurar (cópia direta do buffer):
+    #----------------------------------------------------------------------------
+    def snapshot(self):
+        """Retorna uma cópia do conteúdo atual."""
+        return self.mem[:]
+
+    def restore(self, snapshot):
+        """Volta a memória para um conteúdo salvo por snapshot()."""
+        self.mem[:] = snapshot
+
+    #----------------------------------------------------------------------------
+    #Imagens no formato $readmemh / $readmemb:
+    #----------------------------------------------------------------------------
+    def load_hex(self, path):
+        """Carrega uma imagem no formato do $readmemh (aceita comentários e @endereço)."""
+        self._load_text(path, 16)
+
+    def load_bin(self, path):
+        """Carrega uma imagem no formato do $readmemb."""
+        self._load_text(path, 2)
+
+    def dump_hex(self, path):
+        """Grava a memória inteira no formato do $readmemh (uma palavra por linha)."""
+        data = self.mem[:]
+        if sys.byteorder == "little":
+            data.byteswap()
+        with open(path, "w") as f:
+            f.write(data.tobytes().hex("\n", data.itemsize))
+            f.write("\n")
+
+    def dump_bin(self, path):
+        """Grava a memória inteira no formato do $readmemb."""
+        with open(path, "w") as f:
+            f.write("\n".join(format(word, f"0{self.width}b") for word in self.mem))
+            f.write("\n")
+
+    def _load_text(self, path, base):
+        with open(path) as f:
+            text = f.read()
+        if base == 16 and self._load_hex_fast(text):
+            return
+        addr = 0
+        words = array(self.typecode)
+        for token in _COMMENTS.sub(" ", text).split():
+            if token.startswith("@"):
+                self._place(addr, words)
+                addr = int(token[1:], 16)
+                words = array(self.typecode)
+                continue
+            token = token.replace("_", "")
+            if any(c in "xXzZ" for c in token):
+                token = re.sub(r"[xXzZ]", "0", token)
+            words.append(int(token, base) & self.mask)
+        self._place(addr, words)
+
+    def _load_hex_fast(self, text):
+        # Caminho rápido para imagens com uma palavra de largura fixa por linha (como as
+        # geradas por dump_hex): o texto inteiro vira bytes de uma só vez, sem laço em Python.
+        digits = self.mem.itemsize * 2
+        stride = digits + 1
+        if not text or any(c in text for c in "@/_ \t\r"):
+            return False
+        if not text.endswith("\n"):
+            text += "\n"
+        lines = len(text) // stride
+        if len(text) % stride or text[digits::stride].count("\n") != lines:
+            return False
+        try:
+            words = array(self.typecode, bytes.fromhex(text))
+        except ValueError:
+            return False                    # x/z ou caracteres inválidos: usa o caminho geral
+        if sys.byteorder == "little":
+            words.byteswap()
+        self._place(0, words)
+        return True
+
+    #----------------------------------------------------------------------------
+    #Imagem binária crua (palavras em little-endian, sem separadores):
+    #----------------------------------------------------------------------------
+    def load_raw(self, path):
+        """Carrega uma imagem binária crua a partir do endereço 0."""
+        with open(path, "rb") as f:
+            words = array(self.typecode, f.read())
+        if sys.byteorder == "big":
+            words.byteswap()
+        self._place(0, words)
+
+    def dump_raw(self, path):
+        """Grava a memória inteira como imagem binária crua."""
+        data = self.mem[:]
+        if sys.byteorder == "big":
+            data.byteswap()
+        with open(path, "wb") as f:
+            data.tofile(f)
+
+    def load(self, path):
+        """Escolhe o formato pela extensão: .hex/.mem ($readmemh), .memb/.bmem ($readmemb) ou binário cru."""
+        ext = path.rsplit(".", 1)[-1].lower()
+        if ext in ("hex", "mem"):
+            self.load_hex(path)
+        elif ext in ("memb", "bmem"):
+            self.load_bin(path)
         else:
-            self.nvm_busy_mem_ctrl = 0
-            #self.dut.nvm_busy_i.value = self.nvm_busy_mem_ctrl
-            self.nvm_rd_dt_mem_ctrl = 0
+            self.load_raw(path)
+
+    def _place(self, addr, words):
+        if addr + len(words) > len(self.mem):
+            raise ValueError(
+                f"Imagem não cabe na NVM: {addr + len(words)} palavras para {len(self.mem)} endereços "
+                f"(aumente addr_bits)"
+            )
+        self.mem[addr:addr + len(words)] = words
+
+#----------------------------------------------------------------------------
+#Modelos de latência da NVM (tempo entre o strobe e o dado válido, em ns):
+#----------------------------------------------------------------------------
+class FixedLatency:
+    """Mesma latência para qualquer endereço."""
+    def __init__(self, ns):
+        self.ns = ns
+
+    def __call__(self, addr):
+        return self.ns
+
+class PerAddressLatency:
+    """Latência por endereço (dict endereço -> ns), com um valor padrão para os demais."""
+    def __init__(self, table, default):
+        self.table = table
+        self.default = default
+
+    def __call__(self, addr):
+        return self.table.get(addr, self.default)
+
+class RandomLatency:
+    """Latência aleatória entre low e high (uniforme, ou triangular quando mode é informado)."""
+    def __init__(self, low, high, mode=None, seed=None):
+        self.low = low
+        self.high = high
+        self.mode = mode
+        self.rng = random.Random(seed)
+
+    def __call__(self, addr):
+        if self.mode is None:
+            return self.rng.uniform(self.low, self.high)
+        return self.rng.triangular(self.low, self.high, self.mode)
+
+class CycleLatency:
+    """Latência em ciclos do clock atual do DUT (acompanha a troca de corner)."""
+    def __init__(self, cycles, clock):
+        self.cycles = cycles
+        self.clock = clock
+
+    def __call__(self, addr):
+        return self.cycles * self.clock.period
+
+#----------------------------------------------------------------------------
+#Controlador da NVM:
+#----------------------------------------------------------------------------
+class NvmCtrl:
+    """
+    Gêmeo virtual do controlador da NVM, dirigido apenas pelo strobe de leitura do DUT.
+    Cada borda de subida de nvm_ack_rd_stb_o abre uma requisição: o endereço é amostrado
+    sample_delay ns depois, e o dado é colocado em nvm_rd_dt_i quando a latência do modelo
+    termina (as respostas saem na ordem dos pedidos). A requisição ocupa o controlador até
+    "busy" ns após o dado; com max_outstanding=1 os strobes nesse intervalo são descartados,
+    como no antigo mem_ctrl, valores maiores permitem pedidos sobrepostos (pipeline).
+    O modelo de latência pode ser trocado com a simulação em andamento (set_latency).
+    As portas são acessadas pelo DutIf do BFM, com as travessias contadas em "nvm_ctrl".
+    """
+    def __init__(self, dut, nvm, latency=None, busy=2000, max_outstanding=1, sample_delay=10):
+        self.dut = self.io = DutIf.wrap(dut)
+        self.vpi = self.io.site("nvm_ctrl")
+        self.nvm = nvm
+        self.latency = latency if latency is not None else FixedLatency(10)
+        self.busy = busy
+        self.max_outstanding = max_outstanding
+        self.sample_delay = sample_delay
+        self.outstanding = 0
+        self.dropped = 0
+        self._last_ready = 0
+        self._task = None
+        self.reset_stats()
+
+    def start(self):
+        """Começa a atender os strobes do DUT."""
+        if self._task is None:
+            self._task = cocotb.start_soon(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.kill()
+            self._task = None
+
+    def set_latency(self, latency):
+        """Troca o modelo de latência, vale para as próximas requisições."""
+        self.latency = latency
+
+    async def _run(self):
+        while True:
+            await self.io.trigger(RisingEdge, "nvm_ack_rd_stb_o", self.vpi)
+            if self.outstanding >= self.max_outstanding:
+                self.dropped += 1
+                continue
+            self.outstanding += 1
+            cocotb.start_soon(self._read(get_sim_time(units="ns")))
+
+    async def _read(self, t_req):
+        await self.io.timer(self.sample_delay, self.vpi)
+        addr = self.io.read("nvm_ack_addr_o", self.vpi)
+        latency = max(self.latency(addr), self.sample_delay)
+
+        # Respostas em ordem: um pedido nunca entrega antes do anterior
+        ready = max(t_req + latency, self._last_ready)
+        self._last_ready = ready
+        now = get_sim_time(units="ns")
+        if ready > now:
+            await self.io.timer(ready - now, self.vpi)
+        self.io.set("nvm_rd_dt_i", self.nvm[addr])
+        self.io.flush(self.vpi)
+        self._record(addr, get_sim_time(units="ns") - t_req)
+
+        await self.io.timer(self.busy, self.vpi)
+        self.outstanding -= 1
+
+    #----------------------------------------------------------------------------
+    #Estatísticas de latência por acesso:
+    #----------------------------------------------------------------------------
+    def reset_stats(self):
+        self.accesses = 0
+        self.lat_min = None
+        self.lat_max = None
+        self.lat_sum = 0.0
+        self.per_addr = {}
+
+    def _record(self, addr, latency):
+        self.accesses += 1
+        self.lat_sum += latency
+        if self.lat_min is None or latency < self.lat_min:
+            self.lat_min = latency
+        if self.lat_max is None or latency > self.lat_max:
+            self.lat_max = latency
+        self.per_addr[addr] = self.per_addr.get(addr, 0) + 1
+
+    def stats(self):
+        """Resumo das latências observadas desde o último reset_stats()."""
+        return {
+            "accesses": self.accesses,
+            "dropped": self.dropped,
+            "min_ns": self.lat_min,
+            "max_ns": self.lat_max,
+            "mean_ns": self.lat_sum / self.accesses if self.accesses else None,
+            "per_addr": dict(self.per_addr),
+        }
 
+    def report(self, logger):
+        s = self.stats()
+        if not s["accesses"]:
+            logger.info("NVM: nenhum acesso registrado")
+            return
+        logger.info(
+            f"NVM: {s['accesses']} leituras ({s['dropped']} strobes descartados) | "
+            f"latência min/média/max: {s['min_ns']:.1f}/{s['mean_ns']:.1f}/{s['max_ns']:.1f} ns"
+        )
@@ -0,0 +1,84 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: wave.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Wave: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+from contextlib import contextmanager
+from cocotb.utils import get_sim_time                                       # type: ignore
+
+class WaveControl:
+    """
+    Liga e desliga a gravação do dump.fst a partir do teste, através do reg dump_on
+    do wrapper (gerado pelo build_wrapper.sh). Escopo e profundidade são escolhidos
+    por plusargs (+dump_scope, +dump_depth, +no_dump), o que aqui se controla é a
+    janela de tempo: grava-se apenas o trecho de interesse da simulação.
+    Em wrappers antigos, sem o dump_on, os métodos não fazem nada.
+    """
+    def __init__(self, dut):
+        try:
+            self.dump_on = dut.dump_on
+        except AttributeError:
+            self.dump_on = None
+        self.windows = []                   #Janelas (início, fim) em ns gravadas até agora
+        self._start = 0 if self.dump_on is not None else None   #O wrapper começa gravando
+
+    @property
+    def available(self):
+        return self.dump_on is not None
+
+    def on(self):
+        """Resumes waveform recording ($dumpon)."""
+        if self.available:
+            self.dump_on.value = 1
+            if self._start is None:
+                self._start = get_sim_time(units="ns")
+
+    def off(self):
+        """Pauses waveform recording ($dumpoff)."""
+        if self.available:
+            self.dump_on.value = 0
+            if self._start is not None:
+                self.windows.append((self._start, get_sim_time(units="ns")))
+                self._start = None
+
+    @contextmanager
+    def window(self):
+        """Records only while the block runs: with bfm.wave.window(): await ..."""
+        self.on()
+        try:
+            yield self
+        finally:
+            self.off()
@@ -36,15 +36,40 @@
 #----------------------------------------------------------------------------------------------------------------------------
 #Instâncias de bibliotecas:
 
+import os
+import json
+import time
 import cocotb
 import pyuvm
 from pyuvm import *
+from cocotb.utils import get_sim_time
 
 from components.env import Env
 from components.bfm import Bfm
-from components.seq import ACKCoverageSeq
-from components.utils import mem_ctrl
+from components.seq import ACKCoverageSeq, ACKAdaptiveSeq, ACKStreamSeq
 
+#Corners de clock (período em ns). ACK_CORNERS escolhe quais rodar, ex.: ACK_CORNERS=1562,3126;
+#com um corner por simulação eles podem rodar em paralelo ("make corners").
+CORNERS = {
+    25000: "40KHz",
+    1562: "640KHz",
+    3126: "320KHz",
+}
+
+#Sequência de cada corner (ACK_SEQ): "fixed" percorre CoverageBins uma vez, "adaptive"
+#gera itens para os bins ainda não cobertos e para quando a meta de cobertura é atingida,
+#"stream" gera ACK_STREAM_COUNT transações aleatórias (soak test).
+SEQUENCES = {
+    "fixed": ACKCoverageSeq,
+    "adaptive": ACKAdaptiveSeq,
+    "stream": ACKStreamSeq,
+}
+
+def corners_from_env():
+    value = os.environ.get("ACK_CORNERS", "").strip()
+    if not value:
+        return list(CORNERS)
+    return [int(period) for period in value.split(",") if period.strip()]
 
 @pyuvm.test()
 class ACK_test(uvm_test):
@@ -53,34 +78,96 @@ class ACK_test(uvm_test):
     """
     def build_phase(self):
         ConfigDB().set(None, "*", "DISABLE_COVERAGE_ERRORS", False)
+        backend = os.environ.get("ACK_BACKEND", "gate")
+        ConfigDB().set(None, "*", "ACK_BACKEND", backend)
+        #Cópias do DUT no wrapper (ACK_INSTANCES), cada uma com seu agent/scoreboard
+        self.instances = int(os.environ.get("ACK_INSTANCES", "1"))
+        ConfigDB().set(None, "*", "ACK_INSTANCES", self.instances)
+        #Cobertura de toggle só faz sentido com o netlist (e com uma única cópia, em wrapper.dut)
+        ConfigDB().set(None, "*", "TOGGLE_COVERAGE",
+                       os.environ.get("TOGGLE_COV", "0") == "1" and backend == "gate" and self.instances == 1)
+        ConfigDB().set(None, "*", "SCOREBOARD_BOUNDED", os.environ.get("SCOREBOARD_BOUNDED", "0") == "1")
+        if os.environ.get("SCOREBOARD_OFFLINE", "0") == "1":
+            ConfigDB().set(None, "*", "SCOREBOARD_TRACE", "ack_trace.bin") #Verificação fora da simulação
+        if os.environ.get("ACK_STREAM_COUNT"):
+            ConfigDB().set(None, "*", "STREAM_COUNT", int(os.environ["ACK_STREAM_COUNT"]))
         self.env = Env.create("env", self)
 
     def end_of_elaboration_phase(self):
-        self.test_seq = ACKCoverageSeq.create("test_seq")
+        seq = SEQUENCES[os.environ.get("ACK_SEQ", "fixed")]
+        self.test_seqs = [seq.create(f"test_seq{i}") for i in range(self.instances)]
+        self.test_seq = self.test_seqs[0]
 
     async def run_phase(self):
         self.raise_objection()
         
-        bfm = Bfm()
+        bfms = [Bfm(i) for i in range(self.instances)] #Um BFM por cópia do DUT
+        bfm = bfms[0]
 
-        corners = [
-            {"period": 25000}, #40KHz
-            {"period": 1562},  #640KHz
-            {"period": 3126}   #320KHz
-        ]
+        corners = [{"period": period} for period in corners_from_env()]
+        scoreboards = self.env.scoreboards
+        seqrs = ConfigDB().get(self, "", "SEQRS")
+        summary = []
+
+        nvm_images = [b.nvm.snapshot() for b in bfms] #Cada corner parte da mesma imagem da NVM
+        for b in bfms:
+            b.nvm_ctrl.start() #O controlador da NVM atende os strobes durante todo o teste
+            if b.model is not None:
+                b.model.start() #Backend TLM: o modelo Python faz o papel do netlist
 
         for i, corner in enumerate(corners):
             cocotb.log.info(f"Starting Corner Case {i+1}/{len(corners)}: {corner}")
-            clock_task = cocotb.start_soon(bfm.clock_ack(corner["period"])) #modificar a geração de clock depois
-            mem_ctrl_task = cocotb.start_soon(mem_ctrl(bfm))
+            for b, image in zip(bfms, nvm_images):
+                b.nvm.restore(image)
+                b.set_clock_period(corner["period"]) #O clock continua rodando, apenas o período muda
+            fails = sum(sb.fail_count for sb in scoreboards)
+            txns = sum(b.txn_id for b in bfms)
+            vpi = sum(b.io.total() for b in bfms)
+            sim_start = get_sim_time(units="ns")
+            wall_start = time.perf_counter()
             
             ConfigDB().set(None, "*", "CLK_PERIOD", corner["period"])
-            seqr = ConfigDB().get(self, "", "SEQR")
-            await self.test_seq.start(seqr)
+            #As cópias do DUT avançam juntas: uma sequência por sequenciador, em paralelo
+            tasks = [cocotb.start_soon(seq.start(seqr)) for seq, seqr in zip(self.test_seqs, seqrs)]
+            for task in tasks:
+                await task
 
             await cocotb.triggers.Timer(100000, units="ns")
 
-            clock_task.kill()
-            mem_ctrl_task.kill()
+            fails = sum(sb.fail_count for sb in scoreboards) - fails
+            txns = sum(b.txn_id for b in bfms) - txns
+            vpi = sum(b.io.total() for b in bfms) - vpi
+            wall_s = time.perf_counter() - wall_start
+            summary.append({
+                "period": corner["period"],
+                "freq": CORNERS.get(corner["period"], ""),
+                "status": "TRACE" if scoreboards[0].trace else "PASS" if fails == 0 else "FAIL",
+                "fails": fails,
+                "instances": len(bfms),
+                "transactions": txns,
+                "sim_time_ns": get_sim_time(units="ns") - sim_start,
+                "wall_s": round(wall_s, 3),
+                "txn_per_s": round(txns / wall_s, 1) if wall_s > 0 else 0.0,
+                "vpi_per_txn": round(vpi / txns, 1) if txns else 0.0,   #Travessias Python<->simulador do BFM
+            })
+
+        self.report_corners(summary)
+        for b in bfms:
+            b.nvm_ctrl.report(cocotb.log)
+            b.vpi_report(cocotb.log)
+        if bfm.model is not None:
+            cocotb.log.info(f"Modelo TLM: {bfm.model.core.frames} quadros, {bfm.model.edges} bordas atendidas")
+        self.drop_objection()
 
-        self.drop_objection()
\ No newline at end of file
+    def report_corners(self, summary, path="corners.json"):
+        """Resumo por corner (status, falhas e tempos), no log e em corners.json."""
+        cocotb.log.info(f"{'Corner':<16}{'Status':<8}{'Falhas':>7}{'Cópias':>7}{'Transações':>11}"
+                        f"{'Sim (ms)':>10}{'Wall (s)':>10}{'Txn/s':>10}{'VPI/txn':>9}")
+        for c in summary:
+            name = f"{c['period']} ns {c['freq']}"
+            cocotb.log.info(
+                f"{name:<16}{c['status']:<8}{c['fails']:>7}{c['instances']:>7}{c['transactions']:>11}"
+                f"{c['sim_time_ns'] / 1e6:>10.3f}{c['wall_s']:>10.1f}{c['txn_per_s']:>10.1f}{c['vpi_per_txn']:>9.1f}"
+            )
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
\ No newline at end of file
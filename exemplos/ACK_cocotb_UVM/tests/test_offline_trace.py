@@ -0,0 +1,112 @@
+'''
+# +FHDR------------------------------------------------------------------------
+# -----------------------------------------------------------------------------
+# Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+# -----------------------------------------------------------------------------
+# Confidencial - Propriedade do CPA Wernher von Braun
+# -----------------------------------------------------------------------------
+# Item da verificação:
+# NOME DO ARQUIVO: test_offline_trace.py
+# REFERENCIA:      BlockGuide_ACK_PAv2.docx
+# DEPARTAMENTO:    Microeletronica
+# AUTOR:           Matheus Grossi
+# EMAIL:           matheus.grossi@vonbraunlabs.com.br
+# CO-AUTOR:        Marcelo Rodrigues Soares
+# EMAIL:           marcelo.soares@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# Bloco em estudo:
+# NOME DO ARQUIVO: ack_pav2.v
+# REFERENCIA:      Transponder – vB – Documento de projeto do bloco ACK
+# DEPARTAMENTO:    Inovacao
+# AUTOR:           Guilherme Pereira
+# EMAIL DO AUTOR:  guilherme.pereira@vonbraunlabs.com.br
+# -----------------------------------------------------------------------------
+# HISTORICO DAS VERSOES
+# VERSAO      DATA        AUTOR             DESCRICAO
+# 1.0         15/10/2025  Matheus Grossi    Elaboração da rotina de testes
+# -----------------------------------------------------------------------------
+# PALAVRAS-CHAVE: ISO18000-6C Ack
+# -----------------------------------------------------------------------------
+# PROPOSITO: Ler as informacoes necessarias do banco UII e responder conforme
+# especificado para o projeto.
+'''
+
+#----------------------------------------------------------------------------------------------------------------------------
+# Arquivo Test_offline_trace: 
+#----------------------------------------------------------------------------------------------------------------------------
+
+#Instâncias de bibliotecas:
+import logging
+import os
+import random
+import sys
+
+import pytest
+
+pytest.importorskip("pyuvm")
+import cocotb                                               # noqa: E402
+from pyuvm import *                                         # noqa: E402
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from components.bfm import Bfm                              # noqa: E402
+from components.env import Env                              # noqa: E402
+from components.ref_model import expected_response          # noqa: E402
+from components.seq_item import AckTxn                      # noqa: E402
+from components.txn_trace import check_trace, main          # noqa: E402
+
+'''
+Testes do modo trace do Scoreboard (SCOREBOARD_TRACE) sem simulador: o Env é montado
+pelas fases build/connect do pyuvm, os itens passam pelas analysis ports reais do driver
+e do monitor e o trace gravado é verificado pelo txn_trace.py, como no fluxo completo:
+python3 -m pytest tests/test_offline_trace.py. As respostas do "DUT" vêm do modelo de
+referência, igual ao que o Predictor espera no modo normal.
+'''
+
+@pytest.fixture
+def offline_env(tmp_path, monkeypatch):
+    """Env em modo trace; o BFM fica sem DUT (nenhum componente o usa antes do run_phase)."""
+    monkeypatch.setattr(cocotb, "RANDOM_SEED", 1234, raising=False)
+    monkeypatch.setattr(cocotb, "log", logging.getLogger("cocotb"), raising=False)
+    ConfigDB().clear()
+    uvm_root().clear_children()
+    Bfm._instances.clear()
+    bfm = object.__new__(Bfm)
+    bfm.initialized = True
+    Bfm._instances[0] = bfm
+    path = str(tmp_path / "ack_trace.bin")
+    ConfigDB().set(None, "*", "SCOREBOARD_TRACE", path)
+    ConfigDB().set(None, "*", "SCOREBOARD_TRACE_BATCH", 4)
+    env = Env.create("env", None)
+    for phase in (uvm_build_phase, uvm_connect_phase, uvm_end_of_elaboration_phase):
+        phase.traverse(env)
+    yield env, path
+    Bfm._instances.clear()
+    uvm_root().clear_children()
+    ConfigDB().clear()
+
+def run_txns(env, n, wrong=()):
+    """Envia n transações pelo driver_ap e as respostas pelo monitor_ap; as de `wrong` voltam erradas."""
+    rng = random.Random(7)
+    for txn_id in range(n):
+        words = tuple(rng.getrandbits(16) for _ in range(3))
+        txn = AckTxn(1.92, rng.getrandbits(1), rng.getrandbits(1), rng.getrandbits(1), 1000.0 * txn_id, txn_id, words)
+        env.agent.driver_ap.write(txn)
+        data = expected_response(words, txn.g_ack, txn.f_saia)
+        env.agent.monitor_ap.write((txn_id, data ^ 1 if txn_id in wrong else data))
+    env.scoreboard.report_phase()
+
+def test_offline_trace_passes(offline_env):
+    env, path = offline_env
+    assert not env.predictors
+    run_txns(env, 10)
+    _, checker = check_trace(path)
+    assert (checker.checked, checker.fail_count, checker.unmatched()) == (10, 0, (0, 0))
+    assert main(["check", path]) == 0
+
+def test_offline_trace_reports_failures(offline_env):
+    env, path = offline_env
+    run_txns(env, 10, wrong={3})
+    _, checker = check_trace(path)
+    assert checker.checked == 10
+    assert [fl["txn_id"] for fl in checker.failures] == [3]
+    assert main(["check", path]) == 1
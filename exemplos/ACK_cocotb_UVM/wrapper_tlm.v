@@ -0,0 +1,84 @@
+// +FHDR------------------------------------------------------------------------
+// Copyright (c) 2025 von Braun Design Center, Inc. Todos os direitos reservados
+// Propriedade Confidencial do Centro de Pesquisas Avancadas Wernher von Braun
+// -----------------------------------------------------------------------------
+// NOME DO ARQUIVO : wrapper_tlm.v
+// REFERENCIA :
+// DEPARTAMENTO : Microeletronica
+// AUTOR : Matheus Grossi
+// EMAIL DO AUTOR : matheus.grossi@vonbraunlabs.com.br
+// -----------------------------------------------------------------------------
+// HISTORICO DAS VERSOES
+// VERSAO  DATA         AUTOR              DESCRICAO
+// 1.0     2025-12-02   grossi              Versao inicial
+// -----------------------------------------------------------------------------
+// PROPOSITO : Topo sem netlist para o backend TLM (make ACK_BACKEND=tlm): as
+// portas do ack_pav2 sao regs dirigidos pelo modelo Python (components/ack_model.py)
+// -FHDR------------------------------------------------------------------------
+
+`timescale 1ns / 1ps
+
+module wrapper_tlm;
+    reg  clk_i;
+    reg  dft_tm_i;
+    reg  dt_proc_ctrl_i;
+    reg  f_saia_i;
+    reg  g_ack_i;
+    reg  [15:0] nvm_rd_dt_i;
+
+    //Saídas do ACK, escritas pelo AckTlm:
+    reg  dt_ack_done_o = 1'b0;
+    reg  dt_ack_o = 1'b0;
+    reg  nvm_ack_rd_stb_o = 1'b0;
+    reg  r_ack_o = 1'b0;
+    reg  [8:0] nvm_ack_addr_o = 9'd0;
+
+    //Gerador de clock nativo (clk_i_half_ps = meio período em ps, 0 = parado):
+    integer clk_i_half_ps = 0;
+    reg clk_i_q = 1'b1;
+
+    always begin : Clk_i_gen
+        if (clk_i_half_ps > 0) begin
+            #(clk_i_half_ps / 1000.0);
+            if (clk_i_half_ps > 0) begin
+                clk_i_q = ~clk_i_q;
+                clk_i = clk_i_q;
+            end
+        end
+        else
+            @(clk_i_half_ps);
+    end
+
+    //Controle do dump (mesmos plusargs do wrapper.v; aqui só existem as portas):
+    //+no_dump, +dump_start_ns=T e +dump_stop_ns=T.
+    reg dump_on = 1'b1;
+    reg dump_enabled = 1'b0;
+    integer dump_start_ns = 0;
+    integer dump_stop_ns = 0;
+
+    initial begin : Dump
+        if (!$test$plusargs("no_dump")) begin
+            if (!$value$plusargs("dump_start_ns=%d", dump_start_ns)) dump_start_ns = 0;
+            if (!$value$plusargs("dump_stop_ns=%d", dump_stop_ns)) dump_stop_ns = 0;
+            $dumpfile("dump.fst");
+            $dumpvars(1, wrapper_tlm);
+            dump_enabled = 1'b1;
+            if (dump_start_ns > 0) begin
+                $dumpoff;
+                #(dump_start_ns) if (dump_on) $dumpon;
+            end
+            if (dump_stop_ns > dump_start_ns) begin
+                #(dump_stop_ns - dump_start_ns) $dumpoff;
+                dump_enabled = 1'b0;
+            end
+        end
+    end
+
+    always @(dump_on) begin : Dump_ctrl
+        if (dump_enabled) begin
+            if (dump_on) $dumpon;
+            else $dumpoff;
+        end
+    end
+
+endmodule
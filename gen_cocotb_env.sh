@@ -144,6 +144,40 @@ COMPILE_ARGS += \
 # Habilita geração de ondas
 export WAVES = 1
 
+# Perfil do dump de ondas (plusargs do wrapper): none | ports | dut | all.
+# DUMP_DEPTH limita a profundidade; DUMP_START_NS/DUMP_STOP_NS gravam só uma janela.
+DUMP ?= all
+DUMP_DEPTH ?=
+DUMP_START_NS ?=
+DUMP_STOP_NS ?=
+ifeq ($(DUMP),none)
+PLUSARGS += +no_dump
+else
+PLUSARGS += +dump_scope=$(DUMP)
+PLUSARGS += $(if $(DUMP_DEPTH),+dump_depth=$(DUMP_DEPTH))
+PLUSARGS += $(if $(DUMP_START_NS),+dump_start_ns=$(DUMP_START_NS))
+PLUSARGS += $(if $(DUMP_STOP_NS),+dump_stop_ns=$(DUMP_STOP_NS))
+endif
+
+# Scripts do fluxo (cvc_cache.py, ...) ficam na raiz do projeto
+FLOW_DIR ?= .
+
+# Cache de compilação do cvc64 (CVC_CACHE=0 desabilita). Só o modo compilado
+# (CVC_ITERP=0) gera um sim.vvp reaproveitável, ver cvc_cache.py.
+CVC_CACHE ?= 1
+export CVC_CACHE_DIR ?= $(PWD)/.cvc_cache
+CVC_CACHE_CMD = python3 $(FLOW_DIR)/cvc_cache.py --args "$(COMPILE_ARGS) $(EXTRA_ARGS)" \
+				--extra "$(shell cocotb-config --version)" --sim-build $(SIM_BUILD) --interp $(CVC_ITERP)
+
+# Agregador das violações de timing no log (ver violation_filter.py): mantém
+# VIOLATION_EXAMPLES exemplos por grupo e grava violations.txt/violations.json.
+# Com VIOLATION_BASELINE=<json> avisa sobre grupos novos (VIOLATION_FAIL=1 falha o make).
+VIOLATION_EXAMPLES ?= 3
+VIOLATION_WINDOW_NS ?= 1000000
+VIOLATION_BASELINE ?=
+VIOLATION_FAIL ?= 0
+VIOLATION_FILTER = python3 $(FLOW_DIR)/violation_filter.py -k $(VIOLATION_EXAMPLES) --window-ns $(VIOLATION_WINDOW_NS)
+
 # =======================================================================
 # 2. Inclusão das Regras do Cocotb
 # =======================================================================
@@ -158,18 +192,41 @@ include $(shell cocotb-config --makefiles)/Makefile.sim
 .PHONY: run_and_log
 run_and_log:
 	@echo ">>> 1/3 Iniciando Simulação (logs salvos em cocotb_status.log)..."
-	-@$(MAKE) --no-print-directory results.xml 2>&1 | tee cocotb_status.log
+	@$(if $(filter 1,$(CVC_CACHE)),$(CVC_CACHE_CMD) restore $(VERILOG_SOURCES))
+	-@$(MAKE) --no-print-directory results.xml 2>&1 | $(VIOLATION_FILTER) | tee cocotb_status.log
 	
 	@echo ">>> 2/3 Simulação finalizada. Iniciando pós-processamento..."
+	@$(if $(filter 1,$(CVC_CACHE)),$(CVC_CACHE_CMD) store $(VERILOG_SOURCES))
 	@mv -f cocotb_status.log sim_build/ 2>/dev/null || true
 	@mv -f cvc_compile.log sim_build/ 2>/dev/null || true
 	@mv -f results.xml sim_build/ 2>/dev/null || true
+	@mv -f violations.json violations.txt sim_build/ 2>/dev/null || true
+	@mv -f corners.json failure.json sim_build/ 2>/dev/null || true
 	@mv -f dump.fst sim_build/ 2>/dev/null || true
 	
 	@echo ">>> 3/3 Organizando diretórios..."
 	@rm -rf final_results
 	@[ -d sim_build ] && mv sim_build final_results && echo "Pasta 'sim_build' movida para 'final_results'" \
 	|| echo "Aviso: Pasta sim_build não encontrada."
+	@$(if $(VIOLATION_BASELINE),python3 $(FLOW_DIR)/violation_filter.py --compare final_results/violations.json \
+		--baseline $(VIOLATION_BASELINE) $(if $(filter 1,$(VIOLATION_FAIL)),--fail-on-new))
+
+# Regressão paralela (ver run_regression.py), ex.: make regression SEEDS=200 JOBS=8
+SEEDS ?= 10
+JOBS ?= $(shell nproc)
+REGRESSION_ARGS ?=
+
+.PHONY: regression
+regression:
+	python3 $(FLOW_DIR)/run_regression.py --makefile $(firstword $(MAKEFILE_LIST)) \
+		-j $(JOBS) --seeds $(SEEDS) $(REGRESSION_ARGS)
+
+.PHONY: cache_report cache_clean
+cache_report:
+	@python3 $(FLOW_DIR)/cvc_cache.py report
+
+cache_clean:
+	rm -rf $(CVC_CACHE_DIR)
 
 .PHONY: wave
 wave:
@@ -186,7 +243,8 @@ clean::
 	rm -f netlist.json simv.vvp
 	rm -f diagram.dot diagram.svg diagram.png
 	rm -f cvcsim comp.log sdf.log cvcsim.log verilog.log results.xml cocotb_status.log cvc_compile.log
-	rm -rf final_results sim_build
+	rm -f violations.json violations.txt corners.json failure.json
+	rm -rf final_results sim_build regression
 	clear
 	@echo "   __________________________________ "
 	@echo "  /                                  \\"
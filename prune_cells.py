@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Poda das bibliotecas sky130 incluídas pelo wrapper.
+
+O wrapper incluía o sky130_fd_sc_hd.v inteiro (~128 mil linhas, milhares de módulos),
+além do hvl, do fd_io e das primitivas, mas o netlist usa poucas dezenas de células.
+Este script divide os arquivos do pdk-lib nos seus blocos protegidos
+(`ifndef SKY130_..._V ... `endif), descobre quais células o netlist instancia,
+fecha as dependências (células -> submódulos -> UDPs das primitivas) e grava só
+esses blocos em um arquivo único, incluído pelo wrapper no lugar das bibliotecas.
+
+Uso:
+    python3 prune_cells.py --netlist files_synthesis/ack_pav2.v --out cells_used.v \\
+        primitives_hd.v primitives_hvl.v sky130_fd_io.v sky130_fd_sc_hd.v ...
+    python3 prune_cells.py --netlist netlist.v --from-wrapper wrapper.v --measure
+
+Com --measure o cvc64 traduz o netlist com as bibliotecas completas e com a
+versão podada, e compara os tempos de translate/load e a memória alocada.
+"""
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from cvc_cache import compile_times
+
+_IDENT = re.compile(r"[A-Za-z_][\w$]*")
+_DEFINES = re.compile(r"^\s*(?:module|macromodule|primitive)\s+([A-Za-z_][\w$]*)", re.M)
+_COND_OPEN = re.compile(r"^\s*`(ifdef|ifndef)\b")
+_COND_CLOSE = re.compile(r"^\s*`endif\b")
+_UNIT_OPEN = re.compile(r"^\s*(module|macromodule|primitive)\b")
+_UNIT_CLOSE = re.compile(r"^\s*(endmodule|endprimitive)\b")
+_INCLUDE = re.compile(r'^\s*`include\s+"([^"]+)"', re.M)
+_STORAGE = re.compile(r"Approximately\s+(\d+)\s+bytes storage allocated")
+_COMMENTS = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+
+#Arquivos incluídos pelo wrapper gerado pelo build_wrapper.sh
+DEFAULT_LIBS = [
+    "primitives_hd.v",
+    "primitives_hvl.v",
+    "sky130_fd_io.v",
+    "sky130_fd_sc_hd.v",
+    "sky130_fd_sc_hvl.v",
+    "sky130_ef_sc_hd__decap_12.v",
+]
+
+#Defines do Makefile do ACK, usados na medição quando --define não é passado
+DEFAULT_DEFINES = ("FUNCTIONAL", "UNIT_DELAY", "USE_POWER_PINS")
+
+class Chunk:
+    """Bloco de nível 0 de uma biblioteca (bloco `ifndef/`endif ou module/primitive solto)."""
+    __slots__ = ("guard", "text", "defines", "refs")
+
+    def __init__(self, guard, text):
+        self.guard = guard
+        self.text = text
+        code = _COMMENTS.sub(" ", text)
+        self.defines = set(_DEFINES.findall(code))
+        self.refs = set(_IDENT.findall(code)) - self.defines
+
+def split_chunks(path):
+    """Divide o arquivo nos blocos de nível 0; diretivas soltas entre blocos acompanham o próximo."""
+    with open(path, errors="replace") as f:
+        lines = f.readlines()
+    chunks, pending, cur = [], [], None
+    depth, in_unit, guard = 0, False, None
+    for line in lines:
+        if cur is None:
+            if _COND_OPEN.match(line):
+                m = re.match(r"^\s*`ifndef\s+(\w+)", line)
+                guard = m.group(1) if m else None
+                cur, depth = pending + [line], 1
+                pending = []
+            elif _UNIT_OPEN.match(line):
+                guard = None
+                cur, in_unit = pending + [line], True
+                pending = []
+            elif line.lstrip().startswith("`"):
+                pending.append(line)
+            continue
+        cur.append(line)
+        if in_unit:
+            if _UNIT_CLOSE.match(line):
+                in_unit = False
+        elif _COND_OPEN.match(line):
+            depth += 1
+        elif _COND_CLOSE.match(line):
+            depth -= 1
+        if depth == 0 and not in_unit:
+            chunks.append(Chunk(guard, "".join(cur)))
+            cur = None
+    if cur is not None:
+        chunks.append(Chunk(guard, "".join(cur)))
+    return chunks
+
+def find_lib(name, incdirs):
+    for base in incdirs + ["."]:
+        cand = os.path.join(base, name)
+        if os.path.isfile(cand):
+            return cand
+    raise FileNotFoundError(f"biblioteca '{name}' não encontrada em {incdirs}")
+
+def prune(netlist, libs, incdirs):
+    """Retorna (blocos usados em ordem de inclusão, células do netlist, total de blocos)."""
+    chunks, guards = [], set()
+    for name in libs:
+        for c in split_chunks(find_lib(name, incdirs)):
+            # Mesmo guard em duas bibliotecas: o pré-processador só compila o primeiro
+            if c.guard is not None:
+                if c.guard in guards:
+                    continue
+                guards.add(c.guard)
+            chunks.append(c)
+
+    owner = {}
+    for i, c in enumerate(chunks):
+        for d in c.defines:
+            owner.setdefault(d, i)
+
+    with open(netlist, errors="replace") as f:
+        code = _COMMENTS.sub(" ", f.read())
+    netlist_defs = set(_DEFINES.findall(code))
+    cells = {t for t in set(_IDENT.findall(code)) - netlist_defs if t in owner}
+
+    used, stack = set(), [owner[c] for c in cells]
+    while stack:
+        i = stack.pop()
+        if i in used:
+            continue
+        used.add(i)
+        stack.extend(owner[r] for r in chunks[i].refs if r in owner and owner[r] not in used)
+    return [chunks[i] for i in sorted(used)], sorted(cells), len(chunks)
+
+def write_cells(out, chunks, netlist, libs):
+    with open(out, "w") as f:
+        f.write(f"// Gerado por prune_cells.py a partir de {os.path.basename(netlist)}: não edite.\n")
+        f.write(f"// Bibliotecas de origem: {', '.join(libs)}\n\n")
+        for c in chunks:
+            f.write(c.text)
+            if not c.text.endswith("\n"):
+                f.write("\n")
+        f.write("\n`default_nettype wire\n")
+
+#----------------------------------------------------------------------------
+#Medição com o cvc64 (bibliotecas completas x podadas):
+#----------------------------------------------------------------------------
+def cvc_cost(netlist, includes, incdirs, defines, workdir, tag):
+    top = os.path.join(workdir, f"{tag}.v")
+    with open(top, "w") as f:
+        f.write("`timescale 1ns / 1ps\n")
+        for inc in includes:
+            f.write(f'`include "{inc}"\n')
+    log = os.path.join(workdir, f"{tag}.log")
+    cmd = ["cvc64", "+interp", "+informs", "-l", log]
+    cmd += [f"+incdir+{os.path.abspath(d)}" for d in incdirs]
+    cmd += [f"+define+{d}" for d in defines]
+    cmd += [top, os.path.abspath(netlist)]
+    subprocess.run(cmd, cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    times = compile_times(log)
+    try:
+        with open(log, errors="replace") as f:
+            m = _STORAGE.search(f.read())
+    except OSError:
+        m = None
+    return times, int(m.group(1)) if m else None
+
+def measure(netlist, libs, cells_file, incdirs, defines):
+    if shutil.which("cvc64") is None:
+        print("cvc64 não encontrado no PATH: medição ignorada")
+        return
+    with tempfile.TemporaryDirectory() as workdir:
+        full = cvc_cost(netlist, libs, incdirs, defines, workdir, "full")
+        pruned = cvc_cost(netlist, [os.path.abspath(cells_file)], incdirs, defines, workdir, "pruned")
+    print(f"{'':<10}{'translate (s)':>15}{'load/opt (s)':>14}{'memória (MB)':>14}")
+    for label, (times, mem) in (("completo", full), ("podado", pruned)):
+        t = times or (float("nan"), float("nan"))
+        print(f"{label:<10}{t[0]:>15.2f}{t[1]:>14.2f}{(mem or 0) / 1e6:>14.1f}")
+    if full[0] and pruned[0]:
+        saved = sum(full[0]) - sum(pruned[0])
+        print(f"Economia: {saved:.2f} s de translate+load", end="")
+        if full[1] and pruned[1]:
+            print(f", {(full[1] - pruned[1]) / 1e6:.1f} MB de memória", end="")
+        print()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Gera uma biblioteca sky130 só com as células usadas pelo netlist.")
+    ap.add_argument("--netlist", required=True)
+    ap.add_argument("--out", default="cells_used.v")
+    ap.add_argument("--incdir", action="append", default=None, help="Pasta das bibliotecas (padrão: pdk-lib)")
+    ap.add_argument("--from-wrapper", help="Usa os `include de um wrapper existente como lista de bibliotecas")
+    ap.add_argument("--define", action="append", default=None,
+                    help="Defines usados na medição com o cvc64 (padrão: " + ", ".join(DEFAULT_DEFINES) + ")")
+    ap.add_argument("--measure", action="store_true", help="Compara o custo do cvc64 com e sem a poda")
+    ap.add_argument("libs", nargs="*")
+    opt = ap.parse_args(argv)
+
+    incdirs = opt.incdir or ["pdk-lib"]
+    defines = opt.define if opt.define is not None else list(DEFAULT_DEFINES)
+    libs = opt.libs
+    if opt.from_wrapper:
+        with open(opt.from_wrapper) as f:
+            libs = [inc for inc in _INCLUDE.findall(f.read()) if inc != os.path.basename(opt.out)]
+    libs = libs or DEFAULT_LIBS
+
+    chunks, cells, total = prune(opt.netlist, libs, incdirs)
+    if not cells:
+        print(f"Erro: nenhuma célula das bibliotecas encontrada em {opt.netlist}")
+        return 1
+    write_cells(opt.out, chunks, opt.netlist, libs)
+    nlines = sum(c.text.count("\n") for c in chunks)
+    print(f"{len(cells)} tipos de célula no netlist -> {len(chunks)} de {total} blocos "
+          f"({nlines} linhas) gravados em {opt.out}")
+    if opt.measure:
+        measure(opt.netlist, libs, opt.out, incdirs, defines)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
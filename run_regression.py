@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Runner de regressão: várias simulações cocotb independentes (seeds, testes, corners)
+em paralelo, com o JUnit de cada uma juntado em um único results.xml.
+
+Cada job roda em sua própria pasta (regression/<job>/) com links simbólicos para os
+arquivos do projeto, então os sim_build/results.xml/dump não se sobrescrevem. Com
+CVC_ITERP=0 o simulador é compilado uma única vez (regression/_build) e todos os jobs
+usam o mesmo sim.vvp; no modo interpretado cada job traduz os fontes no próprio cvc64.
+
+Uso:
+    python3 run_regression.py -j 8 --seeds 200
+    python3 run_regression.py --testcase ACK_test --matrix CLK=1562,3126 --timeout 1800
+    python3 run_regression.py --seeds 200 --resume      (continua uma regressão interrompida)
+    python3 run_regression.py --seeds 200 --waves-on-fail  (sem ondas; só as falhas são repetidas com dump)
+"""
+
+import argparse
+import itertools
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+#Arquivos de saída de uma simulação: nunca são compartilhados entre os jobs
+RUN_OUTPUTS = {
+    "sim_build", "final_results", "results.xml", "dump.fst", "dump.vcd",
+    "cocotb_status.log", "cvc_compile.log", "__pycache__", ".cvc_cache",
+}
+
+_print_lock = threading.Lock()
+
+def log(msg):
+    with _print_lock:
+        print(msg, flush=True)
+
+#----------------------------------------------------------------------------
+#Definição dos jobs:
+#----------------------------------------------------------------------------
+def parse_matrix(items):
+    """["VAR=a,b", "X=1"] -> [("VAR", ["a", "b"]), ("X", ["1"])]"""
+    matrix = []
+    for item in items:
+        var, _, values = item.partition("=")
+        if not var or not values:
+            raise SystemExit(f"--matrix inválido: '{item}' (use VAR=v1,v2,...)")
+        matrix.append((var, values.split(",")))
+    return matrix
+
+def build_jobs(opt):
+    seeds = opt.seed_list or list(range(opt.seed_base, opt.seed_base + opt.seeds))
+    testcases = opt.testcase or [None]
+    matrix = parse_matrix(opt.matrix)
+    axes = [values for _, values in matrix]
+    jobs = []
+    for seed, test, combo in itertools.product(seeds, testcases, itertools.product(*axes)):
+        env = {"RANDOM_SEED": str(seed)}
+        params = {}
+        name = [f"seed{seed}"]
+        if test:
+            env["TESTCASE"] = test
+            name.append(test)
+        for (var, _), value in zip(matrix, combo):
+            env[var] = value
+            params[var] = value
+            name.append(f"{var}-{value}")
+        if opt.module:
+            env["MODULE"] = opt.module
+        if opt.no_waves or opt.waves_on_fail:
+            env["DUMP"] = "none"                            #Perfil de dump do Makefile
+        jobs.append({"name": "_".join(name).replace("/", "-"), "env": env, "matrix": params})
+    return jobs
+
+#----------------------------------------------------------------------------
+#Execução:
+#----------------------------------------------------------------------------
+def link_project(project, workdir, out_dir):
+    """Cria a pasta do job com links para o projeto (exceto as saídas de simulação)."""
+    os.makedirs(workdir, exist_ok=True)
+    for entry in os.listdir(project):
+        src = os.path.join(project, entry)
+        if entry in RUN_OUTPUTS or os.path.abspath(src) == out_dir:
+            continue
+        dst = os.path.join(workdir, entry)
+        if not os.path.lexists(dst):
+            os.symlink(src, dst)
+
+def child_env(extra, workdir):
+    env = dict(os.environ)
+    for var in ("MAKEFLAGS", "MFLAGS", "MAKELEVEL"):      #Não herda o jobserver do make que chamou o runner
+        env.pop(var, None)
+    env["PWD"] = workdir                                    #O Makefile usa $(PWD) nos caminhos
+    env.update(extra)
+    return env
+
+def run_make(cmd, workdir, env, timeout, logfile):
+    """Roda o make no grupo de processos próprio; em timeout o grupo inteiro é morto."""
+    with open(logfile, "w") as out:
+        proc = subprocess.Popen(cmd, cwd=workdir, env=env, stdout=out, stderr=subprocess.STDOUT,
+                                start_new_session=True)
+        try:
+            return proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+            return None
+
+def build_shared(opt, project, out_dir):
+    """Compila o simulador uma vez (modo compilado) para todos os jobs."""
+    workdir = os.path.join(out_dir, "_build")
+    link_project(project, workdir, out_dir)
+    env = child_env({"CVC_ITERP": "0"}, workdir)
+    log(">>> Compilando o simulador compartilhado (CVC_ITERP=0)...")
+    rc = run_make(["make", "-f", opt.makefile, "--no-print-directory", "sim_build/sim.vvp"],
+                  workdir, env, opt.timeout, os.path.join(workdir, "build.log"))
+    vvp = os.path.join(workdir, "sim_build", "sim.vvp")
+    if rc != 0 or not os.path.isfile(vvp):
+        raise SystemExit(f"Falha na compilação compartilhada, ver {workdir}/build.log")
+    return vvp
+
+def run_job(job, opt, project, out_dir, shared_vvp):
+    workdir = os.path.join(out_dir, job["name"])
+    status_file = os.path.join(workdir, "job.json")
+    if opt.resume and os.path.isfile(status_file):
+        with open(status_file) as f:
+            status = json.load(f)
+        if status["status"] in ("pass", "fail"):    #Timeouts e erros são executados de novo
+            log(f"[{status['status']:>7}] {job['name']} (resume: já executado)")
+            return status
+
+    link_project(project, workdir, out_dir)
+    for stale in ("results.xml", os.path.join("sim_build", "sim.vvp")):
+        path = os.path.join(workdir, stale)
+        if os.path.lexists(path):
+            os.remove(path)
+    extra = dict(job["env"])
+    if shared_vvp:
+        os.makedirs(os.path.join(workdir, "sim_build"), exist_ok=True)
+        os.symlink(shared_vvp, os.path.join(workdir, "sim_build", "sim.vvp"))
+        extra["CVC_ITERP"] = "0"
+
+    start = time.time()
+    rc = run_make(["make", "-f", opt.makefile, "--no-print-directory", "results.xml"],
+                  workdir, child_env(extra, workdir), opt.timeout, os.path.join(workdir, "run.log"))
+    results = os.path.join(workdir, "results.xml")
+    if rc is None:
+        state = "timeout"
+    elif not os.path.isfile(results):
+        state = "error"
+    else:
+        state = "fail" if junit_failures(results) else "pass"
+    status = {"name": job["name"], "env": job["env"], "matrix": job["matrix"], "status": state, "returncode": rc,
+              "duration": round(time.time() - start, 2)}
+    with open(status_file, "w") as f:
+        json.dump(status, f, indent=2)
+    log(f"[{state:>7}] {job['name']} ({status['duration']:.1f} s)")
+    return status
+
+#----------------------------------------------------------------------------
+#JUnit:
+#----------------------------------------------------------------------------
+def junit_failures(path):
+    try:
+        root = ET.parse(path).getroot()
+    except ET.ParseError:
+        return 1
+    return sum(1 for tc in root.iter("testcase") if tc.find("failure") is not None or tc.find("error") is not None)
+
+def attach_waves(tc, st):
+    """Anexa o dump do replay ao testcase (formato [[ATTACHMENT|...]] do plugin JUnit Attachments)."""
+    out = tc.find("system-out")
+    if out is None:
+        out = ET.SubElement(tc, "system-out")
+    out.text = (out.text or "") + (f"\nOndas do replay a partir de {st['waves_from_ns']} ns:"
+                                   f"\n[[ATTACHMENT|{st['waves']}]]\n")
+
+def merge_junit(statuses, out_dir, out_file):
+    """Um <testsuite> por job; jobs sem results.xml (timeout/crash) viram um testcase com <error>."""
+    merged = ET.Element("testsuites", name="regression")
+    for st in statuses:
+        suite = ET.SubElement(merged, "testsuite", name=st["name"], package=st["name"])
+        for var, value in sorted(st["env"].items()):
+            ET.SubElement(suite, "property", name=var, value=value)
+        path = os.path.join(out_dir, st["name"], "results.xml")
+        cases = []
+        if os.path.isfile(path):
+            try:
+                cases = list(ET.parse(path).getroot().iter("testcase"))
+            except ET.ParseError:
+                cases = []
+        # Os valores da matriz fazem parte da identidade do teste (ex.: ACK_test[ACK_CORNERS=1562])
+        params = ",".join(f"{k}={v}" for k, v in st.get("matrix", {}).items())
+        for tc in cases:
+            tc.set("classname", f"{st['name']}.{tc.get('classname', '')}")
+            if params:
+                tc.set("name", f"{tc.get('name')}[{params}]")
+            if st.get("waves") and (tc.find("failure") is not None or tc.find("error") is not None):
+                attach_waves(tc, st)
+            suite.append(tc)
+        if not cases:
+            tc = ET.SubElement(suite, "testcase", name=st["name"], classname="regression",
+                               time=str(st["duration"]))
+            ET.SubElement(tc, "error", message=f"{st['status']} (returncode {st['returncode']})")
+            tc.set("file", os.path.join(st["name"], "run.log"))
+            if st.get("waves"):
+                attach_waves(tc, st)
+        suite.set("tests", str(len(suite.findall("testcase"))))
+        suite.set("failures", str(sum(1 for tc in suite.iter("testcase") if tc.find("failure") is not None)))
+        suite.set("errors", str(sum(1 for tc in suite.iter("testcase") if tc.find("error") is not None)))
+    ET.ElementTree(merged).write(out_file, encoding="utf-8", xml_declaration=True)
+
+#----------------------------------------------------------------------------
+#Replay com ondas dos jobs que falharam:
+#----------------------------------------------------------------------------
+def replay_job(st, opt, project, out_dir, shared_vvp):
+    """Roda de novo o mesmo teste/seed com dump completo, começando pouco antes da primeira falha."""
+    env = dict(st["env"])
+    env["DUMP"] = "all"
+    env.pop("DUMP_START_NS", None)
+    try:
+        with open(os.path.join(out_dir, st["name"], "failure.json")) as f:
+            starts = [fl["start_ns"] for fl in json.load(f)["failures"] if fl.get("start_ns") is not None]
+    except (OSError, ValueError, KeyError):
+        starts = []
+    if starts:
+        start_ns = int(max(0, min(starts) - opt.wave_margin_ns))
+        if start_ns > 0:
+            env["DUMP_START_NS"] = str(start_ns)
+    job = {"name": f"{st['name']}_waves", "env": env, "matrix": st.get("matrix", {})}
+    replay = run_job(job, opt, project, out_dir, shared_vvp)
+    wave = os.path.join(out_dir, job["name"], "dump.fst")
+    if os.path.isfile(wave):
+        st["waves"] = os.path.relpath(wave, out_dir)
+        st["waves_from_ns"] = int(env.get("DUMP_START_NS", 0))
+    return replay
+
+def summarize(statuses, wall):
+    counts = {}
+    for st in statuses:
+        counts[st["status"]] = counts.get(st["status"], 0) + 1
+    cpu = sum(st["duration"] for st in statuses)
+    log(f"\n{len(statuses)} jobs em {wall:.1f} s (soma das simulações: {cpu:.1f} s) | "
+        + ", ".join(f"{k}: {v}" for k, v in sorted(counts.items())))
+    for st in statuses:
+        if st["status"] != "pass":
+            log(f"  {st['status']:>7}  {st['name']}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Regressão paralela de simulações cocotb.")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Simulações simultâneas")
+    ap.add_argument("--seeds", type=int, default=1, help="Quantidade de seeds")
+    ap.add_argument("--seed-base", type=int, default=1)
+    ap.add_argument("--seed-list", type=int, nargs="+", help="Seeds explícitas (substitui --seeds)")
+    ap.add_argument("--testcase", action="append", help="TESTCASE a rodar (pode repetir)")
+    ap.add_argument("--module", help="MODULE do cocotb (padrão: o do Makefile)")
+    ap.add_argument("--matrix", action="append", default=[], help="VAR=v1,v2,... exportada para o make")
+    ap.add_argument("--timeout", type=float, default=None, help="Tempo máximo por job, em segundos")
+    ap.add_argument("--resume", action="store_true", help="Não repete jobs que já terminaram")
+    ap.add_argument("--project", default=".")
+    ap.add_argument("--makefile", default=None)
+    ap.add_argument("--out", default="regression", help="Pasta dos jobs")
+    ap.add_argument("--results", default=None, help="JUnit combinado (padrão: <out>/results.xml)")
+    ap.add_argument("--shared-build", action="store_true",
+                    help="Compila uma vez com CVC_ITERP=0 e reaproveita o sim.vvp em todos os jobs")
+    ap.add_argument("--no-waves", action="store_true", help="Roda os jobs sem dump (DUMP=none)")
+    ap.add_argument("--waves-on-fail", action="store_true",
+                    help="Roda sem dump e repete os jobs que falharem com o dump habilitado")
+    ap.add_argument("--wave-margin-ns", type=float, default=100000,
+                    help="Quanto antes da transação com falha o dump do replay começa")
+    opt = ap.parse_args(argv)
+
+    project = os.path.abspath(opt.project)
+    out_dir = os.path.abspath(opt.out)
+    if opt.makefile is None:
+        opt.makefile = "Makefile" if os.path.isfile(os.path.join(project, "Makefile")) else "Makefile.cvc_cocotb"
+    os.makedirs(out_dir, exist_ok=True)
+
+    jobs = build_jobs(opt)
+    log(f">>> {len(jobs)} jobs, {opt.jobs} em paralelo, saída em {out_dir}")
+    shared_vvp = build_shared(opt, project, out_dir) if opt.shared_build else None
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, opt.jobs)) as pool:
+        statuses = list(pool.map(lambda job: run_job(job, opt, project, out_dir, shared_vvp), jobs))
+        failed = [st for st in statuses if st["status"] != "pass"]
+        if opt.waves_on_fail and failed:
+            log(f">>> Repetindo {len(failed)} job(s) com falha com o dump habilitado...")
+            list(pool.map(lambda st: replay_job(st, opt, project, out_dir, shared_vvp), failed))
+
+    results = opt.results or os.path.join(out_dir, "results.xml")
+    merge_junit(statuses, out_dir, results)
+    summarize(statuses, time.time() - start)
+    log(f"JUnit combinado: {results}")
+    return 0 if all(st["status"] == "pass" for st in statuses) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Atividade de chaveamento (SAIF) a partir do dump da simulação, para estimativa de potência.
+
+Lê o dump.fst (texto VCD do cvc64) em uma passada, pelo mesmo leitor do wavequery.py,
+e acumula por bit de cada net: tempo em 0/1/X/Z (T0, T1, TX, TZ) e transições 0<->1
+(TC). Não há callback Python por borda durante a simulação: o próprio dump já agrupa
+as mudanças, e o custo aqui é uma atualização de contadores por linha do arquivo.
+
+Saídas:
+    activity.saif   SAIF 2.0 (backward) a partir do escopo escolhido (padrão wrapper.dut),
+                    para ser lido pela ferramenta de potência junto com o liberty do
+                    corner (ex.: lib/tt_025C_1v80 no Simple_and_gate).
+    activity.txt    tabela por instância: bits, transições e taxa de chaveamento.
+
+Os escopos "begin" (blocos nomeados do wrapper, como Dump) não são hardware e ficam de fora.
+
+Uso:
+    python3 saif_activity.py final_results/dump.fst
+    python3 saif_activity.py dump.fst --scope wrapper.dut --start 1000000 --stop 5000000000
+"""
+
+import argparse
+import sys
+import time
+
+from wavequery import WaveIndex
+
+FIELDS = ("T0", "T1", "TX", "TZ")
+_BUCKET = {"0": 0, "1": 1, "x": 2, "z": 3}
+
+def expand(value, width):
+    """Valor do VCD -> string de `width` bits (MSB primeiro), estendida como no VCD (0, ou x/z)."""
+    if value[0] in "bB":
+        value = value[1:]
+    value = value.lower()
+    if len(value) < width:
+        fill = value[0] if value[0] in "xz" else "0"
+        value = fill * (width - len(value)) + value
+    return value[-width:]
+
+class Activity:
+    """Contadores SAIF dos bits de um sinal: counts[bit] = [T0, T1, TX, TZ, TC]."""
+    __slots__ = ("width", "value", "since", "counts")
+
+    def __init__(self, width, value, t):
+        self.width = width
+        self.value = expand(value, width) if value else "x" * width
+        self.since = t
+        self.counts = [[0, 0, 0, 0, 0] for _ in range(width)]
+
+    def change(self, t, value):
+        dt = t - self.since
+        new = expand(value, self.width)
+        old = self.value
+        if self.width == 1:
+            c = self.counts[0]
+            c[_BUCKET.get(old, 2)] += dt
+            if old != new and old in "01" and new in "01":
+                c[4] += 1
+        else:
+            for c, o, n in zip(self.counts, old, new):
+                c[_BUCKET.get(o, 2)] += dt
+                if o != n and o in "01" and n in "01":
+                    c[4] += 1
+        self.value = new
+        self.since = t
+
+    def close(self, t):
+        dt = t - self.since
+        for c, o in zip(self.counts, self.value):
+            c[_BUCKET.get(o, 2)] += dt
+        self.since = t
+
+def collect(wave, codes, t0, t1):
+    """Percorre o dump em [t0, t1] e devolve {código: Activity}."""
+    acts = {}
+    for t, code, value in wave.changes(t0, t1):
+        a = acts.get(code)
+        if a is None:
+            if code in codes:
+                acts[code] = Activity(wave.widths[code], value, t)
+        elif value is not None:
+            a.change(t, value)
+    for a in acts.values():
+        a.close(t1)
+    return acts
+
+#----------------------------------------------------------------------------
+#Árvore de instâncias (só escopos "module"; "begin" é transparente):
+#----------------------------------------------------------------------------
+def instance_of(wave, full_name):
+    """Instância (escopo module mais próximo) de um sinal, ou None se estiver em um bloco begin."""
+    scope = full_name.rpartition(".")[0]
+    return scope if wave.scopes.get(scope) == "module" else None
+
+def module_path(wave, scope):
+    """Hierarquia só com os escopos module (ex.: wrapper.dut.U1)."""
+    parts = scope.split(".")
+    return ".".join(p for i, p in enumerate(parts) if wave.scopes.get(".".join(parts[:i + 1])) == "module")
+
+def build_tree(wave, root):
+    """{instância: [(nome da net, código)]} para as instâncias dentro de root, pela hierarquia de módulos."""
+    nets = {}
+    for name, code in wave.signals.items():
+        inst = instance_of(wave, name)
+        if inst is None or not (inst == root or inst.startswith(root + ".")):
+            continue
+        nets.setdefault(module_path(wave, inst), []).append((name.rpartition(".")[2], name, code))
+    return nets
+
+def saif_name(name):
+    """Escapa os caracteres especiais do SAIF (hierarquia e índices); identificador escapado do Verilog perde a barra."""
+    if name.startswith("\\"):
+        name = name[1:]
+    return "".join("\\" + ch if ch in "[]/.()\\" else ch for ch in name)
+
+def bit_names(wave, full, name, width):
+    """Nomes SAIF de cada bit, MSB primeiro (mesma ordem da string do VCD)."""
+    if width == 1 and full not in wave.ranges:
+        return [saif_name(name)]
+    msb, lsb = wave.ranges.get(full, (width - 1, 0))
+    step = -1 if msb >= lsb else 1
+    return [f"{saif_name(name)}\\[{i}\\]" for i in range(msb, lsb + step, step)]
+
+def write_saif(path, wave, tree, acts, root, duration, design):
+    timescale = wave.timescale or "1ps"
+    number = timescale.rstrip("afpnums")
+    unit = timescale[len(number):]
+    children = {}
+    for inst in tree:
+        children.setdefault(inst.rpartition(".")[0], []).append(inst)
+
+    with open(path, "w") as out:
+        out.write('(SAIFILE\n(SAIFVERSION "2.0")\n(DIRECTION "backward")\n')
+        out.write(f'(DESIGN "{design}")\n(DATE "{time.strftime("%a %b %d %H:%M:%S %Y")}")\n')
+        out.write('(VENDOR "ambiente_cvc_cocotb")\n(PROGRAM_NAME "saif_activity.py")\n(VERSION "1.0")\n')
+        out.write(f"(DIVIDER / )\n(TIMESCALE {number} {unit})\n(DURATION {duration})\n")
+
+        def instance(inst, depth):
+            pad = "  " * depth
+            out.write(f"{pad}(INSTANCE {saif_name(inst.rpartition('.')[2])}\n")
+            nets = [n for n in sorted(tree.get(inst, [])) if n[2] in acts]
+            if nets:
+                out.write(f"{pad}  (NET\n")
+                for name, full, code in nets:
+                    a = acts[code]
+                    for bit, c in zip(bit_names(wave, full, name, a.width), a.counts):
+                        fields = " ".join(f"({f} {v})" for f, v in zip(FIELDS, c))
+                        out.write(f"{pad}    ({bit} {fields} (TC {c[4]}) (IG 0))\n")
+                out.write(f"{pad}  )\n")
+            for child in sorted(children.get(inst, [])):
+                instance(child, depth + 1)
+            out.write(f"{pad})\n")
+
+        #Ancestrais do escopo escolhido entram só como caminho, sem nets
+        path = root.split(".")
+        for depth, part in enumerate(path[:-1]):
+            out.write(f"{'  ' * depth}(INSTANCE {saif_name(part)}\n")
+        instance(root, len(path) - 1)
+        for depth in range(len(path) - 2, -1, -1):
+            out.write(f"{'  ' * depth})\n")
+        out.write(")\n")
+
+def instance_table(tree, acts, root, duration_s):
+    """Linhas (instância, bits, transições, taxa em MHz) ordenadas pelas transições."""
+    rows = []
+    for inst, nets in tree.items():
+        counts = [c for _, _, code in nets if code in acts for c in acts[code].counts]
+        toggles = sum(c[4] for c in counts)
+        name = inst[len(root) + 1:] or inst
+        rate = toggles / duration_s / 1e6 if duration_s else 0.0
+        rows.append((name, len(counts), toggles, rate))
+    rows.sort(key=lambda r: (-r[2], r[0]))
+    return rows
+
+def write_table(path, rows, root, t0, t1, timescale):
+    with open(path, "w") as f:
+        f.write(f"Atividade por instância em {root}, de {t0} a {t1} ({timescale})\n")
+        f.write(f"{'Instância':<40}{'Bits':>8}{'Transições':>14}{'Taxa (MHz)':>14}\n")
+        for name, bits, toggles, rate in rows:
+            f.write(f"{name:<40}{bits:>8}{toggles:>14}{rate:>14.4f}\n")
+
+_SECONDS = {"s": 1, "ms": 1e-3, "us": 1e-6, "ns": 1e-9, "ps": 1e-12, "fs": 1e-15}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Gera SAIF e taxa de chaveamento por instância a partir do dump.")
+    ap.add_argument("dump")
+    ap.add_argument("--scope", default=None, help="Escopo raiz do SAIF (padrão: wrapper.dut, se existir)")
+    ap.add_argument("--start", type=int, default=0, help="Início da janela, na unidade do dump")
+    ap.add_argument("--stop", type=int, default=None, help="Fim da janela (padrão: fim do dump)")
+    ap.add_argument("--saif", default="activity.saif")
+    ap.add_argument("--table", default="activity.txt")
+    ap.add_argument("--top", type=int, default=20, help="Instâncias mais ativas mostradas no terminal")
+    opt = ap.parse_args(argv)
+
+    wave = WaveIndex(opt.dump)
+    root = opt.scope or next((s for s in ("wrapper.dut",) if s in wave.scopes),
+                             next(s for s in wave.scopes if "." not in s))
+    if wave.scopes.get(root) != "module":
+        ap.error(f"escopo '{root}' não é um module do dump")
+    t0, t1 = opt.start, wave.end_time if opt.stop is None else opt.stop
+    duration = t1 - t0
+    if duration <= 0:
+        ap.error("janela de tempo vazia")
+
+    tree = build_tree(wave, root)
+    codes = {code for nets in tree.values() for _, _, code in nets}
+    acts = collect(wave, codes, t0, t1)
+
+    write_saif(opt.saif, wave, tree, acts, root, duration, root.rpartition(".")[2])
+    timescale = wave.timescale or "1ps"
+    number = timescale.rstrip("afpnums")
+    unit_s = float(number or 1) * _SECONDS.get(timescale[len(number):], 1e-12)
+    rows = instance_table(tree, acts, root, duration * unit_s)
+    write_table(opt.table, rows, root, t0, t1, timescale)
+
+    nbits = sum(a.width for a in acts.values())
+    print(f"{len(tree)} instâncias, {nbits} bits, {sum(r[2] for r in rows)} transições "
+          f"em {duration} {timescale}: {opt.saif}, {opt.table}")
+    for name, bits, toggles, rate in rows[:opt.top]:
+        print(f"  {name:<40}{toggles:>12}{rate:>12.4f} MHz")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
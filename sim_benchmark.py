@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark de desempenho das simulações, com histórico.
+
+Roda os exemplos (ACK UVM e Simple_and_gate) com seeds fixas, cada um em uma pasta
+isolada (mesmo esquema do run_regression.py), e coleta:
+    - tempo de parede e pico de RSS (processo make + cvc64 + Python);
+    - tempos do cvc64 (translate, load/optimize, simulation) e eventos processados;
+    - time/sim_time_ns/ratio_time do results.xml;
+    - transações checadas pelo scoreboard ("Transactions checked: N") por segundo.
+
+Cada execução é acrescentada em bench_history.jsonl e comparada com a mediana das
+últimas execuções do mesmo benchmark (baseline móvel); pioras acima da tolerância
+são marcadas como regressão.
+
+Com --instances 1,2,4 o ACK roda também com N cópias do DUT na mesma simulação
+(ACK_INSTANCES=N, benchmarks ack_x2, ack_x4, ...), e ao final é mostrada a escala:
+transações por segundo de parede, speedup e eficiência em relação a uma cópia.
+
+Uso:
+    python3 sim_benchmark.py                      (todos os benchmarks)
+    python3 sim_benchmark.py --bench ack --repeat 3 --fail-on-regression
+    python3 sim_benchmark.py --bench ack --instances 1,2,4,8
+"""
+
+import argparse
+import json
+import os
+import re
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from run_regression import link_project, child_env
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+#Benchmarks: pasta do projeto e variáveis fixas (seed) de cada um
+BENCHES = {
+    "ack": {"project": "exemplos/ACK_cocotb_UVM", "env": {"RANDOM_SEED": "1"}},
+    "and_gate": {"project": "exemplos/Simple_and_gate", "env": {"RANDOM_SEED": "1"}},
+}
+
+#Métricas comparadas com o baseline: True = maior é melhor
+METRICS = {
+    "wall_s": False,
+    "translate_s": False,
+    "load_s": False,
+    "simulation_s": False,
+    "peak_rss_mb": False,
+    "tx_per_s": True,
+}
+
+_NUM = r"(\d+(?:\.\d+)?)"
+_TIMES = re.compile(rf"Times \(in sec\.\):\s*Translate\s+{_NUM},\s*load/optimize\s+{_NUM},\s*simulation\s+{_NUM}")
+_EVENTS = re.compile(r"(\d+) simulation events and (\d+) declarative immediate assigns processed")
+_CHECKED = re.compile(r"Transactions checked:\s*(\d+)")
+
+#----------------------------------------------------------------------------
+#Execução e coleta:
+#----------------------------------------------------------------------------
+def run_bench(name, bench, out_dir, makefile, timeout):
+    """Roda um benchmark; wait4 devolve o pico de RSS da árvore de processos do make."""
+    project = os.path.join(ROOT, bench["project"])
+    workdir = os.path.join(out_dir, name)
+    link_project(project, workdir, out_dir)
+    for stale in ("results.xml", "cvc_compile.log"):
+        if os.path.exists(os.path.join(workdir, stale)):
+            os.remove(os.path.join(workdir, stale))
+
+    logfile = os.path.join(workdir, "run.log")
+    start = time.perf_counter()
+    with open(logfile, "w") as out:
+        proc = subprocess.Popen(["make", "-f", makefile, "--no-print-directory", "results.xml"],
+                                cwd=workdir, env=child_env(bench["env"], workdir),
+                                stdout=out, stderr=subprocess.STDOUT, start_new_session=True)
+        deadline = None if timeout is None else start + timeout
+        while True:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            if deadline and time.perf_counter() > deadline:
+                os.killpg(proc.pid, signal.SIGKILL)
+                pid, status, usage = os.wait4(proc.pid, 0)
+                break
+            time.sleep(0.05)
+
+    record = {"bench": name, "seed": bench["env"].get("RANDOM_SEED"),
+              "returncode": os.waitstatus_to_exitcode(status),
+              "wall_s": round(time.perf_counter() - start, 3),
+              "peak_rss_mb": round(usage.ru_maxrss / 1024, 1)}        #ru_maxrss em kB no Linux
+    record.update(parse_cvc_log([os.path.join(workdir, "cvc_compile.log"), logfile]))
+    record.update(parse_results(os.path.join(workdir, "results.xml")))
+    with open(logfile, errors="replace") as f:
+        checked = _CHECKED.findall(f.read())      #Um scoreboard por cópia do DUT
+    if checked:
+        record["transactions"] = sum(int(n) for n in checked)
+        sim = record.get("simulation_s") or record.get("test_time_s")
+        if sim:
+            record["tx_per_s"] = round(record["transactions"] / sim, 2)
+    return record
+
+def parse_cvc_log(paths):
+    """Tempos de fase e eventos da primeira linha encontrada nos logs (cvc_compile.log ou saída do make)."""
+    data = {}
+    for path in paths:
+        try:
+            with open(path, errors="replace") as f:
+                text = f.read()
+        except OSError:
+            continue
+        m = _TIMES.search(text)
+        if m and "translate_s" not in data:
+            data.update(translate_s=float(m.group(1)), load_s=float(m.group(2)), simulation_s=float(m.group(3)))
+        m = _EVENTS.search(text)
+        if m and "events" not in data:
+            data.update(events=int(m.group(1)), immediate_assigns=int(m.group(2)))
+    return data
+
+def parse_results(path):
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return {"passed": False}
+    cases = list(root.iter("testcase"))
+    fails = sum(1 for tc in cases if tc.find("failure") is not None or tc.find("error") is not None)
+    return {
+        "passed": bool(cases) and not fails,
+        "tests": len(cases),
+        "test_time_s": round(sum(float(tc.get("time", 0)) for tc in cases), 3),
+        "sim_time_ns": sum(float(tc.get("sim_time_ns", 0)) for tc in cases),
+        "ratio_time": round(min((float(tc.get("ratio_time", 0)) for tc in cases), default=0), 2),
+    }
+
+#----------------------------------------------------------------------------
+#Histórico e baseline móvel:
+#----------------------------------------------------------------------------
+def load_history(path):
+    history = []
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    history.append(json.loads(line))
+    except OSError:
+        pass
+    return history
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def check_regressions(record, history, window, tolerance):
+    """Compara o registro com a mediana das últimas `window` execuções (com sucesso) do mesmo benchmark."""
+    previous = [h for h in history if h["bench"] == record["bench"] and h.get("passed")][-window:]
+    flags = {}
+    for metric, higher_is_better in METRICS.items():
+        values = [h[metric] for h in previous if h.get(metric) is not None]
+        if not values or record.get(metric) is None:
+            continue
+        base = statistics.median(values)
+        if base == 0:
+            continue
+        change = (record[metric] - base) / base
+        worse = -change if higher_is_better else change
+        flags[metric] = {"baseline": base, "change": round(change, 4), "regression": worse > tolerance}
+    return flags
+
+def instance_benches(counts):
+    """Variantes do ACK com N cópias do DUT: "ack" (N=1) e ack_x<N>."""
+    benches = {}
+    for n in counts:
+        bench = dict(BENCHES["ack"])
+        bench["env"] = dict(bench["env"], ACK_INSTANCES=str(n))
+        benches["ack" if n == 1 else f"ack_x{n}"] = bench
+    return benches
+
+def print_scaling(records):
+    """Tabela de escala por número de cópias: transações por segundo de parede em relação a N=1."""
+    rows = sorted((int(r.get("instances", 1)), r) for r in records if r.get("transactions") and r.get("wall_s"))
+    if not rows:
+        return
+    base = next((r["transactions"] / r["wall_s"] for n, r in rows if n == 1), None)
+    print(f"\n{'N':>4}{'Wall (s)':>10}{'Transações':>12}{'Tx/s':>10}{'Speedup':>9}{'Eficiência':>12}")
+    for n, r in rows:
+        rate = r["transactions"] / r["wall_s"]
+        speedup = rate / base if base else None
+        print(f"{n:>4}{r['wall_s']:>10.1f}{r['transactions']:>12}{rate:>10.2f}"
+              + (f"{speedup:>8.2f}x{speedup / n:>12.0%}" if speedup else ""))
+
+def print_report(record, flags):
+    print(f"\n=== {record['bench']} (seed {record['seed']}) "
+          f"{'PASS' if record.get('passed') else 'FAIL'} ===")
+    for key in ("wall_s", "translate_s", "load_s", "simulation_s", "events", "sim_time_ns",
+                "ratio_time", "transactions", "tx_per_s", "peak_rss_mb"):
+        if record.get(key) is None:
+            continue
+        line = f"  {key:<14}{record[key]:>14}"
+        f = flags.get(key)
+        if f:
+            line += f"   baseline {f['baseline']:.3f} ({f['change']:+.1%})"
+            if f["regression"]:
+                line += "   <-- REGRESSÃO"
+        print(line)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark das simulações com histórico.")
+    ap.add_argument("--bench", action="append", choices=sorted(BENCHES), help="Benchmarks a rodar (padrão: todos)")
+    ap.add_argument("--repeat", type=int, default=1)
+    ap.add_argument("--history", default=os.path.join(ROOT, "bench_history.jsonl"))
+    ap.add_argument("--window", type=int, default=5, help="Execuções anteriores usadas no baseline")
+    ap.add_argument("--tolerance", type=float, default=0.10, help="Piora relativa aceita (0.10 = 10%%)")
+    ap.add_argument("--out", default=os.path.join(ROOT, "bench_runs"))
+    ap.add_argument("--makefile", default="Makefile")
+    ap.add_argument("--timeout", type=float, default=None)
+    ap.add_argument("--fail-on-regression", action="store_true")
+    ap.add_argument("--instances", default=None, help="Cópias do DUT do ACK a comparar, ex.: 1,2,4")
+    opt = ap.parse_args(argv)
+
+    benches = dict(BENCHES)
+    names = opt.bench or sorted(BENCHES)
+    if opt.instances:
+        scaling = instance_benches(int(n) for n in opt.instances.split(","))
+        benches.update(scaling)
+        names = [n for n in names if n != "ack"] + list(scaling)
+
+    out_dir = os.path.abspath(opt.out)
+    os.makedirs(out_dir, exist_ok=True)
+    history = load_history(opt.history)
+    revision = git_revision()
+    regressions = 0
+    records = []
+    for _ in range(opt.repeat):
+        for name in names:
+            record = run_bench(name, benches[name], out_dir, opt.makefile, opt.timeout)
+            if "ACK_INSTANCES" in benches[name]["env"]:
+                record["instances"] = int(benches[name]["env"]["ACK_INSTANCES"])
+            record["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            record["revision"] = revision
+            flags = check_regressions(record, history, opt.window, opt.tolerance)
+            record["regressions"] = sorted(m for m, f in flags.items() if f["regression"])
+            regressions += len(record["regressions"])
+            print_report(record, flags)
+            history.append(record)
+            records.append(record)
+            with open(opt.history, "a") as f:
+                f.write(json.dumps(record) + "\n")
+    if opt.instances:
+        print_scaling([r for r in records if "instances" in r])
+    if regressions:
+        print(f"\n{regressions} métrica(s) acima da tolerância de {opt.tolerance:.0%} em relação ao baseline")
+    return 1 if regressions and opt.fail_on_regression else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Agregador das violações de timing do cvc64, usado em pipe durante a simulação:
+
+    make results.xml 2>&1 | python3 violation_filter.py | tee cocotb_status.log
+
+Cada violação do cvc64 ocupa duas linhas:
+    **pdk-lib/sky130_fd_sc_hd.v(40325) WARN** now 3800000288 ps [566] timing violation in wrapper.dut._205_ (diff. 14 ps)
+     $recovery((negedge SET_B):3800000274 ps, (posedge CLK):3800000288 ps, 133 ps);
+
+As violações são agrupadas por (instância, check, célula, janela de tempo) e só os K
+primeiros exemplos de cada grupo seguem para a saída; o resto é apenas contado. A célula
+é o módulo que contém a linha de origem, e não a linha em si, que muda entre a
+biblioteca sky130 completa e o cells_used.v do PRUNE_CELLS=1. As demais linhas passam
+sem alteração. Ao final são gravados violations.txt (tabela) e violations.json, e
+--compare confere os grupos contra um baseline.
+"""
+
+import argparse
+import bisect
+import json
+import re
+import sys
+
+_HEADER = re.compile(
+    r"^\*\*(?P<src>\S+?\(\d+\)) WARN\*\* now (?P<now>\d+) (?P<unit>\w+) \[\d+\] "
+    r"timing violation in (?P<inst>\S+) \(diff\. (?P<diff>-?\d+) \w+\)"
+)
+_CHECK = re.compile(r"^\s*\$(\w+)\(")
+_SRC = re.compile(r"^(?P<path>.+)\((?P<line>\d+)\)$")
+_MODULE = re.compile(r"^\s*(?:macro)?module\s+(\w+)")
+
+#Fatores para ps, a unidade usada nas janelas
+_UNIT_PS = {"fs": 1e-3, "ps": 1, "ns": 1e3, "us": 1e6, "ms": 1e9, "s": 1e12}
+
+OVERFLOW = ("*", "*", "*", -1)
+
+class CellResolver:
+    """Origem "arquivo(linha)" -> módulo que contém a linha; cada arquivo é lido uma vez só."""
+    def __init__(self):
+        self.modules = {}           #arquivo -> ([linhas dos "module"], [nomes])
+        self.cells = {}             #origem -> célula
+
+    def cell(self, src):
+        cell = self.cells.get(src)
+        if cell is None:
+            cell = self.cells[src] = self._resolve(src)
+        return cell
+
+    def _resolve(self, src):
+        m = _SRC.match(src)
+        if not m:
+            return src
+        lines, names = self._index(m.group("path"))
+        i = bisect.bisect_right(lines, int(m.group("line"))) - 1
+        return names[i] if i >= 0 else src     #Arquivo ilegível: fica a origem com a linha
+
+    def _index(self, path):
+        if path not in self.modules:
+            lines, names = [], []
+            try:
+                with open(path, errors="replace") as f:
+                    for n, line in enumerate(f, 1):
+                        mod = _MODULE.match(line)
+                        if mod:
+                            lines.append(n)
+                            names.append(mod.group(1))
+            except OSError:
+                pass
+            self.modules[path] = (lines, names)
+        return self.modules[path]
+
+class ViolationGroups:
+    """Contadores por grupo; o número de grupos é limitado para manter a memória constante."""
+    def __init__(self, examples=3, window_ps=10**9, max_groups=10000, resolver=None):
+        self.examples = examples
+        self.window_ps = window_ps
+        self.max_groups = max_groups
+        self.resolver = resolver or CellResolver()
+        self.groups = {}
+        self.total = 0
+        self.suppressed = 0
+
+    def add(self, inst, check, src, now_ps, diff):
+        """Registra uma violação; retorna True se ela ainda deve aparecer no log."""
+        window = int(now_ps // self.window_ps) if self.window_ps else 0
+        key = (inst, check, self.resolver.cell(src), window)
+        g = self.groups.get(key)
+        if g is None:
+            if len(self.groups) >= self.max_groups:
+                key = OVERFLOW
+                g = self.groups.get(key)
+            if g is None:
+                g = self.groups[key] = {"source": src, "count": 0, "first_ps": now_ps, "last_ps": now_ps,
+                                        "worst_diff": diff}
+        g["count"] += 1
+        g["last_ps"] = now_ps
+        if abs(diff) > abs(g["worst_diff"]):
+            g["worst_diff"] = diff
+        self.total += 1
+        if g["count"] > self.examples:
+            self.suppressed += 1
+            return False
+        return True
+
+    def rows(self):
+        for (inst, check, cell, window), g in sorted(self.groups.items(), key=lambda kv: -kv[1]["count"]):
+            yield {"instance": inst, "check": check, "cell": cell, "window": window, **g}
+
+    def to_json(self):
+        return {
+            "total": self.total,
+            "suppressed": self.suppressed,
+            "examples_per_group": self.examples,
+            "window_ps": self.window_ps,
+            "groups": list(self.rows()),
+        }
+
+    def table(self):
+        lines = [f"Violações de timing: {self.total} no total, {len(self.groups)} grupos, "
+                 f"{self.suppressed} linhas suprimidas do log",
+                 f"{'Instância':<28}{'Check':<12}{'Célula':<36}{'Janela':>7}{'Qtd':>8}"
+                 f"{'Primeira (ps)':>16}{'Última (ps)':>16}{'Pior diff':>10}"]
+        for r in self.rows():
+            lines.append(f"{r['instance']:<28}{r['check']:<12}{r['cell']:<36}{r['window']:>7}{r['count']:>8}"
+                         f"{r['first_ps']:>16}{r['last_ps']:>16}{r['worst_diff']:>10}")
+        return "\n".join(lines) + "\n"
+
+def filter_stream(src, dst, groups):
+    """Copia src para dst resumindo as violações; só a linha pendente fica em memória."""
+    pending = None
+    for line in src:
+        if pending is not None:
+            header, m = pending
+            pending = None
+            c = _CHECK.match(line)
+            if c:
+                now_ps = int(int(m.group("now")) * _UNIT_PS.get(m.group("unit"), 1))
+                if groups.add(m.group("inst"), c.group(1), m.group("src"), now_ps, int(m.group("diff"))):
+                    dst.write(header)
+                    dst.write(line)
+                continue
+            dst.write(header)
+        m = _HEADER.match(line)
+        if m:
+            pending = (line, m)
+            continue
+        dst.write(line)
+    if pending is not None:
+        dst.write(pending[0])
+
+#----------------------------------------------------------------------------
+#Comparação com o baseline (grupos sem a janela de tempo, que muda com o timing, e pela
+#célula em vez da linha, que muda com o PRUNE_CELLS):
+#----------------------------------------------------------------------------
+def signatures(report):
+    return {(g["instance"], g["check"], g.get("cell", g["source"])) for g in report["groups"]}
+
+def compare(current_path, baseline_path, fail_on_new):
+    with open(current_path) as f:
+        current = json.load(f)
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    new = sorted(signatures(current) - signatures(baseline))
+    gone = sorted(signatures(baseline) - signatures(current))
+    for inst, check, cell in new:
+        print(f"[violations] NOVO grupo: {inst} {check} {cell}")
+    for inst, check, cell in gone:
+        print(f"[violations] grupo ausente em relação ao baseline: {inst} {check} {cell}")
+    if not new:
+        print(f"[violations] nenhum grupo novo em relação a {baseline_path}")
+        return 0
+    level = "ERRO" if fail_on_new else "Aviso"
+    print(f"[violations] {level}: {len(new)} grupo(s) de violação novo(s)")
+    return 1 if fail_on_new else 0
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Resume as violações de timing do log do cvc64.")
+    ap.add_argument("-k", "--examples", type=int, default=3, help="Exemplos mantidos no log por grupo")
+    ap.add_argument("--window-ns", type=float, default=1e6, help="Largura da janela de tempo (0 = sem janelas)")
+    ap.add_argument("--max-groups", type=int, default=10000)
+    ap.add_argument("--json", default="violations.json")
+    ap.add_argument("--summary", default="violations.txt")
+    ap.add_argument("--compare", metavar="JSON", help="Compara um violations.json com --baseline e sai")
+    ap.add_argument("--baseline")
+    ap.add_argument("--fail-on-new", action="store_true", help="Código de saída 1 se houver grupos novos")
+    opt = ap.parse_args(argv)
+
+    if opt.compare:
+        if not opt.baseline:
+            ap.error("--compare precisa de --baseline")
+        return compare(opt.compare, opt.baseline, opt.fail_on_new)
+
+    sys.stdout.reconfigure(line_buffering=True)     #O tee mostra o log enquanto a simulação roda
+    groups = ViolationGroups(opt.examples, int(opt.window_ns * 1000), opt.max_groups)
+    filter_stream(sys.stdin, sys.stdout, groups)
+
+    with open(opt.json, "w") as f:
+        json.dump(groups.to_json(), f, indent=2)
+    with open(opt.summary, "w") as f:
+        f.write(groups.table())
+    if groups.total:
+        print(f"[violations] {groups.total} violações em {len(groups.groups)} grupos "
+              f"({groups.suppressed} linhas suprimidas), ver {opt.summary}")
+    if opt.baseline:
+        return compare(opt.json, opt.baseline, opt.fail_on_new)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
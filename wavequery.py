@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Consulta de formas de onda sem GUI, para checkers pós-simulação e notebooks.
+
+Apesar da extensão, o dump.fst gravado pelo cvc64 ($dumpfile/$dumpvars) é texto VCD,
+então a leitura aqui é de VCD. O índice é construído em uma única passada pelo
+arquivo: nomes dos sinais (hierarquia completa -> código do VCD) e checkpoints a
+cada N bytes, com o offset no arquivo, o tempo e o valor de todos os sinais nesse
+ponto. Uma consulta começa no checkpoint anterior ao tempo pedido e lê só o trecho
+necessário, sem carregar o arquivo em memória. O índice é salvo ao lado do dump
+(<dump>.idx) e reaproveitado enquanto o dump não mudar.
+
+    from wavequery import WaveIndex
+    w = WaveIndex("final_results/dump.fst")
+    w.value_at("dut.nvm_ack_addr_o", 3_800_000_000)
+    times, values = w.transitions("wrapper.dt_ack_o", t0, t1)   #arrays NumPy (se instalado)
+
+Tempos na unidade do dump (w.timescale, normalmente 1 ps). Valores com x/z são -1
+nos arrays (value_at devolve a string original, ex.: "x" ou "b10x1").
+
+CLI:
+    python3 wavequery.py dump.fst --list [padrão]
+    python3 wavequery.py dump.fst --at wrapper.clk_i 1000000
+    python3 wavequery.py dump.fst --changes wrapper.dt_ack_o 0 50000000
+"""
+
+import argparse
+import bisect
+import os
+import pickle
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:                 #Sem NumPy os resultados saem como array('q')
+    np = None
+
+INDEX_VERSION = 2
+UNKNOWN = -1
+
+def to_int(value):
+    """'1' / 'b1010' / 'x' -> int, ou UNKNOWN se houver x/z."""
+    if value[0] in "bB":
+        value = value[1:]
+    try:
+        return int(value, 2)
+    except ValueError:
+        return UNKNOWN
+
+class WaveIndex:
+    def __init__(self, path, checkpoint_bytes=8 << 20, use_cache=True):
+        self.path = path
+        self.checkpoint_bytes = checkpoint_bytes
+        self.index_path = path + ".idx"
+        st = os.stat(path)
+        self._stamp = (st.st_size, st.st_mtime_ns, checkpoint_bytes, INDEX_VERSION)
+        if not (use_cache and self._load_index()):
+            self._build_index()
+            if use_cache:
+                self._save_index()
+
+    #----------------------------------------------------------------------------
+    #Construção do índice:
+    #----------------------------------------------------------------------------
+    def _parse_header(self, f):
+        self.signals = {}           #nome completo -> código
+        self.widths = {}            #código -> largura
+        self.scopes = {}            #hierarquia -> tipo do escopo (module, begin, ...)
+        self.ranges = {}            #nome completo -> (msb, lsb) dos vetores
+        self.timescale = None
+        scope = []
+        offset = 0
+        pending = b""
+        for line in f:
+            offset += len(line)
+            pending += line
+            if b"$end" not in line:
+                continue
+            tokens = pending.split()
+            pending = b""
+            if not tokens:
+                continue
+            kw = tokens[0]
+            if kw == b"$scope":
+                scope.append(tokens[2].decode())
+                self.scopes[".".join(scope)] = tokens[1].decode()
+            elif kw == b"$upscope":
+                scope.pop()
+            elif kw == b"$var":
+                code, name = tokens[3].decode(), tokens[4].decode()
+                full = ".".join(scope + [name])
+                self.signals[full] = code
+                self.widths[code] = int(tokens[2])
+                if len(tokens) > 6 and tokens[5].startswith(b"["):
+                    msb, _, lsb = tokens[5].decode().strip("[]").partition(":")
+                    self.ranges[full] = (int(msb), int(lsb or msb))
+            elif kw == b"$timescale":
+                self.timescale = b"".join(tokens[1:-1]).decode()
+            elif kw == b"$enddefinitions":
+                return offset
+        raise ValueError(f"{self.path}: fim do cabeçalho VCD não encontrado")
+
+    def _build_index(self):
+        """Uma passada: mantém o valor atual de cada código e tira um snapshot a cada checkpoint_bytes."""
+        self.times = array("q")
+        self.offsets = array("q")
+        self.snapshots = []
+        state = {}
+        with open(self.path, "rb") as f:
+            offset = self._parse_header(f)
+            self.body_offset = offset
+            next_cp = offset
+            t = 0
+            for line in f:
+                c = line[:1]
+                if c == b"#":
+                    t = int(line[1:])
+                    if offset >= next_cp:
+                        self.times.append(t)
+                        self.offsets.append(offset)
+                        self.snapshots.append(dict(state))
+                        next_cp = offset + self.checkpoint_bytes
+                elif c in b"01xzXZ" and c:
+                    state[line[1:].rstrip().decode()] = line[:1].decode()
+                elif c in b"bBrR" and c:
+                    value, code = line.split()
+                    state[code.decode()] = value.decode()
+                offset += len(line)
+            self.end_time = t
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False
+        if data.get("stamp") != self._stamp:
+            return False
+        self.__dict__.update(data["index"])
+        return True
+
+    def _save_index(self):
+        index = {k: getattr(self, k) for k in ("signals", "widths", "scopes", "ranges", "timescale", "times",
+                                                "offsets", "snapshots", "body_offset", "end_time")}
+        try:
+            with open(self.index_path, "wb") as f:
+                pickle.dump({"stamp": self._stamp, "index": index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass                    #Pasta somente leitura: o índice fica só em memória
+
+    #----------------------------------------------------------------------------
+    #Consultas:
+    #----------------------------------------------------------------------------
+    def find(self, pattern=""):
+        """Nomes completos que contêm o padrão."""
+        return sorted(name for name in self.signals if pattern in name)
+
+    def code(self, name):
+        """Código VCD de um sinal; aceita o nome completo ou um sufixo único (ex.: dut.nvm_ack_addr_o)."""
+        if name in self.signals:
+            return self.signals[name]
+        matches = [n for n in self.signals if n.endswith("." + name)]
+        if len(matches) == 1:
+            return self.signals[matches[0]]
+        if not matches:
+            raise KeyError(f"sinal '{name}' não encontrado no dump")
+        raise KeyError(f"sinal '{name}' ambíguo: {', '.join(sorted(matches)[:5])}...")
+
+    def _scan(self, codes, t0, t1):
+        """Gera (tempo, código, valor) dos códigos pedidos em [t0, t1], partindo do checkpoint anterior a t0.
+        Antes dos eventos, gera (t0, código, valor em t0) para cada código. codes=None: todos os sinais."""
+        k = bisect.bisect_right(self.times, t0) - 1
+        if codes is None:
+            codes = list(self.widths)
+        if k >= 0:
+            state = {c: self.snapshots[k].get(c) for c in codes}
+            start = self.offsets[k]
+        else:
+            state = dict.fromkeys(codes)
+            start = self.body_offset
+        wanted = {c.encode(): c for c in codes}
+        emitted = False
+        t = None
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                c = line[:1]
+                if c == b"#":
+                    t = int(line[1:])
+                    if t > t1:
+                        break
+                    if t >= t0 and not emitted:
+                        # Valores em t0 (antes das mudanças deste instante, se t == t0)
+                        for code in codes:
+                            yield t0, code, state[code]
+                        emitted = True
+                    continue
+                if c in b"01xzXZ" and c:
+                    code = wanted.get(line[1:].rstrip())
+                    value = None if code is None else c.decode()
+                elif c in b"bBrR" and c:
+                    value, code = line.split()
+                    code = wanted.get(code)
+                    value = value.decode()
+                else:
+                    continue
+                if code is None:
+                    continue
+                if emitted:
+                    yield t, code, value
+                else:
+                    state[code] = value
+        if not emitted:
+            for code in codes:
+                yield t0, code, state[code]
+
+    def changes(self, t0=0, t1=None):
+        """Todas as mudanças em [t0, t1] como (tempo, código, valor), começando pelo estado em t0."""
+        return self._scan(None, t0, self.end_time if t1 is None else t1)
+
+    def value_at(self, name, t):
+        """Valor (string VCD, ex.: '1', 'b1010', 'x') do sinal no instante t (após as mudanças de t)."""
+        code = self.code(name)
+        value = None
+        for _, _, v in self._scan([code], t, t):
+            value = v
+        return value
+
+    def transitions_many(self, names, t0, t1):
+        """{nome: (tempos, valores)} de vários sinais em uma só leitura do trecho [t0, t1]."""
+        codes = {name: self.code(name) for name in names}
+        per_code = {c: (array("q"), array("q"), []) for c in codes.values()}
+        for t, code, value in self._scan(list(per_code), t0, t1):
+            times, values, wide = per_code[code]
+            if value is None:
+                continue
+            if times and times[-1] == t:            #Várias mudanças no mesmo instante: vale a última
+                times.pop()
+                values.pop()
+                wide.pop()
+            v = to_int(value)
+            times.append(t)
+            wide.append(v)
+            values.append(v if v < (1 << 63) else UNKNOWN)
+        result = {}
+        for name, code in codes.items():
+            times, values, wide = per_code[code]
+            if self.widths[code] > 63:              #Não cabe em int64: lista de ints do Python
+                values = wide
+            result[name] = self._arrays(times, values)
+        return result
+
+    def transitions(self, name, t0, t1):
+        """(tempos, valores) do sinal em [t0, t1]; o primeiro ponto é o valor em t0."""
+        return self.transitions_many([name], t0, t1)[name]
+
+    @staticmethod
+    def _arrays(times, values):
+        if np is None:
+            return times, values
+        if isinstance(values, list):
+            return np.frombuffer(times, dtype=np.int64), np.array(values, dtype=object)
+        return np.frombuffer(times, dtype=np.int64), np.frombuffer(values, dtype=np.int64)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Consulta de sinais em dumps VCD (dump.fst do cvc64).")
+    ap.add_argument("dump")
+    ap.add_argument("--list", nargs="?", const="", metavar="PADRÃO", help="Lista os sinais")
+    ap.add_argument("--at", nargs=2, metavar=("SINAL", "T"))
+    ap.add_argument("--changes", nargs=3, metavar=("SINAL", "T0", "T1"))
+    ap.add_argument("--no-cache", action="store_true", help="Não lê/grava o índice <dump>.idx")
+    opt = ap.parse_args(argv)
+
+    w = WaveIndex(opt.dump, use_cache=not opt.no_cache)
+    if opt.list is not None:
+        for name in w.find(opt.list):
+            print(f"{name}  [{w.widths[w.signals[name]]}]")
+    if opt.at:
+        print(w.value_at(opt.at[0], int(opt.at[1])))
+    if opt.changes:
+        times, values = w.transitions(opt.changes[0], int(opt.changes[1]), int(opt.changes[2]))
+        for t, v in zip(times, values):
+            print(f"{t:>16} {v}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())